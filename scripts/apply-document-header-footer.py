@@ -2,13 +2,44 @@
 """
 Script pour appliquer l'en-tête et le bas de page de convention par défaut
 à tous les documents markdown du projet.
+
+Usage :
+    python3 scripts/apply-document-header-footer.py [--incremental] [--jobs N] [--check] [--json]
+
+En mode incrémental, un manifeste (chemin, mtime, taille, empreinte SHA-256)
+permet d'ignorer sans les lire les fichiers inchangés depuis le dernier passage.
+Les fichiers sont traités en parallèle dans un pool de processus et réécrits
+de façon atomique (fichier temporaire puis renommage). Seuls le début et la
+fin d'un document sont lus en mémoire : le corps est recopié par blocs.
+
+--check n'écrit rien (ni documents, ni manifeste) et affiche un rapport JSON :
+fichiers à modifier, octets lus, durée de chaque phase et fichiers les plus
+lents. Le code de sortie vaut 1 si des documents ne sont pas conformes, 2 en
+cas d'erreur de lecture ; combiné à --incremental, seuls les fichiers modifiés
+depuis le dernier passage sont lus.
 """
 
+import argparse
+import codecs
+import hashlib
+import json
 import os
 import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+# Dossiers ignorés lors du parcours
+EXCLUDED_DIRS = {'node_modules', '.git', 'playwright-report', 'test-results'}
+
+# Manifeste du mode incrémental, relatif à la racine du projet
+DEFAULT_MANIFEST = '.doc-header-footer-manifest.json'
+MANIFEST_VERSION = 1
+
 # Format de l'en-tête (frontmatter YAML)
 HEADER_TEMPLATE = """---
 title: {title}
@@ -27,6 +58,17 @@ FOOTER_TEMPLATE = """
 © 2024 EDUZEN. Tous droits réservés.
 """
 
+# Fenêtres de lecture : début (frontmatter, titre) et fin (bas de page) du fichier
+HEAD_WINDOW = 64 * 1024
+TAIL_WINDOW = 8 * 1024
+COPY_CHUNK = 256 * 1024
+
+# Bas de page en fin de fichier, y compris collé au texte qui le précède
+FOOTER_PATTERN = re.compile(
+    r'---[ \t]*\n\s*\*\*Document EDUZEN\*\*[^\n]*Dernière mise à jour : (?P<date>\d{4}-\d{2}-\d{2})[ \t]*\n'
+    r'[ \t]*© 2024 EDUZEN\. Tous droits réservés\.\s*$'.encode('utf-8')
+)
+
 def extract_title(content):
     """Extrait le titre du document depuis le premier #"""
     lines = content.split('\n')
@@ -43,10 +85,6 @@ def has_frontmatter(content):
     """Vérifie si le document a déjà un frontmatter YAML"""
     return content.strip().startswith('---')
 
-def has_footer(content):
-    """Vérifie si le document a déjà un bas de page EDUZEN"""
-    return '**Document EDUZEN**' in content or '© 2024 EDUZEN' in content
-
 def get_readme_link(file_path, project_root):
     """Détermine le lien correct vers README.md selon l'emplacement du fichier"""
     relative_path = file_path.relative_to(project_root)
@@ -59,87 +97,325 @@ def get_readme_link(file_path, project_root):
         # Fichier dans un sous-dossier
         return "../" * depth + "README.md"
 
-def process_markdown_file(file_path, project_root):
-    """Traite un fichier markdown pour ajouter l'en-tête et le bas de page"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        print(f"Erreur lors de la lecture de {file_path}: {e}")
-        return False
+def find_footer(window):
+    """
+    Repère le bas de page EDUZEN en fin de fenêtre
+
+    Retourne la position du début du bas de page (et de ses éventuels doublons
+    consécutifs) et la date du dernier, ou (None, None) s'il n'y en a pas.
+    """
+    start = date = None
+    while True:
+        match = FOOTER_PATTERN.search(window, 0, start if start is not None else len(window))
+        if match is None:
+            return start, date
+        if date is None:
+            date = match.group('date').decode('ascii')
+        start = match.start()
+        # Doublons laissés par les anciennes versions du script : seul le dernier est gardé
+        while start > 0 and window[start - 1:start].isspace():
+            start -= 1
+
+def body_end_offset(f, end):
+    """Position de fin du contenu, espaces finaux exclus, en lisant le fichier à rebours"""
+    while end > 0:
+        start = max(0, end - TAIL_WINDOW)
+        f.seek(start)
+        stripped = f.read(end - start).rstrip()
+        if stripped:
+            return start + len(stripped)
+        end = start
+    return 0
+
+class ReadCounter:
+    """Fichier binaire ouvert en lecture qui compte les octets lus"""
+
+    def __init__(self, f):
+        self.f = f
+        self.count = 0
+
+    def read(self, size=-1):
+        data = self.f.read(size)
+        self.count += len(data)
+        return data
+
+    def seek(self, offset):
+        return self.f.seek(offset)
+
+def process_markdown_file(file_path, project_root, dry_run=False):
+    """
+    Traite un fichier markdown pour ajouter l'en-tête et le bas de page
+
+    Le fichier n'est jamais chargé en entier : le début (frontmatter, titre)
+    et la fin (bas de page) sont lus dans des fenêtres bornées, et le corps
+    est recopié tel quel par blocs. Un frontmatter existant est conservé et
+    un bas de page conforme n'est pas réécrit, même s'il est daté d'un jour
+    précédent.
 
-    original_content = content
+    En dry_run, rien n'est écrit : le résultat indique seulement si le
+    fichier serait modifié.
+
+    Retourne (modifié, empreinte SHA-256 du fichier écrit ou None, octets lus).
+    """
     date_str = datetime.now().strftime('%Y-%m-%d')
-    
-    # Extraire le titre
-    title = extract_title(content)
-    
-    # Nettoyer le contenu (enlever l'ancien frontmatter s'il existe)
-    if has_frontmatter(content):
-        # Extraire le frontmatter existant
-        match = re.match(r'^---\n(.*?)\n---\n', content, re.DOTALL)
-        if match:
-            content = content[match.end():]
-    
-    # Ajouter l'en-tête si nécessaire
-    if not has_frontmatter(original_content):
-        header = HEADER_TEMPLATE.format(title=title, date=date_str)
-        content = header + content
-    
-    # Ajouter ou mettre à jour le bas de page
     readme_link = get_readme_link(file_path, project_root)
-    footer = FOOTER_TEMPLATE.format(date=date_str, readme_link=readme_link)
-    
-    if has_footer(content):
-        # Remplacer l'ancien bas de page
-        # Chercher le dernier "---" suivi du bas de page
-        pattern = r'\n---\n\n\*\*Document EDUZEN\*\*.*?© 2024 EDUZEN\. Tous droits réservés\.\s*$'
-        if re.search(pattern, content, re.DOTALL):
-            content = re.sub(pattern, footer.strip(), content, flags=re.DOTALL)
-        else:
-            # Si le pattern ne correspond pas, ajouter le nouveau bas de page
-            content = content.rstrip() + footer
-    else:
-        # Ajouter le bas de page si nécessaire
-        content = content.rstrip() + footer
-    
-    # Écrire le fichier modifié
-    if content != original_content:
+
+    with open(file_path, 'rb') as raw:
+        size = os.fstat(raw.fileno()).st_size
+        f = ReadCounter(raw)
+        head = f.read(HEAD_WINDOW)
+        # Décodage incrémental : un caractère coupé en fin de fenêtre n'est pas une erreur
+        head_text = codecs.getincrementaldecoder('utf-8')().decode(head, final=len(head) == size)
+
+        header = b''
+        if not has_frontmatter(head_text):
+            header = HEADER_TEMPLATE.format(title=extract_title(head_text), date=date_str).encode('utf-8')
+
+        tail_start = max(0, size - TAIL_WINDOW)
+        f.seek(tail_start)
+        footer_start, footer_date = find_footer(f.read())
+        body_end = body_end_offset(f, size if footer_start is None else tail_start + footer_start)
+
+        if not header and footer_date is not None:
+            f.seek(body_end)
+            current = f.read()
+            if current == FOOTER_TEMPLATE.format(date=footer_date, readme_link=readme_link).encode('utf-8'):
+                return False, None, f.count
+
+        if dry_run:
+            return True, None, f.count
+
+        footer = FOOTER_TEMPLATE.format(date=date_str, readme_link=readme_link).encode('utf-8')
+        digest = hashlib.sha256()
+        with atomic_writer(file_path) as out:
+            def emit(chunk):
+                digest.update(chunk)
+                out.write(chunk)
+
+            # Document vide : l'en-tête est directement suivi du bas de page
+            emit(header if body_end else header.rstrip())
+            f.seek(0)
+            remaining = body_end
+            while remaining:
+                chunk = f.read(min(COPY_CHUNK, remaining))
+                if not chunk:
+                    raise OSError(f"{file_path} a été tronqué pendant le traitement")
+                emit(chunk)
+                remaining -= len(chunk)
+            emit(footer)
+    return True, digest.hexdigest(), f.count
+
+@contextmanager
+def atomic_writer(file_path):
+    """Fichier temporaire renommé en file_path à la sortie : jamais de document à moitié écrit"""
+    directory = os.path.dirname(file_path)
+    try:
+        mode = os.stat(file_path).st_mode & 0o7777
+    except FileNotFoundError:
+        # Nouveau fichier : droits par défaut (mkstemp crée en 0600)
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, file_path)
+    except BaseException:
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True
-        except Exception as e:
-            print(f"Erreur lors de l'écriture de {file_path}: {e}")
-            return False
-    
-    return False
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
 
-def main():
-    """Fonction principale"""
-    project_root = Path(__file__).parent.parent
+def write_atomic(file_path, data):
+    """Écrit le fichier de façon atomique"""
+    with atomic_writer(file_path) as f:
+        f.write(data)
+
+def file_digest(file_path):
+    """Empreinte SHA-256 du contenu d'un fichier"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def process_entry(task):
+    """
+    Traite un fichier dans un processus du pool
+
+    Retourne (chemin relatif, modifié, entrée de manifeste, durée en secondes,
+    octets lus). L'entrée vaut None en cas d'erreur ; sans with_digest,
+    l'empreinte n'est calculée que si elle sert à éviter un traitement.
+    """
+    file_path, project_root, previous_hash, dry_run, with_digest = task
+    relative = str(file_path.relative_to(project_root))
+    started = time.perf_counter()
+    scanned = 0
+    try:
+        # Fichier touché mais contenu identique au dernier passage : rien à faire
+        current_hash = None
+        if previous_hash is not None:
+            current_hash = file_digest(file_path)
+            scanned += os.path.getsize(file_path)
+        if current_hash is not None and current_hash == previous_hash:
+            modified = False
+        else:
+            modified, written_hash, read = process_markdown_file(file_path, project_root, dry_run)
+            scanned += read
+            if modified:
+                current_hash = written_hash
+        stat = os.stat(file_path)
+        if current_hash is None and with_digest:
+            current_hash = file_digest(file_path)
+            scanned += stat.st_size
+        entry = [stat.st_mtime_ns, stat.st_size, current_hash]
+        return relative, modified, entry, time.perf_counter() - started, scanned
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Erreur lors du traitement de {relative}: {e}", file=sys.stderr)
+        return relative, False, None, time.perf_counter() - started, scanned
+
+def find_markdown_files(project_root):
+    """Trouve tous les fichiers markdown (hors node_modules et .git)"""
     markdown_files = []
-    
-    # Trouver tous les fichiers markdown (hors node_modules et .git)
     for root, dirs, files in os.walk(project_root):
-        # Ignorer node_modules et .git
-        dirs[:] = [d for d in dirs if d not in ['node_modules', '.git', 'playwright-report', 'test-results']]
-        
+        dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
         for file in files:
             if file.endswith('.md'):
-                file_path = Path(root) / file
-                markdown_files.append(file_path)
-    
-    print(f"Traitement de {len(markdown_files)} fichiers markdown...")
-    
-    modified_count = 0
+                markdown_files.append(Path(root) / file)
+    return markdown_files
+
+def load_manifest(manifest_path):
+    """Charge le manifeste ; un manifeste absent ou illisible est ignoré"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    return manifest.get('files', {})
+
+def save_manifest(manifest_path, files):
+    data = json.dumps({'version': MANIFEST_VERSION, 'files': files}, indent=0, sort_keys=True)
+    write_atomic(manifest_path, data.encode('utf-8'))
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Applique l'en-tête et le bas de page EDUZEN aux documents markdown")
+    parser.add_argument('--incremental', action='store_true',
+                        help='Ignorer les fichiers inchangés depuis le dernier passage (manifeste)')
+    parser.add_argument('--manifest', help=f'Chemin du manifeste (défaut : {DEFAULT_MANIFEST} à la racine)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Nombre de processus (défaut : nombre de CPU)')
+    parser.add_argument('--check', action='store_true',
+                        help="Ne rien écrire : rapport JSON des fichiers à modifier, code de sortie 1 s'il y en a")
+    parser.add_argument('--json', action='store_true',
+                        help='Afficher le rapport JSON au lieu du résumé texte')
+    parser.add_argument('--slowest', type=int, default=10,
+                        help='Nombre de fichiers les plus lents dans le rapport (défaut : 10)')
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error('--jobs doit être au moins 1')
+    return args
+
+def build_report(args, total, skipped, changed, errors, durations, scanned, timings):
+    """Rapport JSON d'un passage"""
+    slowest = sorted(durations, key=lambda item: item[1], reverse=True)[:max(0, args.slowest)]
+    return {
+        'mode': 'check' if args.check else 'write',
+        'incremental': args.incremental,
+        'counts': {
+            'total': total,
+            'skipped': skipped,
+            'processed': total - skipped,
+            'changed': len(changed),
+            'errors': len(errors),
+        },
+        'bytes_scanned': scanned,
+        'timings': {phase: round(seconds, 6) for phase, seconds in timings.items()},
+        'changed': sorted(changed),
+        'errors': sorted(errors),
+        'slowest': [
+            {'path': relative, 'seconds': round(seconds, 6), 'bytes': size}
+            for relative, seconds, size in slowest
+        ],
+    }
+
+def main():
+    """Fonction principale"""
+    args = parse_args()
+    report_json = args.json or args.check
+    project_root = Path(__file__).resolve().parent.parent
+    manifest_path = Path(args.manifest) if args.manifest else project_root / DEFAULT_MANIFEST
+    manifest = load_manifest(manifest_path) if args.incremental else {}
+    # Le mode vérification n'écrit rien, pas même le manifeste
+    save = args.incremental and not args.check
+    timings = {}
+
+    started = time.perf_counter()
+    markdown_files = find_markdown_files(project_root)
+    timings['walk'] = time.perf_counter() - started
+    if not report_json:
+        print(f"Traitement de {len(markdown_files)} fichiers markdown...")
+
+    # Un fichier dont la mtime et la taille n'ont pas bougé n'est même pas lu
+    started = time.perf_counter()
+    tasks = []
+    entries = {}
     for file_path in markdown_files:
-        if process_markdown_file(file_path, project_root):
-            modified_count += 1
-            print(f"✓ Modifié : {file_path.relative_to(project_root)}")
-    
-    print(f"\n✓ {modified_count} fichiers modifiés sur {len(markdown_files)} fichiers traités.")
+        relative = str(file_path.relative_to(project_root))
+        previous = manifest.get(relative)
+        if previous is not None:
+            stat = os.stat(file_path)
+            if [stat.st_mtime_ns, stat.st_size] == previous[:2]:
+                entries[relative] = previous
+                continue
+        tasks.append((file_path, project_root, previous[2] if previous else None, args.check, save))
+    timings['stat'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    changed = []
+    errors = []
+    durations = []
+    scanned = 0
+    if tasks:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            chunksize = max(1, len(tasks) // (args.jobs * 8))
+            results = pool.map(process_entry, tasks, chunksize=chunksize)
+            for relative, modified, entry, seconds, read in results:
+                scanned += read
+                durations.append((relative, seconds, read))
+                if entry is not None:
+                    entries[relative] = entry
+                else:
+                    errors.append(relative)
+                if modified:
+                    changed.append(relative)
+                    if not report_json:
+                        print(f"✓ Modifié : {relative}")
+    timings['process'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    if save:
+        save_manifest(manifest_path, entries)
+    timings['manifest'] = time.perf_counter() - started
+
+    skipped = len(markdown_files) - len(tasks)
+    if report_json:
+        report = build_report(args, len(markdown_files), skipped, changed, errors, durations, scanned, timings)
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print(f"\n✓ {len(changed)} fichiers modifiés sur {len(markdown_files)} fichiers traités"
+              f" ({skipped} inchangés ignorés).")
+
+    if errors:
+        sys.exit(2)
+    if args.check and changed:
+        sys.exit(1)
 
 if __name__ == '__main__':
     main()
-
@@ -0,0 +1,319 @@
+"""
+EDUZEN Python SDK benchmarks
+
+Drives the client against the local stand-in API (benchmarks/server.py) and
+reports throughput, latency percentiles, CPU time per request and peak RSS.
+Each scenario runs in a fresh process against a fresh server process, so CPU
+and memory figures belong to the client alone and do not leak between
+scenarios.
+
+Usage:
+    python benchmarks/run.py
+    python benchmarks/run.py --scenario students --concurrency 32 --requests 5000
+    python benchmarks/run.py --client async --json results.json
+    python benchmarks/run.py --baseline results.json --max-regression 0.15
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from eduzen import AsyncEDUZENClient, EDUZENClient, __version__  # noqa: E402
+from eduzen.codec import get_codec  # noqa: E402
+from eduzen.retry import RetryPolicy  # noqa: E402
+
+from server import FakeAPIServer  # noqa: E402
+
+# Server settings per scenario; every scenario gets its own server process
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "sessions": {},
+    "students": {"students": 10000},
+    "throttled": {"throttle_every": 10, "retry_after": 0.01},
+    "slow": {"slow_delay": 0.05},
+    "zip": {"document_size": 32 * 1024},
+}
+
+PAGE_SIZE = 100
+ZIP_ITEMS = 50
+
+# Relative change beyond which a metric counts as a regression, and its direction
+COMPARED = {"rps": "higher", "p95_ms": "lower", "cpu_ms_per_request": "lower", "peak_rss_mb": "lower"}
+
+
+def serve(settings: Dict[str, Any], ready: Any) -> None:
+    server = FakeAPIServer(**settings)
+    ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+def operation(client: Any, scenario: str, workdir: str) -> Callable[[int], Any]:
+    """The call a scenario repeats, given the operation index"""
+    if scenario == "sessions" or scenario == "throttled":
+        return lambda i: client.get_active_sessions()
+    if scenario == "students":
+        pages = SCENARIOS["students"]["students"] // PAGE_SIZE
+        return lambda i: client.get_students("org-bench", page=i % pages + 1, limit=PAGE_SIZE)
+    if scenario == "slow":
+        return lambda i: client.check_compliance_alerts()
+    if scenario == "zip":
+        items = [{"student_id": f"student-{n}"} for n in range(ZIP_ITEMS)]
+        return lambda i: client.generate_documents_batch(
+            "template-bench", items, os.path.join(workdir, f"batch-{i}.zip")
+        )
+    raise ValueError(f"Unknown scenario: {scenario}")
+
+
+def run_sync(base_url: str, args: argparse.Namespace, workdir: str) -> List[float]:
+    client = EDUZENClient(
+        base_url=base_url,
+        api_key="bench-key",
+        pool_connections=1,
+        pool_maxsize=args.concurrency,
+        retry_policy=RetryPolicy(max_attempts=1),
+        rate_limit_retries=1000,
+        coalesce_requests=args.coalesce,
+        codec=get_codec(args.codec),
+        models=args.models,
+    )
+    call = operation(client, args.scenario, workdir)
+    for i in range(args.warmup):
+        call(i)
+
+    counter = itertools.count()
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def worker() -> None:
+        local = []
+        while True:
+            i = next(counter)
+            if i >= args.requests:
+                break
+            started = time.perf_counter()
+            call(i)
+            local.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=worker) for _ in range(args.concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    client.close()
+    return latencies
+
+
+def run_async(base_url: str, args: argparse.Namespace, workdir: str) -> List[float]:
+    async def main() -> List[float]:
+        async with AsyncEDUZENClient(
+            base_url=base_url,
+            api_key="bench-key",
+            pool_maxsize=args.concurrency,
+            max_concurrency=args.concurrency,
+            retry_policy=RetryPolicy(max_attempts=1),
+            rate_limit_retries=1000,
+            coalesce_requests=args.coalesce,
+            codec=get_codec(args.codec),
+            models=args.models,
+        ) as client:
+            call = operation(client, args.scenario, workdir)
+            for i in range(args.warmup):
+                await call(i)
+
+            counter = itertools.count()
+            latencies: List[float] = []
+
+            async def worker() -> None:
+                while True:
+                    i = next(counter)
+                    if i >= args.requests:
+                        break
+                    started = time.perf_counter()
+                    await call(i)
+                    latencies.append(time.perf_counter() - started)
+
+            await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+            return latencies
+
+    return asyncio.run(main())
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, int(round(q * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure(base_url: str, args: argparse.Namespace, results: Any) -> None:
+    """Run one scenario in this (fresh) process and report its figures"""
+    runner = run_async if args.client == "async" else run_sync
+    with tempfile.TemporaryDirectory() as workdir:
+        cpu = time.process_time()
+        wall = time.perf_counter()
+        latencies = runner(base_url, args, workdir)
+        wall = time.perf_counter() - wall
+        cpu = time.process_time() - cpu
+
+    latencies.sort()
+    count = len(latencies)
+    results.put(
+        {
+            "requests": count,
+            "duration_s": round(wall, 4),
+            "rps": round(count / wall, 1),
+            "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+            "p90_ms": round(percentile(latencies, 0.90) * 1000, 3),
+            "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+            "max_ms": round(latencies[-1] * 1000, 3),
+            "mean_ms": round(sum(latencies) / count * 1000, 3),
+            "cpu_ms_per_request": round(cpu / count * 1000, 4),
+            "peak_rss_mb": round(peak_rss_mb(), 2),
+        }
+    )
+
+
+def run_scenario(args: argparse.Namespace) -> Dict[str, Any]:
+    context = multiprocessing.get_context("spawn")
+    ready = context.Queue()
+    server = context.Process(target=serve, args=(SCENARIOS[args.scenario], ready), daemon=True)
+    server.start()
+    try:
+        base_url = f"http://127.0.0.1:{ready.get(timeout=30)}"
+        results = context.Queue()
+        worker = context.Process(target=measure, args=(base_url, args, results))
+        worker.start()
+        result = results.get()
+        worker.join()
+
+        stats = EDUZENClient(base_url=base_url, coalesce_requests=False).request("GET", "/__stats")
+        # Connections opened by the client; reuse keeps this near --concurrency
+        result["server"] = {k: stats[k] for k in ("connections", "requests", "throttled")}
+        return result
+    finally:
+        server.terminate()
+        server.join()
+
+
+def git_commit() -> Optional[str]:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=HERE, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+    """Metrics that regressed by more than ``max_regression`` against a baseline report"""
+    previous = {(r["scenario"], r["client"], r["concurrency"]): r for r in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        base = previous.get((result["scenario"], result["client"], result["concurrency"]))
+        if base is None:
+            continue
+        for metric, better in COMPARED.items():
+            old, new = base[metric], result[metric]
+            if not old:
+                continue
+            change = (new - old) / old
+            if (better == "higher" and change < -max_regression) or (better == "lower" and change > max_regression):
+                regressions.append(f"{result['scenario']}/{result['client']}: {metric} {old} -> {new} ({change:+.1%})")
+    return regressions
+
+
+def print_table(report: Dict[str, Any]) -> None:
+    columns = (
+        "scenario",
+        "client",
+        "concurrency",
+        "rps",
+        "p50_ms",
+        "p95_ms",
+        "p99_ms",
+        "cpu_ms_per_request",
+        "peak_rss_mb",
+    )
+    print("  ".join(f"{c:>12}" for c in columns) + f"  {'connections':>12}", file=sys.stderr)
+    for result in report["results"]:
+        row = "  ".join(f"{result[c]!s:>12}" for c in columns)
+        print(f"{row}  {result['server']['connections']:>12}", file=sys.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="EDUZEN Python SDK benchmarks")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Repeatable (default: all)")
+    parser.add_argument("--client", choices=("sync", "async"), default="sync")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--codec", choices=("json", "ujson", "orjson"), default=None)
+    parser.add_argument("--models", action="store_true", help="Return typed models instead of dicts")
+    parser.add_argument("--coalesce", action="store_true", help="Enable in-flight GET coalescing")
+    parser.add_argument("--json", metavar="PATH", help="Write the report as JSON ('-' for stdout)")
+    parser.add_argument("--baseline", metavar="PATH", help="Exit non-zero on regressions against this report")
+    parser.add_argument("--max-regression", type=float, default=0.15)
+    args = parser.parse_args()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": git_commit(),
+            "sdk_version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "codec": get_codec(args.codec).name,
+            "models": args.models,
+        },
+        "results": [],
+    }
+    for scenario in args.scenario or sorted(SCENARIOS):
+        requests = args.requests // 10 if scenario in ("slow", "zip") else args.requests
+        scenario_args = argparse.Namespace(**{**vars(args), "scenario": scenario, "requests": requests})
+        result = run_scenario(scenario_args)
+        report["results"].append(
+            {"scenario": scenario, "client": args.client, "concurrency": args.concurrency, **result}
+        )
+
+    print_table(report)
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as fh:
+            regressions = compare(report, json.load(fh), args.max_regression)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""
+Local stand-in for the EDUZEN API, used by the benchmarks
+
+Serves the endpoints the benchmark scenarios call, over HTTP/1.1 keep-alive:
+
+- ``GET /v1/students``: deterministic paginated students (``page``, ``limit``)
+- ``GET /sessions/active``: small JSON document
+- ``POST /compliance/alerts/check``: answers after ``--slow-delay`` seconds
+- ``POST /documents/generate-batch``: ZIP archive with one member per item
+- ``GET /__stats``: connections accepted and requests served, for the harness
+
+Every ``--throttle-every``-th API request is answered with a 429 and a
+``Retry-After`` header, like the production rate limiter.
+
+Usage:
+    python benchmarks/server.py --port 8765
+"""
+
+import argparse
+import io
+import json
+import threading
+import time
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+
+def make_student(index: int) -> Dict[str, Any]:
+    """A student record shaped like the /v1/students payload"""
+    return {
+        "id": f"student-{index:08d}",
+        "first_name": f"Prénom{index}",
+        "last_name": f"Nom{index}",
+        "email": f"student{index}@example.com",
+        "phone": f"+33600{index % 1000000:06d}",
+        "student_number": f"STU-{index:08d}",
+        "status": "active" if index % 7 else "inactive",
+        "organization_id": "org-bench",
+        "class_id": f"class-{index % 40:03d}",
+        "enrollment_date": "2025-09-01",
+        "created_at": "2025-09-01T08:00:00Z",
+        "updated_at": "2026-01-15T10:30:00Z",
+        "metadata": {"source": "benchmark", "tags": ["bench", f"group-{index % 10}"]},
+    }
+
+
+class FakeAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY the
+    # second one waits for a delayed ACK and every response takes ~40 ms
+    disable_nagle_algorithm = True
+    server: "FakeAPIServer"
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.count("connections")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        body = self._read_body()
+
+        if url.path == "/__stats":
+            self._send_json(200, self.server.snapshot())
+            return
+
+        if self.server.throttled():
+            self._send_json(
+                429,
+                {"message": "Too many requests", "code": "RATE_LIMITED"},
+                {"Retry-After": str(self.server.retry_after)},
+            )
+            return
+
+        route = (method, url.path)
+        if route == ("GET", "/v1/students"):
+            self._students(parse_qs(url.query))
+        elif route == ("GET", "/sessions/active"):
+            self._send_json(200, {"sessions": [{"id": "session-1", "user_id": "user-1", "active": True}]})
+        elif route == ("POST", "/compliance/alerts/check"):
+            time.sleep(self.server.slow_delay)
+            self._send_json(200, {"alerts": [], "checked": True})
+        elif route == ("POST", "/documents/generate-batch"):
+            self._generate_batch(body)
+        else:
+            self._send_json(404, {"message": f"Unknown endpoint {method} {url.path}", "code": "NOT_FOUND"})
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _students(self, query: Dict[str, Any]) -> None:
+        page = int(query.get("page", ["1"])[0])
+        limit = int(query.get("limit", ["50"])[0])
+        total = self.server.students
+        start = (page - 1) * limit
+        data = [make_student(i) for i in range(start, min(start + limit, total))]
+        self._send_json(200, {"data": data, "meta": {"page": page, "limit": limit, "total": total}})
+
+    def _generate_batch(self, body: bytes) -> None:
+        items = json.loads(body or b"{}").get("items", [])
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+            for index, item in enumerate(items):
+                content = (json.dumps(item).encode() + b"\n") * (self.server.document_size // 64 + 1)
+                archive.writestr(f"document-{index:05d}.pdf", content[: self.server.document_size])
+        self._send(200, buffer.getvalue(), "application/zip")
+
+    def _send_json(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        self._send(status, json.dumps(payload).encode(), "application/json", headers)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Request-Id", f"bench-{self.server.count('requests')}")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeAPIServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(
+        self,
+        address: Tuple[str, int] = ("127.0.0.1", 0),
+        students: int = 10000,
+        slow_delay: float = 0.05,
+        throttle_every: int = 0,
+        retry_after: float = 0.05,
+        document_size: int = 32 * 1024,
+    ):
+        super().__init__(address, FakeAPIHandler)
+        self.students = students
+        self.slow_delay = slow_delay
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.document_size = document_size
+        self._lock = threading.Lock()
+        self._counters = {"connections": 0, "requests": 0, "throttled": 0}
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, name: str) -> int:
+        with self._lock:
+            self._counters[name] += 1
+            return self._counters[name]
+
+    def throttled(self) -> bool:
+        if not self.throttle_every:
+            return False
+        with self._lock:
+            if (self._counters["requests"] + 1) % self.throttle_every:
+                return False
+            self._counters["throttled"] += 1
+            return True
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    def start(self) -> "FakeAPIServer":
+        """Serve from a daemon thread"""
+        threading.Thread(target=self.serve_forever, name="fake-eduzen-api", daemon=True).start()
+        return self
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in EDUZEN API for benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--students", type=int, default=10000)
+    parser.add_argument("--slow-delay", type=float, default=0.05)
+    parser.add_argument("--throttle-every", type=int, default=0)
+    parser.add_argument("--retry-after", type=float, default=0.05)
+    parser.add_argument("--document-size", type=int, default=32 * 1024)
+    args = parser.parse_args()
+
+    server = FakeAPIServer(
+        (args.host, args.port),
+        students=args.students,
+        slow_delay=args.slow_delay,
+        throttle_every=args.throttle_every,
+        retry_after=args.retry_after,
+        document_size=args.document_size,
+    )
+    print(f"Fake EDUZEN API listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
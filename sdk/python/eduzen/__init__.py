@@ -1,20 +1,53 @@
 """
 EDUZEN API SDK - Python
+
+Public names are imported on first access (PEP 562), so ``import eduzen``
+does not load requests, aiohttp or the codecs until a client is used.
 """
 
+from typing import TYPE_CHECKING, Any, List
+
 __version__ = "1.0.0"
 
-from .client import EDUZENClient
-from .exceptions import EDUZENError, EDUZENAPIError, EDUZENNetworkError
+# Public name -> submodule defining it
+_LAZY = {
+    "EDUZENClient": "client",
+    "AsyncEDUZENClient": "async_client",
+    "BulkResult": "bulk",
+    "EDUZENError": "exceptions",
+    "EDUZENAPIError": "exceptions",
+    "EDUZENNetworkError": "exceptions",
+    "EDUZENTimeoutError": "exceptions",
+}
 
 __all__ = [
     "EDUZENClient",
+    "AsyncEDUZENClient",
+    "BulkResult",
     "EDUZENError",
     "EDUZENAPIError",
     "EDUZENNetworkError",
+    "EDUZENTimeoutError",
 ]
 
+if TYPE_CHECKING:
+    from .async_client import AsyncEDUZENClient
+    from .bulk import BulkResult
+    from .client import EDUZENClient
+    from .exceptions import EDUZENAPIError, EDUZENError, EDUZENNetworkError, EDUZENTimeoutError
+
 
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
 
+    value = getattr(import_module(f".{module}", __name__), name)
+    # Cache on the package: later lookups no longer go through __getattr__
+    globals()[name] = value
+    return value
 
 
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
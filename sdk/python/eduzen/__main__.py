@@ -0,0 +1,84 @@
+"""
+EDUZEN command line
+
+Usage:
+    python -m eduzen export students --organization-id org-123 --output students.csv.gz
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from .exceptions import EDUZENError
+from .export import DEFAULT_BUFFER_SIZE, FORMATS, export_students, infer_format
+
+
+def _export_students(args: argparse.Namespace) -> int:
+    api_key = args.api_key or os.environ.get("EDUZEN_API_KEY")
+    if not api_key:
+        print("error: pass --api-key or set EDUZEN_API_KEY", file=sys.stderr)
+        return 2
+
+    # Imported here so that --help and argument errors do not load the HTTP stack
+    from .client import EDUZENClient
+
+    compress = args.gzip or args.output.lower().endswith(".gz")
+    with EDUZENClient(
+        base_url=args.base_url,
+        api_key=api_key,
+        access_token=os.environ.get("EDUZEN_ACCESS_TOKEN"),
+    ) as client:
+        result = export_students(
+            client,
+            args.organization_id,
+            args.output,
+            format=args.format or infer_format(args.output),
+            compress=compress,
+            columns=args.columns.split(",") if args.columns else None,
+            search=args.search,
+            page_size=args.page_size,
+            buffer_size=args.buffer_size,
+            checkpoint_every=args.checkpoint_every,
+            resume=not args.restart,
+        )
+
+    resumed = f", resumed after page {result.resumed_from_page}" if result.resumed_from_page else ""
+    print(
+        f"Exported {result.rows} students to {result.path} ({result.bytes_written} bytes{resumed})",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m eduzen", description="EDUZEN API command line")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Export records to a file")
+    exports = export.add_subparsers(dest="resource", required=True)
+    students = exports.add_parser("students", help="Stream an organization's students to CSV, JSON Lines or Parquet")
+    students.add_argument("--organization-id", required=True)
+    students.add_argument("--output", "-o", required=True, help="Output file (directory for Parquet)")
+    students.add_argument("--format", choices=FORMATS, help="Default: from the output name, else csv")
+    students.add_argument("--gzip", action="store_true", help="Compress (implied by a .gz output name)")
+    students.add_argument("--columns", help="Comma-separated CSV/Parquet columns")
+    students.add_argument("--search")
+    students.add_argument("--page-size", type=int, default=500)
+    students.add_argument("--buffer-size", type=int, default=DEFAULT_BUFFER_SIZE)
+    students.add_argument("--checkpoint-every", type=int, default=10, help="Pages between checkpoints")
+    students.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint")
+    students.add_argument("--base-url", default=os.environ.get("EDUZEN_BASE_URL", "https://app.eduzen.com/api"))
+    students.add_argument("--api-key", help="Default: EDUZEN_API_KEY")
+    students.set_defaults(handler=_export_students)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.handler(args)
+    except (EDUZENError, ValueError, ImportError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""
+EDUZEN generated document store
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, BinaryIO, Dict, Iterator, Mapping, NamedTuple, Optional
+
+# Temporary files older than this are leftovers of a crashed writer
+STALE_TEMP_SECONDS = 3600.0
+
+_TEMP_PREFIX = ".tmp-"
+
+
+def _canonical(value: Any) -> Any:
+    """JSON form of the variable types json does not encode itself"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    raise TypeError(f"Cannot canonicalise {type(value).__name__} variable")
+
+
+class Artifact(NamedTuple):
+    """A document held in the store"""
+
+    key: str
+    path: str
+    size: int
+
+    def open(self) -> mmap.mmap:
+        """
+        Map the document read-only
+
+        The pages are shared with the OS page cache: serving the same file
+        repeatedly copies nothing into the process. Close the map (or use it
+        as a context manager) when done.
+        """
+        with open(self.path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read(self) -> bytes:
+        """Document content"""
+        with self.open() as mapped:
+            return mapped[:]
+
+
+class ArtifactStore:
+    """
+    Opt-in on-disk store of generated documents, addressed by content
+
+    A document is identified by a hash of what determines its bytes: the
+    template, the template version, the format and the variables. The same
+    request always maps to the same file, so resends and reprints are served
+    from disk without calling the API.
+
+    Files are written to a temporary name and renamed into place, so readers
+    and other processes sharing the directory never see a partial document.
+    The least recently used documents are removed once the store exceeds
+    ``max_bytes``; each process enforces the bound on the documents it wrote
+    or found when it opened the store.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 1024**3):
+        """
+        Args:
+            directory: Directory holding the documents (created if missing)
+            max_bytes: Total size kept before LRU eviction (default: 1 GiB)
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # key -> size, least recently used first
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    @staticmethod
+    def key(
+        template_id: str,
+        template_version: Any,
+        format: str,
+        variables: Optional[Mapping[str, Any]] = None,
+    ) -> str:
+        """
+        Content address of a document
+
+        Variables are serialised with sorted keys, so the key does not depend
+        on their insertion order; dates and decimals are written in their
+        ISO and exact decimal forms.
+        """
+        raw = json.dumps(
+            [template_id, str(template_version), format.lower(), variables or {}],
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=_canonical,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> str:
+        """File of a document, whether or not it is stored"""
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key: str) -> Optional[Artifact]:
+        """Stored document, marked as recently used, or None"""
+        path = self.path(key)
+        try:
+            size = os.stat(path).st_size
+            # The modification time orders documents for eviction across runs
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._forget(key)
+            return None
+        with self._lock:
+            self._remember(key, size)
+        return Artifact(key, path, size)
+
+    @contextmanager
+    def writer(self, key: str) -> Iterator[BinaryIO]:
+        """
+        Write a document atomically
+
+        The file becomes visible under its key only when the block completes
+        without error; an empty document is discarded.
+
+        Usage:
+            with store.writer(key) as f:
+                for chunk in chunks:
+                    f.write(chunk)
+        """
+        path = self.path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yield f
+                size = f.tell()
+                # Data on disk before the rename: a crash never leaves a truncated entry under its key
+                f.flush()
+                os.fsync(f.fileno())
+            if size == 0:
+                raise ValueError(f"Empty document for {key}")
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        with self._lock:
+            self._remember(key, size)
+            self._evict()
+
+    def put(self, key: str, data: bytes) -> Artifact:
+        """Store a document"""
+        with self.writer(key) as f:
+            f.write(data)
+        return Artifact(key, self.path(key), len(data))
+
+    def discard(self, key: str) -> bool:
+        """Remove a document; False when it was not stored"""
+        with self._lock:
+            self._forget(key)
+        try:
+            os.unlink(self.path(key))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def clear(self) -> None:
+        """Remove every document"""
+        with self._lock:
+            keys = list(self._entries)
+        for key in keys:
+            self.discard(key)
+
+    def record(self, outcome: str) -> None:
+        """Count a hit or a miss"""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit and miss counters, documents and bytes stored"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "bytes": self._bytes}
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self.path(key))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ========== INDEX ==========
+
+    def _load(self) -> None:
+        """Index the documents already on disk, oldest first"""
+        found = []
+        now = time.time()
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir() or len(shard.name) != 2:
+                continue
+            for entry in os.scandir(shard.path):
+                stat = entry.stat()
+                if entry.name.startswith(_TEMP_PREFIX):
+                    if now - stat.st_mtime > STALE_TEMP_SECONDS:
+                        try:
+                            os.unlink(entry.path)
+                        except FileNotFoundError:
+                            pass
+                    continue
+                found.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, key, size in sorted(found):
+            self._remember(key, size)
+        self._evict()
+
+    def _remember(self, key: str, size: int) -> None:
+        self._bytes += size - self._entries.get(key, 0)
+        self._entries[key] = size
+        self._entries.move_to_end(key)
+
+    def _forget(self, key: str) -> None:
+        self._bytes -= self._entries.pop(key, 0)
+
+    def _evict(self) -> None:
+        # Keep the most recent document even when it alone exceeds the bound
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._bytes -= size
+            try:
+                os.unlink(self.path(key))
+            except FileNotFoundError:
+                pass
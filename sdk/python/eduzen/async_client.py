@@ -0,0 +1,602 @@
+"""
+EDUZEN API asyncio Client for Python
+"""
+
+import asyncio
+import os
+import tempfile
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, AsyncIterator, Iterable, BinaryIO, Tuple, Type, Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .bulk import BulkResult, abulk_map
+from .codec import JSONCodec, get_codec
+from .documents import DEFAULT_CHUNK_SIZE, BatchDocument, batch_payload, iter_zip_members
+from .endpoints import EDUZENEndpoints
+from .exceptions import EDUZENError, EDUZENAPIError, EDUZENNetworkError
+from .metrics import Hooks, RequestEvent
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import AsyncSingleFlight
+
+if TYPE_CHECKING:
+    # Optional subsystems, imported where used so a plain client never loads them
+    from .artifacts import Artifact, ArtifactStore
+    from .deadline import HedgePolicy
+    from .models import Model
+
+
+class AsyncEDUZENClient(EDUZENEndpoints):
+    """asyncio client for EDUZEN API (same methods as EDUZENClient, awaitable)"""
+
+    def __init__(
+        self,
+        base_url: str = "https://app.eduzen.com/api",
+        api_key: Optional[str] = None,
+        access_token: Optional[str] = None,
+        timeout: int = 30,
+        pool_maxsize: int = 100,
+        max_concurrency: int = 100,
+        keepalive_timeout: float = 15.0,
+        session: Optional["aiohttp.ClientSession"] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        rate_limit_retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        coalesce_requests: bool = True,
+        codec: Optional[JSONCodec] = None,
+        models: bool = False,
+        deadlines: Optional[Dict[str, float]] = None,
+        hedge_policy: Optional["HedgePolicy"] = None,
+        document_store: Optional["ArtifactStore"] = None,
+    ):
+        """
+        Initialize async EDUZEN client
+
+        Args:
+            base_url: Base URL for API (default: https://app.eduzen.com/api)
+            api_key: API key for authentication
+            access_token: Access token for authentication
+            timeout: Request timeout in seconds (default: 30)
+            pool_maxsize: Maximum keep-alive connections per host (default: 100)
+            max_concurrency: Maximum in-flight requests for this client (default: 100)
+            keepalive_timeout: Seconds an idle pooled connection is kept open (default: 15)
+            session: Existing aiohttp.ClientSession to share; it is not closed by the client
+            rate_limiter: RateLimiter to share between clients using the same API key
+            rate_limit_retries: Times a 429 response is retried after Retry-After (default: 3)
+            retry_policy: Retry policy for transient failures (default: RetryPolicy())
+            coalesce_requests: Share one in-flight GET between identical concurrent
+                calls; waiters receive the same result object (default: True)
+            codec: JSON codec (default: fastest installed of orjson, ujson, json)
+            models: Return records as compact models (Student, User, Session,
+                QRCode, PaymentIntent) instead of plain dicts (default: False)
+            deadlines: Seconds allowed per endpoint template, rate-limit waits,
+                connection, response and retries included, e.g.
+                ``{"/qr-attendance/scan": 2.0}`` (default: only ``timeout`` per attempt)
+            hedge_policy: Opt-in HedgePolicy sending a second attempt for GETs
+                slower than their observed p95 (default: no hedging)
+            document_store: Opt-in ArtifactStore serving fetch_document from
+                disk for documents already generated (default: none)
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncEDUZENClient requires aiohttp: pip install eduzen-sdk[async]"
+            )
+
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.access_token = access_token
+        self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self.max_concurrency = max_concurrency
+        self.keepalive_timeout = keepalive_timeout
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.rate_limit_retries = rate_limit_retries
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._singleflight = AsyncSingleFlight() if coalesce_requests else None
+        self.codec = codec or get_codec()
+        self.hooks = Hooks()
+        self.models = models
+        self.deadlines = dict(deadlines or {})
+        self.hedge_policy = hedge_policy
+        self.document_store = document_store
+
+        self._session = session
+        self._owns_session = session is None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    # ========== TRANSPORT ==========
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """Pooled keep-alive session, created on first use inside the event loop"""
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+
+    def _timeout(self, budget: Optional[float] = None) -> "aiohttp.ClientTimeout":
+        """
+        ``timeout`` per connect and per read, as in EDUZENClient
+
+        A long streamed body is not cut off as long as data keeps arriving;
+        only a deadline ``budget`` bounds the request as a whole.
+        """
+        limit = self.timeout if budget is None else min(self.timeout, budget)
+        return aiohttp.ClientTimeout(total=budget, sock_connect=limit, sock_read=limit)
+
+    def _create_session(self) -> "aiohttp.ClientSession":
+        """Create a session with a bounded keep-alive connection pool"""
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=self.pool_maxsize,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=self._timeout(),
+            # Authentication is sent explicitly on every request
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Limiter bounding the number of in-flight requests"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def close(self) -> None:
+        """Close pooled connections (a shared session passed in is left open)"""
+        if not self._owns_session:
+            return
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
+
+    async def __aenter__(self) -> "AsyncEDUZENClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Union[Dict[str, Any], bytes]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        stream: bool = False,
+        endpoint: Optional[str] = None,
+        model: Optional[Tuple[Union[str, Type["Model"]], Optional[str]]] = None,
+        deadline: Optional[float] = None,
+    ) -> Any:
+        """
+        Make API request
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path
+            data: Request body data, or pre-encoded JSON bytes
+            params: Query parameters
+            idempotency_key: Idempotency-Key header, makes a mutating call retryable
+            stream: Return the successful aiohttp.ClientResponse unread instead
+                of decoding JSON; the caller must release it
+            endpoint: Path template reported to hooks, e.g. "/sessions/{id}" (default: path)
+            model: (model class or its name in eduzen.models, response key)
+                to wrap the records in when the client was created with
+                ``models=True``
+            deadline: Seconds allowed for the call, retries included (default:
+                the endpoint's entry in ``deadlines``, if any)
+
+        Returns:
+            Response data
+
+        Raises:
+            EDUZENAPIError: API error
+            EDUZENTimeoutError: Deadline exceeded
+            EDUZENNetworkError: Network error
+        """
+        event = RequestEvent(method.upper(), endpoint or path, path)
+        event.deadline = self._call_deadline(event.endpoint, deadline)
+        if self.hooks:
+            self.hooks.emit("before_request", event)
+
+        try:
+            if stream or method.upper() != "GET":
+                result = await self._fetch(method, path, data, params, idempotency_key, stream, event)
+            elif self._singleflight is None:
+                result = await self._fetch_get(path, params, event)
+            else:
+                key = self._request_key(path, params)
+                result = await self._singleflight.do(
+                    key, lambda: self._fetch_get(path, params, event), event.mark_coalesced, event.deadline
+                )
+        except EDUZENError as e:
+            event.finish()
+            event.error = e
+            e.request_id = event.request_id
+            e.elapsed = event.timings["total"]
+            if self.hooks:
+                self.hooks.emit("on_error", event)
+            raise
+
+        event.finish()
+        if self.hooks:
+            self.hooks.emit("after_response", event)
+        if model is not None and self.models:
+            from .models import wrap
+
+            return wrap(result, *model)
+        return result
+
+    async def _fetch_get(self, path: str, params: Optional[Dict[str, Any]], event: RequestEvent) -> Any:
+        """
+        GET and decode, hedged when the hedge policy covers the endpoint
+
+        Once the first attempt has been running for the endpoint's observed
+        p95, a second one is sent; the first to answer wins and the other is
+        cancelled.
+        """
+        policy = self.hedge_policy
+        if policy is None or not policy.applies(event.endpoint):
+            return await self._fetch("GET", path, None, params, event=event)
+        delay = policy.delay(event.endpoint)
+        if delay is None:
+            return await self._timed_fetch(path, params, event)
+
+        first = event.attempt()
+        primary = asyncio.ensure_future(self._timed_fetch(path, params, first))
+        attempts = {primary: first}
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not policy.acquire():
+                try:
+                    return await primary
+                finally:
+                    event.adopt(first)
+
+            event.hedged = True
+            second = event.attempt()
+            hedge = asyncio.ensure_future(self._timed_fetch(path, params, second))
+            attempts[hedge] = second
+            pending = set(attempts)
+            failed = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda t: t is hedge):
+                    error = task.exception()
+                    if isinstance(error, EDUZENError):
+                        failed = failed or task
+                        continue
+                    winner = attempts[task]
+                    event.adopt(winner, *(other for other in attempts.values() if other is not winner))
+                    if task is hedge:
+                        policy.record_win()
+                    return task.result()
+
+            event.adopt(attempts[failed], *(other for other in attempts.values() if other is not attempts[failed]))
+            return failed.result()
+        finally:
+            for task in attempts:
+                if not task.done():
+                    task.cancel()
+
+    async def _timed_fetch(self, path: str, params: Optional[Dict[str, Any]], event: RequestEvent) -> Any:
+        """GET and decode, feeding the latency to the hedge policy"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await self._fetch("GET", path, None, params, event=event)
+        self.hedge_policy.record(event.endpoint, loop.time() - started)
+        return result
+
+    async def _fetch(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Union[Dict[str, Any], bytes]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        stream: bool = False,
+        event: Optional[RequestEvent] = None,
+    ) -> Any:
+        """Send a request with rate limiting and retries, then decode it"""
+        url = f"{self.base_url}{path}"
+
+        headers = self._build_headers()
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+
+        body = self.encode_body(data)
+        if event is None:
+            event = RequestEvent(method.upper(), path, path)
+        event.request_bytes = len(body) if body else 0
+
+        if params:
+            # aiohttp only accepts str/int/float query values
+            params = {k: str(v) for k, v in params.items() if v is not None}
+
+        retryable = self.retry_policy.is_retryable(method, idempotency_key)
+        deadline = self.retry_policy.start()
+        if event.deadline is not None:
+            deadline = event.deadline if deadline is None else min(deadline, event.deadline)
+        attempt = 0
+        throttled = 0
+        loop = asyncio.get_running_loop()
+
+        while True:
+            pause = self.rate_limiter.acquire()
+            self._budget(event, pause)
+            await self._sleep(pause, event)
+            attempt += 1
+            event.attempts = attempt
+            event.retries = attempt - 1
+
+            try:
+                queued = loop.time()
+                async with self.semaphore:
+                    # Waiting for a concurrency slot counts as wait time
+                    sent = loop.time()
+                    event.timings["wait"] += sent - queued
+                    # The attempt, body included, never outlives the call deadline
+                    budget = self._budget(event)
+                    extra = {}
+                    if budget is not None:
+                        extra["timeout"] = self._timeout(budget)
+                    response = await self.session.request(
+                        method,
+                        url,
+                        data=body,
+                        params=params,
+                        headers=headers,
+                        **extra,
+                    )
+                    received = loop.time()
+                    event.timings["send"] = received - sent
+                    event.timings["read"] = 0.0
+                    if not stream or response.status >= 400:
+                        content = await response.read()
+                        event.timings["read"] = loop.time() - received
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if retryable and isinstance(e, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+                    backoff = self.retry_policy.next_delay(attempt, deadline)
+                    if backoff is not None:
+                        await self._sleep(backoff, event)
+                        continue
+                if isinstance(e, asyncio.TimeoutError):
+                    self._budget(event)
+                raise EDUZENNetworkError(message=str(e) or e.__class__.__name__)
+
+            event.record_response(response.status, response.headers)
+            self.rate_limiter.update(response.status, response.headers)
+            if response.status == 429 and throttled < self.rate_limit_retries:
+                throttled += 1
+                continue
+
+            if retryable and response.status in self.retry_policy.retry_statuses:
+                backoff = self.retry_policy.next_delay(attempt, deadline)
+                if backoff is not None:
+                    await self._sleep(backoff, event)
+                    continue
+
+            break
+
+        if response.status >= 400:
+            try:
+                error_data = self.codec.loads(content)
+                raise EDUZENAPIError(
+                    message=error_data.get("message", "API error"),
+                    code=error_data.get("code", f"HTTP_{response.status}"),
+                    status_code=response.status,
+                    details=error_data.get("details"),
+                )
+            except (ValueError, AttributeError):
+                raise EDUZENAPIError(
+                    message=f"{response.status} Error: {response.reason} for url: {response.url}",
+                    code=f"HTTP_{response.status}",
+                    status_code=response.status,
+                )
+
+        if stream:
+            return response
+
+        event.response_bytes = len(content)
+        started = loop.time()
+        try:
+            return self.codec.loads(content)
+        except ValueError as e:
+            raise EDUZENNetworkError(message=str(e))
+        finally:
+            event.timings["decode"] = loop.time() - started
+
+    @staticmethod
+    async def _sleep(seconds: float, event: RequestEvent) -> None:
+        """Sleep for the rate limiter or a retry backoff, accounting it as wait time"""
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+            event.timings["wait"] += seconds
+
+    def _bulk(self, func, items, concurrency: int, ordered: bool) -> AsyncIterator[BulkResult]:
+        """Run calls as tasks with at most ``concurrency`` in flight"""
+        return abulk_map(func, items, concurrency=concurrency, ordered=ordered)
+
+    # ========== PAGINATION ==========
+
+    async def iter_students(
+        self,
+        organization_id: str,
+        search: Optional[str] = None,
+        page_size: int = 50,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream every student of an organization, one record at a time
+
+        Async counterpart of EDUZENClient.iter_students: page N+1 is requested
+        while page N is consumed and iteration stops on the first short page.
+
+        Args:
+            organization_id: Organization ID
+            search: Optional search filter
+            page_size: Records per request (default: 50, the server default)
+
+        Yields:
+            Student records (Student models when the client has models=True)
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+
+        async def fetch(page: int) -> List[Dict[str, Any]]:
+            response = await self.get_students(
+                organization_id=organization_id,
+                page=page,
+                limit=page_size,
+                search=search,
+            )
+            return response.get("data") or []
+
+        page = 1
+        pending = asyncio.ensure_future(fetch(page))
+        try:
+            while pending is not None:
+                records = await pending
+                pending = None
+                if len(records) >= page_size:
+                    page += 1
+                    pending = asyncio.ensure_future(fetch(page))
+                for record in records:
+                    yield record
+                del records
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    # ========== DOCUMENTS ==========
+
+    async def generate_documents_batch(
+        self,
+        template_id: str,
+        items: Iterable[Dict[str, Any]],
+        destination: Union[str, "os.PathLike[str]", BinaryIO],
+        format: str = "PDF",
+        zip_filename: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """
+        Generate documents in bulk and stream the resulting ZIP archive
+
+        Args:
+            template_id: Template ID
+            items: Items to generate, e.g. ``{"variables": {...}}`` per document
+            destination: File path or binary file-like object receiving the ZIP
+            format: PDF or DOCX (default: PDF)
+            zip_filename: Archive name suggested to the server
+            chunk_size: Bytes read from the network per chunk (default: 64 KiB)
+
+        Returns:
+            Number of bytes written
+        """
+        response = await self._request(
+            "POST",
+            "/documents/generate-batch",
+            data=batch_payload(template_id, items, format, zip_filename),
+            stream=True,
+        )
+        try:
+            if isinstance(destination, (str, os.PathLike)):
+                with open(destination, "wb") as f:
+                    return await self._copy_stream(response, f, chunk_size)
+            return await self._copy_stream(response, destination, chunk_size)
+        finally:
+            response.release()
+
+    async def iter_documents_batch(
+        self,
+        template_id: str,
+        items: Iterable[Dict[str, Any]],
+        format: str = "PDF",
+        zip_filename: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[BatchDocument]:
+        """
+        Generate documents in bulk and iterate the archive members lazily
+
+        The ZIP is spooled to a temporary file, never to memory, and only one
+        document is held in memory at a time.
+
+        Yields:
+            BatchDocument (filename, content) per generated document
+        """
+        with tempfile.TemporaryFile() as spool:
+            await self.generate_documents_batch(
+                template_id, items, spool, format=format, zip_filename=zip_filename, chunk_size=chunk_size
+            )
+            spool.seek(0)
+            for document in iter_zip_members(spool):
+                yield document
+
+    async def fetch_document(
+        self,
+        template_id: str,
+        template_version: Any,
+        format: str = "pdf",
+        variables: Optional[Dict[str, Any]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> "Artifact":
+        """
+        Generate a document and download it, or serve it from the document store
+
+        See EDUZENClient.fetch_document.
+        """
+        store = self.document_store
+        if store is None:
+            raise ValueError("fetch_document requires a client created with document_store")
+        key = store.key(template_id, template_version, format, variables)
+        artifact = store.get(key)
+        if artifact is not None:
+            store.record("hits")
+            return artifact
+
+        async def generate() -> "Artifact":
+            response = await self.generate_document(template_id, format=format, variables=variables)
+            url, headers = self._download_target(response)
+            with store.writer(key) as f:
+                size = await self._download(url, headers, f, chunk_size)
+            store.record("misses")
+            from .artifacts import Artifact
+
+            return Artifact(key, store.path(key), size)
+
+        if self._singleflight is None:
+            return await generate()
+        return await self._singleflight.do(f"document:{key}", generate)
+
+    async def _download(self, url: str, headers: Dict[str, str], fileobj: BinaryIO, chunk_size: int) -> int:
+        """Stream a generated file to ``fileobj``"""
+        try:
+            response = await self.session.get(url, headers=headers, timeout=self._timeout())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise EDUZENNetworkError(message=str(e) or e.__class__.__name__)
+        try:
+            if response.status >= 400:
+                raise EDUZENAPIError(
+                    message="Document download failed",
+                    code=f"HTTP_{response.status}",
+                    status_code=response.status,
+                )
+            return await self._copy_stream(response, fileobj, chunk_size)
+        finally:
+            response.release()
+
+    @staticmethod
+    async def _copy_stream(response: "aiohttp.ClientResponse", fileobj: BinaryIO, chunk_size: int) -> int:
+        """Copy a streamed response body to a file in chunks"""
+        written = 0
+        try:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                fileobj.write(chunk)
+                written += len(chunk)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise EDUZENNetworkError(message=str(e) or e.__class__.__name__)
+        return written
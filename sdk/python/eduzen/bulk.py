@@ -0,0 +1,147 @@
+"""
+EDUZEN API bulk helpers
+"""
+
+import contextvars
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, NamedTuple, Optional
+
+
+class BulkResult(NamedTuple):
+    """Outcome of one item of a bulk call"""
+
+    index: int
+    item: Any
+    result: Optional[Dict[str, Any]]
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item succeeded"""
+        return self.error is None
+
+
+def _window(concurrency: int) -> int:
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    # Keep a little work queued so workers never idle, but never read the
+    # whole input ahead of the results being consumed.
+    return concurrency * 2
+
+
+def bulk_map(
+    func: Callable[[Any], Dict[str, Any]],
+    items: Iterable[Any],
+    concurrency: int = 8,
+    ordered: bool = False,
+) -> Iterator[BulkResult]:
+    """
+    Run ``func`` over ``items`` on a bounded thread pool
+
+    Items are pulled from the iterable lazily, so memory is bounded by the
+    window of in-flight work rather than the input size. A failing item is
+    reported in its BulkResult and never aborts the batch.
+
+    Args:
+        func: Callable applied to each item
+        items: Input items (any iterable, including generators)
+        concurrency: Worker threads (default: 8)
+        ordered: Yield results in input order instead of completion order
+
+    Yields:
+        BulkResult per item
+    """
+    window = _window(concurrency)
+
+    def run(index: int, item: Any) -> BulkResult:
+        try:
+            return BulkResult(index, item, func(item), None)
+        except Exception as e:
+            return BulkResult(index, item, None, e)
+
+    source = iter(enumerate(items))
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="eduzen-bulk") as executor:
+        pending = deque()
+
+        def fill() -> None:
+            while len(pending) < window:
+                try:
+                    index, item = next(source)
+                except StopIteration:
+                    return
+                # Workers run in the caller's context, so deadline() blocks apply
+                pending.append(executor.submit(contextvars.copy_context().run, run, index, item))
+
+        try:
+            fill()
+            while pending:
+                if ordered:
+                    future = pending.popleft()
+                    yield future.result()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                        yield future.result()
+                fill()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def abulk_map(
+    func: Callable[[Any], Awaitable[Dict[str, Any]]],
+    items: Iterable[Any],
+    concurrency: int = 8,
+    ordered: bool = False,
+) -> AsyncIterator[BulkResult]:
+    """
+    Async counterpart of bulk_map: run the coroutine ``func`` over ``items``
+    with at most ``concurrency`` calls in flight
+
+    Args:
+        func: Coroutine function applied to each item
+        items: Input items (any iterable, including generators)
+        concurrency: Maximum concurrent calls (default: 8)
+        ordered: Yield results in input order instead of completion order
+
+    Yields:
+        BulkResult per item
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    # Imported here: the sync client loads this module and never needs asyncio
+    import asyncio
+
+    async def run(index: int, item: Any) -> BulkResult:
+        try:
+            return BulkResult(index, item, await func(item), None)
+        except Exception as e:
+            return BulkResult(index, item, None, e)
+
+    source = iter(enumerate(items))
+    pending = deque()
+
+    def fill() -> None:
+        while len(pending) < concurrency:
+            try:
+                index, item = next(source)
+            except StopIteration:
+                return
+            pending.append(asyncio.ensure_future(run(index, item)))
+
+    try:
+        fill()
+        while pending:
+            if ordered:
+                yield await pending.popleft()
+            else:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield future.result()
+            fill()
+    finally:
+        for future in pending:
+            future.cancel()
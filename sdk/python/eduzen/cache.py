@@ -0,0 +1,254 @@
+"""
+EDUZEN API response cache
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Mapping, NamedTuple, Optional, Tuple
+from urllib.parse import urlencode
+
+# Read endpoints cached by default, with their time-to-live in seconds
+DEFAULT_TTLS: Dict[str, float] = {
+    "/qr-attendance/active/": 5.0,
+    "/sessions/active": 10.0,
+    "/v1/students": 30.0,
+}
+
+# Mutating endpoints and the cached read endpoints they make stale
+DEFAULT_INVALIDATIONS: Dict[str, Tuple[str, ...]] = {
+    "/qr-attendance/generate": ("/qr-attendance/active/",),
+    "/qr-attendance/deactivate/": ("/qr-attendance/active/",),
+    "/qr-attendance/scan": ("/qr-attendance/active/",),
+    "/sessions/revoke": ("/sessions/active",),
+    "/sessions/timeout-rules": ("/sessions/active",),
+    "/users/create": ("/v1/students",),
+}
+
+
+class CacheEntry(NamedTuple):
+    """Cached response body and its validators"""
+
+    path: str
+    body: bytes
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry can be served without contacting the API"""
+        return time.time() < self.expires_at
+
+
+class MemoryCacheBackend:
+    """Bounded in-memory LRU storage"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry.path.startswith(prefix)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCacheBackend:
+    """Bounded LRU storage in a SQLite file, shared across processes and runs"""
+
+    def __init__(self, path: str, maxsize: int = 10000):
+        self.path = path
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        # Imported on first use: memory-only caches and clients without a cache never load sqlite3
+        import sqlite3
+
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, path TEXT NOT NULL, body BLOB NOT NULL,"
+            " expires_at REAL NOT NULL, etag TEXT, last_modified TEXT, accessed_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_path ON responses (path)")
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT path, body, expires_at, etag, last_modified FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            return CacheEntry(*row)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, entry.path, entry.body, entry.expires_at, entry.etag, entry.last_modified, time.time()),
+            )
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+
+    def delete_prefix(self, prefix: str) -> int:
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        with self._lock:
+            return self._db.execute(
+                "DELETE FROM responses WHERE path LIKE ? ESCAPE '\\'", (escaped + "%",)
+            ).rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+class ResponseCache:
+    """
+    Opt-in cache for GET responses
+
+    Entries are keyed on method, path, query parameters and the caller's
+    credentials, expire after a per-endpoint TTL and are revalidated with
+    If-None-Match / If-Modified-Since when the API sent validators. Mutating
+    calls drop the read endpoints they affect (see DEFAULT_INVALIDATIONS).
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: Optional[float] = None,
+        maxsize: int = 1024,
+        path: Optional[str] = None,
+        invalidations: Optional[Mapping[str, Iterable[str]]] = None,
+    ):
+        """
+        Args:
+            ttls: TTL in seconds per path prefix (default: DEFAULT_TTLS)
+            default_ttl: TTL for GET paths matching no prefix; None disables caching them
+            maxsize: Maximum number of entries kept (LRU eviction)
+            path: SQLite file for an on-disk cache; in-memory when omitted
+            invalidations: Mutating path prefix -> cached prefixes to drop
+                (default: DEFAULT_INVALIDATIONS)
+        """
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.invalidations = {
+            k: tuple(v) for k, v in (DEFAULT_INVALIDATIONS if invalidations is None else invalidations).items()
+        }
+        self.backend = DiskCacheBackend(path, maxsize) if path else MemoryCacheBackend(maxsize)
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """TTL for a path, or None when the path is not cached"""
+        best = None
+        for prefix, ttl in self.ttls.items():
+            if path.startswith(prefix) and (best is None or len(prefix) > len(best[0])):
+                best = (prefix, ttl)
+        return best[1] if best else self.default_ttl
+
+    @staticmethod
+    def key(method: str, path: str, params: Optional[Mapping[str, Any]], identity: str) -> str:
+        """Cache key for a request"""
+        # Escaped, so values containing "&" or "=" cannot collide with other params
+        query = urlencode(sorted((k, v) for k, v in (params or {}).items() if v is not None), doseq=True)
+        raw = f"{identity}\n{method.upper()}\n{path}\n{query}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        return self.backend.get(key)
+
+    def store(self, key: str, path: str, body: bytes, headers: Mapping[str, str]) -> None:
+        """Store a response body with its validators"""
+        ttl = self.ttl_for(path)
+        if ttl is None:
+            return
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        self.backend.set(
+            key,
+            CacheEntry(
+                path=path,
+                body=body,
+                expires_at=time.time() + ttl,
+                etag=etag if isinstance(etag, str) else None,
+                last_modified=last_modified if isinstance(last_modified, str) else None,
+            ),
+        )
+
+    def refresh(self, key: str, entry: CacheEntry) -> None:
+        """Extend an entry after a 304 Not Modified"""
+        self.backend.set(key, entry._replace(expires_at=time.time() + (self.ttl_for(entry.path) or 0)))
+
+    def invalidate(self, path: str) -> int:
+        """
+        Drop entries made stale by a mutating call to ``path``
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for prefix, targets in self.invalidations.items():
+            if path.startswith(prefix):
+                for target in targets:
+                    removed += self.backend.delete_prefix(target)
+        return removed
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def record(self, outcome: str) -> None:
+        """Count a hit, miss or revalidation"""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and revalidation counters"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "size": len(self.backend),
+        }
@@ -2,12 +2,59 @@
 EDUZEN API Client for Python
 """
 
-import requests
-from typing import Optional, Dict, Any, List
-from .exceptions import EDUZENError, EDUZENAPIError, EDUZENNetworkError
+import os
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from http.cookiejar import DefaultCookiePolicy
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Iterator, Iterable, BinaryIO, Tuple, Type, Union
 
+import requests
+from requests.adapters import HTTPAdapter
 
-class EDUZENClient:
+from .bulk import BulkResult, bulk_map
+from .codec import JSONCodec, get_codec
+from .documents import DEFAULT_CHUNK_SIZE, BatchDocument, batch_payload, iter_zip_members
+from .endpoints import EDUZENEndpoints
+from .exceptions import EDUZENError, EDUZENAPIError, EDUZENNetworkError
+from .metrics import Hooks, RequestEvent
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    # Optional subsystems, imported where used so a plain client never loads them
+    from .artifacts import Artifact, ArtifactStore
+    from .cache import ResponseCache
+    from .deadline import HedgePolicy
+    from .models import Model
+
+
+def create_session(pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False) -> requests.Session:
+    """
+    Create a session with a bounded keep-alive connection pool
+
+    The session carries no credentials, so it can be shared by clients using
+    different API keys (see ClientPool).
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    # Authentication is sent explicitly on every request; never let
+    # Set-Cookie responses leak state between threads sharing the session.
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+class EDUZENClient(EDUZENEndpoints):
     """Client for EDUZEN API"""
 
     def __init__(
@@ -16,6 +63,20 @@ class EDUZENClient:
         api_key: Optional[str] = None,
         access_token: Optional[str] = None,
         timeout: int = 30,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        rate_limit_retries: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional["ResponseCache"] = None,
+        coalesce_requests: bool = True,
+        codec: Optional[JSONCodec] = None,
+        models: bool = False,
+        deadlines: Optional[Dict[str, float]] = None,
+        hedge_policy: Optional["HedgePolicy"] = None,
+        document_store: Optional["ArtifactStore"] = None,
     ):
         """
         Initialize EDUZEN client
@@ -25,307 +86,628 @@ class EDUZENClient:
             api_key: API key for authentication
             access_token: Access token for authentication
             timeout: Request timeout in seconds (default: 30)
+            pool_connections: Number of per-host connection pools to keep (default: 10)
+            pool_maxsize: Maximum keep-alive connections per host (default: 10)
+            pool_block: Wait for a free pooled connection instead of opening
+                a throwaway one when the pool is exhausted (default: False)
+            session: Existing requests.Session to share; it is not closed by the client
+            rate_limiter: RateLimiter to share between clients using the same API key
+            rate_limit_retries: Times a 429 response is retried after Retry-After (default: 3)
+            retry_policy: Retry policy for transient failures (default: RetryPolicy())
+            cache: Opt-in ResponseCache for read endpoints (default: no caching)
+            coalesce_requests: Share one in-flight GET between identical concurrent
+                calls; waiters receive the same result object (default: True)
+            codec: JSON codec (default: fastest installed of orjson, ujson, json)
+            models: Return records as compact models (Student, User, Session,
+                QRCode, PaymentIntent) instead of plain dicts (default: False)
+            deadlines: Seconds allowed per endpoint template, rate-limit waits,
+                connection, response and retries included, e.g.
+                ``{"/qr-attendance/scan": 2.0}`` (default: only ``timeout`` per attempt)
+            hedge_policy: Opt-in HedgePolicy sending a second attempt for GETs
+                slower than their observed p95 (default: no hedging)
+            document_store: Opt-in ArtifactStore serving fetch_document from
+                disk for documents already generated (default: none)
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.access_token = access_token
         self.timeout = timeout
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.rate_limit_retries = rate_limit_retries
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache
+        self._singleflight = SingleFlight() if coalesce_requests else None
+        self.codec = codec or get_codec()
+        self.hooks = Hooks()
+        self.models = models
+        self.deadlines = dict(deadlines or {})
+        self.hedge_policy = hedge_policy
+        self.document_store = document_store
+
+        self._session = session
+        self._owns_session = session is None
+        self._session_lock = threading.Lock()
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+
+    # ========== TRANSPORT ==========
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled keep-alive session, created on first use"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> requests.Session:
+        """Create a session with a bounded keep-alive connection pool"""
+        return create_session(self.pool_connections, self.pool_maxsize, self.pool_block)
+
+    def close(self) -> None:
+        """Close pooled connections (a shared session passed in is left open)"""
+        with self._session_lock:
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if not self._owns_session:
+            return
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def __enter__(self) -> "EDUZENClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def _request(
         self,
         method: str,
         path: str,
-        data: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], bytes]] = None,
         params: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+        idempotency_key: Optional[str] = None,
+        stream: bool = False,
+        endpoint: Optional[str] = None,
+        model: Optional[Tuple[Union[str, Type["Model"]], Optional[str]]] = None,
+        deadline: Optional[float] = None,
+    ) -> Any:
         """
         Make API request
 
         Args:
             method: HTTP method (GET, POST, etc.)
             path: API path
-            data: Request body data
+            data: Request body data, or pre-encoded JSON bytes
             params: Query parameters
+            idempotency_key: Idempotency-Key header, makes a mutating call retryable
+            stream: Return the successful requests.Response unread instead of
+                decoding JSON; the caller must close it
+            endpoint: Path template reported to hooks, e.g. "/sessions/{id}" (default: path)
+            model: (model class or its name in eduzen.models, response key)
+                to wrap the records in when the client was created with
+                ``models=True``
+            deadline: Seconds allowed for the call, retries included (default:
+                the endpoint's entry in ``deadlines``, if any)
 
         Returns:
             Response data
 
         Raises:
             EDUZENAPIError: API error
+            EDUZENTimeoutError: Deadline exceeded
             EDUZENNetworkError: Network error
         """
-        url = f"{self.base_url}{path}"
-
-        headers = {
-            "Content-Type": "application/json",
-        }
-
-        if self.api_key:
-            headers["X-API-Key"] = self.api_key
-
-        if self.access_token:
-            headers["Cookie"] = f"sb-access-token={self.access_token}"
+        event = RequestEvent(method.upper(), endpoint or path, path)
+        event.deadline = self._call_deadline(event.endpoint, deadline)
+        if self.hooks:
+            self.hooks.emit("before_request", event)
 
         try:
-            response = requests.request(
-                method=method,
-                url=url,
-                json=data,
-                params=params,
-                headers=headers,
-                timeout=self.timeout,
-            )
-
-            response.raise_for_status()
-            return response.json()
+            result = self._dispatch(method, path, data, params, idempotency_key, stream, event)
+        except EDUZENError as e:
+            event.finish()
+            event.error = e
+            e.request_id = event.request_id
+            e.elapsed = event.timings["total"]
+            if self.hooks:
+                self.hooks.emit("on_error", event)
+            raise
+
+        event.finish()
+        if self.hooks:
+            self.hooks.emit("after_response", event)
+        if model is not None and self.models:
+            from .models import wrap
+
+            return wrap(result, *model)
+        return result
+
+    def _dispatch(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Union[Dict[str, Any], bytes]],
+        params: Optional[Dict[str, Any]],
+        idempotency_key: Optional[str],
+        stream: bool,
+        event: RequestEvent,
+    ) -> Any:
+        """Route a request through streaming, invalidation, coalescing and caching"""
+        if stream:
+            return self._send(method, path, data, params, idempotency_key, stream=True, event=event)
+
+        if method.upper() != "GET":
+            try:
+                return self._decode(self._send(method, path, data, params, idempotency_key, event=event), event)
+            finally:
+                if self.cache is not None:
+                    self.cache.invalidate(path)
+
+        if self._singleflight is None:
+            return self._get(path, params, event)
+        key = self._request_key(path, params)
+        return self._singleflight.do(key, lambda: self._get(path, params, event), event.mark_coalesced, event.deadline)
+
+    def _get(self, path: str, params: Optional[Dict[str, Any]], event: RequestEvent) -> Any:
+        """GET and decode, through the response cache when enabled"""
+        if self.cache is None:
+            return self._decode(self._send_get(path, params, None, event), event)
+        return self._cached_get(path, params, event)
+
+    def _cached_get(self, path: str, params: Optional[Dict[str, Any]], event: RequestEvent) -> Any:
+        """GET through the response cache, revalidating stale entries"""
+        cache = self.cache
+        key = cache.key("GET", path, params, self._identity)
+        entry = cache.get(key)
+
+        if entry is not None and entry.fresh:
+            cache.record("hits")
+            event.cache = "hit"
+            return self._decode_bytes(entry.body, event)
+
+        conditional = {}
+        if entry is not None:
+            if entry.etag:
+                conditional["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                conditional["If-Modified-Since"] = entry.last_modified
+
+        response = self._send_get(path, params, conditional, event)
+        if entry is not None and response.status_code == 304:
+            cache.record("revalidations")
+            event.cache = "revalidated"
+            cache.refresh(key, entry)
+            return self._decode_bytes(entry.body, event)
+
+        cache.record("misses")
+        event.cache = "miss"
+        result = self._decode(response, event)
+        cache.store(key, path, response.content, response.headers)
+        return result
+
+    def _decode(self, response: requests.Response, event: Optional[RequestEvent] = None) -> Any:
+        """Decode a JSON response body straight from its bytes"""
+        content = response.content
+        if event is not None:
+            event.response_bytes = len(content)
+        return self._decode_bytes(content, event)
+
+    def _decode_bytes(self, body: bytes, event: Optional[RequestEvent] = None) -> Any:
+        """Decode a JSON body"""
+        started = time.perf_counter()
+        try:
+            return self.codec.loads(body)
+        except ValueError as e:
+            raise EDUZENNetworkError(message=str(e))
+        finally:
+            if event is not None:
+                event.timings["decode"] += time.perf_counter() - started
+
+    def _send_get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        extra_headers: Optional[Dict[str, str]],
+        event: RequestEvent,
+    ) -> requests.Response:
+        """
+        Send a GET, hedged when the hedge policy covers its endpoint
 
-        except requests.exceptions.RequestException as e:
-            if isinstance(e, requests.exceptions.HTTPError):
+        Once the first attempt has been running for the endpoint's observed
+        p95, a second one is sent and whichever answers first is returned.
+        The other one is left to finish in the background and discarded.
+        """
+        policy = self.hedge_policy
+        if policy is None or not policy.applies(event.endpoint):
+            return self._send("GET", path, None, params, None, extra_headers=extra_headers, event=event)
+        delay = policy.delay(event.endpoint)
+        if delay is None:
+            return self._timed_get(path, params, extra_headers, event)
+
+        executor = self._hedging_executor()
+        first = event.attempt()
+        primary = executor.submit(self._timed_get, path, params, extra_headers, first)
+        done, _ = wait([primary], timeout=delay)
+        if done or not policy.acquire():
+            try:
+                return primary.result()
+            finally:
+                event.adopt(first)
+
+        event.hedged = True
+        second = event.attempt()
+        hedge = executor.submit(self._timed_get, path, params, extra_headers, second)
+        attempts = {primary: first, hedge: second}
+        pending = set(attempts)
+        failed = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: f is hedge):
                 try:
-                    error_data = e.response.json()
-                    raise EDUZENAPIError(
-                        message=error_data.get("message", "API error"),
-                        code=error_data.get("code", f"HTTP_{e.response.status_code}"),
-                        status_code=e.response.status_code,
-                        details=error_data.get("details"),
-                    )
-                except ValueError:
-                    raise EDUZENAPIError(
-                        message=str(e),
-                        code=f"HTTP_{e.response.status_code}",
-                        status_code=e.response.status_code,
+                    response = future.result()
+                except EDUZENError as e:
+                    failed = failed or (future, e)
+                    continue
+                winner = attempts[future]
+                event.adopt(winner, *(other for other in attempts.values() if other is not winner))
+                if future is hedge:
+                    policy.record_win()
+                return response
+
+        future, error = failed
+        event.adopt(attempts[future], *(other for other in attempts.values() if other is not attempts[future]))
+        raise error
+
+    def _timed_get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        extra_headers: Optional[Dict[str, str]],
+        event: RequestEvent,
+    ) -> requests.Response:
+        """Send a GET and feed its latency to the hedge policy"""
+        started = time.perf_counter()
+        response = self._send("GET", path, None, params, None, extra_headers=extra_headers, event=event)
+        self.hedge_policy.record(event.endpoint, time.perf_counter() - started)
+        return response
+
+    def _hedging_executor(self) -> ThreadPoolExecutor:
+        """Threads running hedged attempts, created on first use"""
+        if self._hedge_executor is None:
+            with self._session_lock:
+                if self._hedge_executor is None:
+                    self._hedge_executor = ThreadPoolExecutor(
+                        max_workers=2 * self.pool_maxsize, thread_name_prefix="eduzen-hedge"
                     )
-            else:
-                raise EDUZENNetworkError(message=str(e))
-
-    # ========== 2FA ==========
+        return self._hedge_executor
 
-    def generate_2fa_secret(self) -> Dict[str, Any]:
-        """Generate 2FA secret and QR code"""
-        return self._request("POST", "/2fa/generate-secret")
+    def _send(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Union[Dict[str, Any], bytes]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        stream: bool = False,
+        extra_headers: Optional[Dict[str, str]] = None,
+        event: Optional[RequestEvent] = None,
+    ) -> requests.Response:
+        """
+        Send a request with rate limiting and retries
 
-    def verify_2fa_activation(self, code: str) -> Dict[str, Any]:
-        """Verify 2FA activation code"""
-        return self._request("POST", "/2fa/verify-activation", data={"code": code})
+        Returns:
+            Successful (or 304 Not Modified) response
 
-    # ========== USERS ==========
+        Raises:
+            EDUZENAPIError: API error
+            EDUZENTimeoutError: Deadline exceeded
+            EDUZENNetworkError: Network error
+        """
+        url = f"{self.base_url}{path}"
 
-    def create_user(
+        headers = self._build_headers()
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+        if extra_headers:
+            headers.update(extra_headers)
+
+        body = self.encode_body(data)
+        if event is None:
+            event = RequestEvent(method.upper(), path, path)
+        event.request_bytes = len(body) if body else 0
+
+        retryable = self.retry_policy.is_retryable(method, idempotency_key)
+        deadline = self.retry_policy.start()
+        if event.deadline is not None:
+            deadline = event.deadline if deadline is None else min(deadline, event.deadline)
+        attempt = 0
+        throttled = 0
+
+        while True:
+            pause = self.rate_limiter.acquire()
+            self._budget(event, pause)
+            self._sleep(pause, event)
+            attempt += 1
+            event.attempts = attempt
+            event.retries = attempt - 1
+
+            try:
+                # Connect and read timeouts never outlive the call deadline
+                budget = self._budget(event)
+                sent = time.perf_counter()
+                response = self.session.request(
+                    method,
+                    url,
+                    data=body,
+                    params=params,
+                    headers=headers,
+                    timeout=self.timeout if budget is None else min(self.timeout, budget),
+                    stream=stream,
+                )
+                self._record_timings(event, response, time.perf_counter() - sent)
+
+                event.record_response(response.status_code, response.headers)
+                self.rate_limiter.update(response.status_code, response.headers)
+                if response.status_code == 429 and throttled < self.rate_limit_retries:
+                    throttled += 1
+                    response.close()
+                    continue
+
+                if retryable and response.status_code in self.retry_policy.retry_statuses:
+                    backoff = self.retry_policy.next_delay(attempt, deadline)
+                    if backoff is not None:
+                        response.close()
+                        self._sleep(backoff, event)
+                        continue
+
+                response.raise_for_status()
+                return response
+
+            except requests.exceptions.RequestException as e:
+                if retryable and isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+                    backoff = self.retry_policy.next_delay(attempt, deadline)
+                    if backoff is not None:
+                        self._sleep(backoff, event)
+                        continue
+
+                if isinstance(e, requests.exceptions.HTTPError):
+                    try:
+                        error_data = e.response.json()
+                        raise EDUZENAPIError(
+                            message=error_data.get("message", "API error"),
+                            code=error_data.get("code", f"HTTP_{e.response.status_code}"),
+                            status_code=e.response.status_code,
+                            details=error_data.get("details"),
+                        )
+                    except ValueError:
+                        raise EDUZENAPIError(
+                            message=str(e),
+                            code=f"HTTP_{e.response.status_code}",
+                            status_code=e.response.status_code,
+                        )
+                else:
+                    if isinstance(e, requests.exceptions.Timeout):
+                        self._budget(event)
+                    raise EDUZENNetworkError(message=str(e))
+
+    @staticmethod
+    def _sleep(seconds: float, event: RequestEvent) -> None:
+        """Sleep for the rate limiter or a retry backoff, accounting it as wait time"""
+        if seconds > 0:
+            time.sleep(seconds)
+            event.timings["wait"] += seconds
+
+    @staticmethod
+    def _record_timings(event: RequestEvent, response: requests.Response, duration: float) -> None:
+        """Split an attempt into time-to-headers (send) and body download (read)"""
+        elapsed = getattr(response, "elapsed", None)
+        if isinstance(elapsed, timedelta):
+            send = min(elapsed.total_seconds(), duration)
+        else:
+            send = duration
+        event.timings["send"] = send
+        event.timings["read"] = duration - send
+
+    def _bulk(self, func, items, concurrency: int, ordered: bool) -> Iterator[BulkResult]:
+        """Fan calls out over a bounded thread pool sharing this client's session"""
+        return bulk_map(func, items, concurrency=concurrency, ordered=ordered)
+
+    # ========== PAGINATION ==========
+
+    def iter_students(
         self,
-        email: str,
-        full_name: str,
         organization_id: str,
-        phone: Optional[str] = None,
-        password: Optional[str] = None,
-        role: Optional[str] = None,
-        is_active: bool = True,
-        send_invitation: bool = False,
-    ) -> Dict[str, Any]:
-        """Create a new user"""
-        data = {
-            "email": email,
-            "full_name": full_name,
-            "organization_id": organization_id,
-            "phone": phone,
-            "password": password,
-            "role": role,
-            "is_active": is_active,
-            "send_invitation": send_invitation,
-        }
-        return self._request("POST", "/users/create", data={k: v for k, v in data.items() if v is not None})
-
-    # ========== STUDENTS ==========
-
-    def get_students(
-        self,
-        organization_id: str,
-        page: int = 1,
-        limit: int = 10,
         search: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Get all students"""
-        params = {
-            "organization_id": organization_id,
-            "page": page,
-            "limit": limit,
-        }
-        if search:
-            params["search"] = search
-        return self._request("GET", "/v1/students", params=params)
-
-    # ========== PAYMENTS ==========
-
-    def create_stripe_intent(
-        self,
-        amount: int,
-        customer_email: str,
-        currency: str = "EUR",
-        description: Optional[str] = None,
-        customer_name: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None,
-        return_url: Optional[str] = None,
-        cancel_url: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Create Stripe payment intent"""
-        data = {
-            "amount": amount,
-            "currency": currency,
-            "customer_email": customer_email,
-            "description": description,
-            "customer_name": customer_name,
-            "metadata": metadata,
-            "return_url": return_url,
-            "cancel_url": cancel_url,
-        }
-        return self._request("POST", "/payments/stripe/create-intent", data={k: v for k, v in data.items() if v is not None})
-
-    def create_sepa_direct_debit(
+        page_size: int = 50,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream every student of an organization, one record at a time
+
+        Page N+1 is fetched in the background while page N is consumed, so at
+        most two pages are held in memory. Iteration stops on the first short
+        page; ``meta.total`` is not used because it drifts while paging.
+
+        Args:
+            organization_id: Organization ID
+            search: Optional search filter
+            page_size: Records per request (default: 50, the server default)
+
+        Yields:
+            Student records (Student models when the client has models=True)
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+
+        def fetch(page: int) -> List[Dict[str, Any]]:
+            response = self.get_students(
+                organization_id=organization_id,
+                page=page,
+                limit=page_size,
+                search=search,
+            )
+            return response.get("data") or []
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="eduzen-prefetch")
+        try:
+            page = 1
+            pending = executor.submit(fetch, page)
+            while pending is not None:
+                records = pending.result()
+                pending = None
+                if len(records) >= page_size:
+                    page += 1
+                    pending = executor.submit(fetch, page)
+                yield from records
+                del records
+        finally:
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=False)
+
+    # ========== DOCUMENTS ==========
+
+    def generate_documents_batch(
         self,
-        amount: float,
-        debtor_iban: str,
-        mandate_id: str,
-        creditor_id: str,
-        debtor_name: Optional[str] = None,
-        debtor_bic: Optional[str] = None,
-        reference: Optional[str] = None,
-        due_date: Optional[str] = None,
-        creditor_name: Optional[str] = None,
-        creditor_iban: Optional[str] = None,
-        currency: str = "EUR",
-        description: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Create SEPA direct debit"""
-        data = {
-            "amount": amount,
-            "currency": currency,
-            "description": description,
-            "debtor_name": debtor_name,
-            "debtor_iban": debtor_iban,
-            "debtor_bic": debtor_bic,
-            "reference": reference,
-            "due_date": due_date,
-            "mandate_id": mandate_id,
-            "creditor_name": creditor_name,
-            "creditor_iban": creditor_iban,
-            "creditor_id": creditor_id,
-        }
-        return self._request("POST", "/payments/sepa/create-direct-debit", data={k: v for k, v in data.items() if v is not None})
-
-    def initiate_mobile_money(
+        template_id: str,
+        items: Iterable[Dict[str, Any]],
+        destination: Union[str, "os.PathLike[str]", BinaryIO],
+        format: str = "PDF",
+        zip_filename: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """
+        Generate documents in bulk and stream the resulting ZIP archive
+
+        Args:
+            template_id: Template ID
+            items: Items to generate, e.g. ``{"variables": {...}}`` per document
+            destination: File path or binary file-like object receiving the ZIP
+            format: PDF or DOCX (default: PDF)
+            zip_filename: Archive name suggested to the server
+            chunk_size: Bytes read from the network per chunk (default: 64 KiB)
+
+        Returns:
+            Number of bytes written
+        """
+        response = self._request(
+            "POST",
+            "/documents/generate-batch",
+            data=batch_payload(template_id, items, format, zip_filename),
+            stream=True,
+        )
+        try:
+            if isinstance(destination, (str, os.PathLike)):
+                with open(destination, "wb") as f:
+                    return self._copy_stream(response, f, chunk_size)
+            return self._copy_stream(response, destination, chunk_size)
+        finally:
+            response.close()
+
+    def iter_documents_batch(
         self,
-        provider: str,
-        amount: int,
-        phone_number: str,
-        currency: str = "XOF",
-        description: Optional[str] = None,
-        invoice_id: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Initiate Mobile Money payment"""
-        data = {
-            "provider": provider,
-            "amount": amount,
-            "currency": currency,
-            "phone_number": phone_number,
-            "description": description,
-            "invoice_id": invoice_id,
-        }
-        return self._request("POST", "/mobile-money/initiate", data={k: v for k, v in data.items() if v is not None})
+        template_id: str,
+        items: Iterable[Dict[str, Any]],
+        format: str = "PDF",
+        zip_filename: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[BatchDocument]:
+        """
+        Generate documents in bulk and iterate the archive members lazily
 
-    # ========== DOCUMENTS ==========
+        The ZIP is spooled to a temporary file, never to memory, and only one
+        document is held in memory at a time.
 
-    def generate_document(
+        Yields:
+            BatchDocument (filename, content) per generated document
+        """
+        with tempfile.TemporaryFile() as spool:
+            self.generate_documents_batch(
+                template_id, items, spool, format=format, zip_filename=zip_filename, chunk_size=chunk_size
+            )
+            spool.seek(0)
+            yield from iter_zip_members(spool)
+
+    def fetch_document(
         self,
         template_id: str,
+        template_version: Any,
         format: str = "pdf",
         variables: Optional[Dict[str, Any]] = None,
-        send_email: bool = False,
-        email_to: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        """Generate document from template"""
-        data = {
-            "template_id": template_id,
-            "format": format,
-            "variables": variables,
-            "send_email": send_email,
-            "email_to": email_to,
-        }
-        return self._request("POST", "/documents/generate", data={k: v for k, v in data.items() if v is not None})
-
-    # ========== QR ATTENDANCE ==========
-
-    def generate_qr_code(
-        self,
-        session_id: str,
-        duration_minutes: int = 15,
-        max_scans: Optional[int] = None,
-        require_location: bool = False,
-        allowed_radius_meters: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """Generate QR code for session"""
-        data = {
-            "session_id": session_id,
-            "duration_minutes": duration_minutes,
-            "max_scans": max_scans,
-            "require_location": require_location,
-            "allowed_radius_meters": allowed_radius_meters,
-        }
-        return self._request("POST", "/qr-attendance/generate", data={k: v for k, v in data.items() if v is not None})
-
-    def scan_qr_code(
-        self,
-        qr_code: str,
-        student_id: str,
-        latitude: Optional[float] = None,
-        longitude: Optional[float] = None,
-    ) -> Dict[str, Any]:
-        """Scan QR code for attendance"""
-        data = {
-            "qr_code": qr_code,
-            "student_id": student_id,
-            "latitude": latitude,
-            "longitude": longitude,
-        }
-        return self._request("POST", "/qr-attendance/scan", data={k: v for k, v in data.items() if v is not None})
-
-    # ========== COMPLIANCE ==========
-
-    def check_compliance_alerts(self) -> Dict[str, Any]:
-        """Check compliance alerts"""
-        return self._request("POST", "/compliance/alerts/check")
-
-    # ========== SESSIONS ==========
-
-    def get_active_sessions(self) -> Dict[str, Any]:
-        """Get active sessions"""
-        return self._request("GET", "/sessions/active")
-
-    def configure_timeout_rules(
-        self,
-        organization_id: str,
-        idle_timeout_minutes: Optional[int] = None,
-        absolute_timeout_minutes: Optional[int] = None,
-        warning_before_timeout_minutes: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """Configure session timeout rules"""
-        data = {
-            "organization_id": organization_id,
-            "idle_timeout_minutes": idle_timeout_minutes,
-            "absolute_timeout_minutes": absolute_timeout_minutes,
-            "warning_before_timeout_minutes": warning_before_timeout_minutes,
-        }
-        return self._request("POST", "/sessions/timeout-rules", data={k: v for k, v in data.items() if v is not None})
-
-    def revoke_session(self, session_id: str) -> Dict[str, Any]:
-        """Revoke a session"""
-        return self._request("POST", "/sessions/revoke", data={"session_id": session_id})
-
-    # ========== QR ATTENDANCE ==========
-
-    def get_active_qr_code(self, session_id: str) -> Dict[str, Any]:
-        """Get active QR code for a session"""
-        return self._request("GET", f"/qr-attendance/active/{session_id}")
-
-    def deactivate_qr_code(self, qr_code_id: str) -> Dict[str, Any]:
-        """Deactivate a QR code"""
-        return self._request("POST", f"/qr-attendance/deactivate/{qr_code_id}")
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> "Artifact":
+        """
+        Generate a document and download it, or serve it from the document store
+
+        Requires a client created with ``document_store``. A document already
+        generated from the same template version, format and variables is
+        returned from disk without calling the API.
 
+        Args:
+            template_id: Template ID
+            template_version: Version of the template, e.g. its updated_at;
+                part of the key, so edited templates are generated again
+            format: pdf or docx (default: pdf)
+            variables: Template variables
+            chunk_size: Bytes read from the network per chunk (default: 64 KiB)
+
+        Returns:
+            Artifact (key, path, size); ``artifact.open()`` maps the file
+        """
+        store = self.document_store
+        if store is None:
+            raise ValueError("fetch_document requires a client created with document_store")
+        key = store.key(template_id, template_version, format, variables)
+        artifact = store.get(key)
+        if artifact is not None:
+            store.record("hits")
+            return artifact
+
+        def generate() -> "Artifact":
+            response = self.generate_document(template_id, format=format, variables=variables)
+            url, headers = self._download_target(response)
+            with store.writer(key) as f:
+                size = self._download(url, headers, f, chunk_size)
+            store.record("misses")
+            from .artifacts import Artifact
+
+            return Artifact(key, store.path(key), size)
+
+        if self._singleflight is None:
+            return generate()
+        return self._singleflight.do(f"document:{key}", generate)
+
+    def _download(self, url: str, headers: Dict[str, str], fileobj: BinaryIO, chunk_size: int) -> int:
+        """Stream a generated file to ``fileobj``"""
+        try:
+            response = self.session.get(url, headers=headers, stream=True, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            raise EDUZENNetworkError(message=str(e))
+        try:
+            if response.status_code >= 400:
+                raise EDUZENAPIError(
+                    message="Document download failed",
+                    code=f"HTTP_{response.status_code}",
+                    status_code=response.status_code,
+                )
+            return self._copy_stream(response, fileobj, chunk_size)
+        finally:
+            response.close()
+
+    @staticmethod
+    def _copy_stream(response: requests.Response, fileobj: BinaryIO, chunk_size: int) -> int:
+        """Copy a streamed response body to a file in chunks"""
+        written = 0
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                fileobj.write(chunk)
+                written += len(chunk)
+        except requests.exceptions.RequestException as e:
+            raise EDUZENNetworkError(message=str(e))
+        return written
@@ -0,0 +1,92 @@
+"""
+EDUZEN API JSON codecs
+"""
+
+import json
+from typing import Any, Optional, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class JSONCodec:
+    """Standard library JSON codec (always available)"""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object to UTF-8 JSON bytes"""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: Buffer) -> Any:
+        """Decode JSON from bytes"""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """orjson codec: decodes straight from the response bytes"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, option=self._options)
+
+    def loads(self, data: Buffer) -> Any:
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """ujson codec"""
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+
+        self._ujson = ujson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: Buffer) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return self._ujson.loads(data)
+
+
+# Fastest first
+_CODECS = {
+    "orjson": OrjsonCodec,
+    "ujson": UjsonCodec,
+    "json": JSONCodec,
+}
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    Get a JSON codec
+
+    Args:
+        name: "orjson", "ujson" or "json"; the fastest installed one when omitted
+
+    Raises:
+        ImportError: The requested library is not installed
+    """
+    if name is not None:
+        if name not in _CODECS:
+            raise ValueError(f"Unknown JSON codec: {name}")
+        return _CODECS[name]()
+
+    for codec_class in _CODECS.values():
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+    return JSONCodec()
@@ -0,0 +1,157 @@
+"""
+EDUZEN API call deadlines and hedged requests
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, Optional
+
+from .metrics import LatencyHistogram
+
+# Absolute time.monotonic() deadline of the enclosing deadline() block
+_scoped: ContextVar[Optional[float]] = ContextVar("eduzen_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """
+    Bound every API call made inside the block by one shared budget
+
+    The budget covers rate-limit waits, connection, response and retries of
+    all calls together. Nested blocks can only shorten the deadline. The
+    deadline follows the context: it applies to asyncio tasks created inside
+    the block and to the bulk helpers, but not to threads started by hand.
+
+    Usage:
+        with deadline(2.0):
+            client.get_active_qr_code(session_id)
+            client.scan_qr_code(qr_code, student_id)
+
+    Yields:
+        The absolute time.monotonic() deadline
+    """
+    absolute = time.monotonic() + seconds
+    current = _scoped.get()
+    if current is not None:
+        absolute = min(absolute, current)
+    token = _scoped.set(absolute)
+    try:
+        yield absolute
+    finally:
+        _scoped.reset(token)
+
+
+def resolve_deadline(seconds: Optional[float]) -> Optional[float]:
+    """
+    Absolute deadline of a call given its own budget in seconds
+
+    Returns:
+        time.monotonic() deadline, the earliest of the call budget and the
+        enclosing deadline() block, or None when neither is set
+    """
+    scoped = _scoped.get()
+    if seconds is None:
+        return scoped
+    absolute = time.monotonic() + seconds
+    return absolute if scoped is None else min(absolute, scoped)
+
+
+def remaining(absolute: Optional[float]) -> Optional[float]:
+    """Seconds left before an absolute deadline, None when unbounded"""
+    if absolute is None:
+        return None
+    return absolute - time.monotonic()
+
+
+class HedgePolicy:
+    """
+    Hedging of idempotent reads
+
+    When the first attempt of a GET has not answered after the endpoint's
+    observed ``percentile`` latency, a second identical request is sent and
+    the first response to arrive is used. Only the slowest few percent of
+    calls are hedged, and a budget caps hedges to ``budget_ratio`` of the
+    calls, so the extra load stays small even when the API slows down as a
+    whole.
+
+    Latencies are learnt per endpoint from completed attempts; an endpoint
+    is not hedged before ``min_samples`` of them were seen.
+    """
+
+    def __init__(
+        self,
+        endpoints: Optional[Iterable[str]] = None,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        min_delay: float = 0.01,
+        budget_ratio: float = 0.1,
+        budget_min: int = 5,
+        precision: float = 0.05,
+    ):
+        """
+        Args:
+            endpoints: Endpoint templates to hedge, e.g. "/qr-attendance/active/{session_id}"
+                (default: every GET)
+            percentile: Latency after which a hedge is sent (default: 0.95)
+            min_samples: Attempts observed before an endpoint is hedged (default: 20)
+            min_delay: Lower bound of the hedge delay in seconds (default: 0.01)
+            budget_ratio: Hedges allowed per call (default: 0.1)
+            budget_min: Burst of hedges allowed before budget_ratio applies (default: 5)
+            precision: Relative precision of the latency histograms (default: 0.05)
+        """
+        self.endpoints = frozenset(endpoints) if endpoints is not None else None
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.budget_ratio = budget_ratio
+        self.budget_min = budget_min
+        self.precision = precision
+
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, LatencyHistogram] = {}
+        self._tokens = float(budget_min)
+        self.hedged = 0
+        self.won = 0
+
+    def applies(self, endpoint: str) -> bool:
+        """Whether GETs to this endpoint may be hedged"""
+        return self.endpoints is None or endpoint in self.endpoints
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """
+        Register a call and compute when to hedge it
+
+        Returns:
+            Seconds to wait for the first attempt before hedging, or None
+            while too few latencies are known
+        """
+        with self._lock:
+            self._tokens = min(self._tokens + self.budget_ratio, float(self.budget_min))
+            latency = self._latencies.get(endpoint)
+            if latency is None or latency.count < self.min_samples:
+                return None
+            return max(self.min_delay, latency.percentile(self.percentile))
+
+    def acquire(self) -> bool:
+        """Take a hedge from the budget; False when it is spent"""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedged += 1
+            return True
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        """Record the latency of a completed attempt"""
+        with self._lock:
+            latency = self._latencies.get(endpoint)
+            if latency is None:
+                latency = self._latencies[endpoint] = LatencyHistogram(self.precision)
+            latency.record(seconds)
+
+    def record_win(self) -> None:
+        """Count a call answered by its hedge"""
+        with self._lock:
+            self.won += 1
@@ -0,0 +1,59 @@
+"""
+EDUZEN API batch document helpers
+"""
+
+import zipfile
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, NamedTuple, Optional
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Keys of the /documents/generate response holding the file URL, by preference
+DOCUMENT_URL_KEYS = ("downloadUrl", "file_url", "url")
+
+
+class BatchDocument(NamedTuple):
+    """One generated document read from a batch ZIP archive"""
+
+    filename: str
+    content: bytes
+
+
+def batch_payload(
+    template_id: str,
+    items: Iterable[Dict[str, Any]],
+    format: str,
+    zip_filename: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build the /documents/generate-batch request body"""
+    data = {
+        "template_id": template_id,
+        "format": format.upper(),
+        "items": list(items),
+        "zip_filename": zip_filename,
+    }
+    return {k: v for k, v in data.items() if v is not None}
+
+
+def document_url(response: Dict[str, Any]) -> Optional[str]:
+    """URL of the file in a /documents/generate response, if any"""
+    for source in (response, response.get("document") or {}):
+        for key in DOCUMENT_URL_KEYS:
+            url = source.get(key)
+            if isinstance(url, str) and url:
+                return url
+    return None
+
+
+def iter_zip_members(fileobj: BinaryIO) -> Iterator[BatchDocument]:
+    """
+    Read the members of a ZIP archive one at a time
+
+    Only the member being yielded is held in memory; the archive itself
+    stays in ``fileobj`` (typically a temporary file on disk).
+    """
+    with zipfile.ZipFile(fileobj) as archive:
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            with archive.open(info) as member:
+                yield BatchDocument(filename=info.filename, content=member.read())
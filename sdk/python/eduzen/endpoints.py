@@ -0,0 +1,480 @@
+"""
+EDUZEN API endpoints shared by the sync and async clients
+"""
+
+import hashlib
+from typing import ContextManager, Optional, Dict, Any, Callable, Iterable, Tuple, Union
+from urllib.parse import urljoin, urlsplit
+
+from .deadline import deadline, remaining, resolve_deadline
+from .documents import document_url
+from .exceptions import EDUZENAPIError, EDUZENTimeoutError
+from .metrics import RequestEvent
+from .ratelimit import RateLimitBudget
+from .retry import new_idempotency_key
+
+
+class EDUZENEndpoints:
+    """
+    API methods shared by EDUZENClient and AsyncEDUZENClient
+
+    Every method delegates to ``self._request``; with the async client the
+    returned value is an awaitable resolving to the response data.
+    """
+
+    def _build_headers(self) -> Dict[str, str]:
+        """Build authentication and content headers"""
+        headers = {
+            "Content-Type": "application/json",
+        }
+
+        if self.api_key:
+            headers["X-API-Key"] = self.api_key
+
+        if self.access_token:
+            headers["Cookie"] = f"sb-access-token={self.access_token}"
+
+        return headers
+
+    def encode_body(self, data: Optional[Union[Dict[str, Any], bytes]]) -> Optional[bytes]:
+        """
+        Encode a request body with the client's JSON codec
+
+        Bytes are passed through untouched, so hot loops can encode a payload
+        once and send it many times through ``request``.
+        """
+        if data is None or isinstance(data, (bytes, bytearray, memoryview)):
+            return data
+        return self.codec.dumps(data)
+
+    @property
+    def _identity(self) -> str:
+        """Digest of the credentials, so cached or shared responses never cross users"""
+        raw = f"{self.api_key or ''}\n{self.access_token or ''}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _request_key(self, path: str, params: Optional[Dict[str, Any]]) -> str:
+        """Identity of a GET, shared by request coalescing and the response cache"""
+        from .cache import ResponseCache
+
+        return ResponseCache.key("GET", path, params, self._identity)
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of GET calls served by joining an identical in-flight request"""
+        return self._singleflight.coalesced if self._singleflight is not None else 0
+
+    @property
+    def rate_limit(self) -> RateLimitBudget:
+        """Rate limit budget last reported by the API for this client's key"""
+        return self.rate_limiter.budget
+
+    def add_hook(self, name: str, hook: Callable[[RequestEvent], None]) -> None:
+        """
+        Register a request hook
+
+        Args:
+            name: "before_request", "after_response" or "on_error"
+            hook: Called with the RequestEvent; runs on the calling thread, so
+                it should be fast and must not raise
+        """
+        self.hooks.add(name, hook)
+
+    def remove_hook(self, name: str, hook: Callable[[RequestEvent], None]) -> None:
+        """Unregister a request hook"""
+        self.hooks.remove(name, hook)
+
+    def deadline(self, seconds: float) -> ContextManager[float]:
+        """
+        Bound every call made inside a ``with`` block by one budget
+
+        Covers rate-limit waits, connection, response and retries of all the
+        calls of the block together; see eduzen.deadline.deadline.
+
+        Usage:
+            with client.deadline(2.0):
+                client.scan_qr_code(qr_code, student_id)
+        """
+        return deadline(seconds)
+
+    def _call_deadline(self, endpoint: str, seconds: Optional[float]) -> Optional[float]:
+        """Absolute deadline of a call: its own budget, else its endpoint's, capped by deadline()"""
+        if seconds is None:
+            seconds = self.deadlines.get(endpoint)
+        return resolve_deadline(seconds)
+
+    @staticmethod
+    def _budget(event: RequestEvent, wait: float = 0.0) -> Optional[float]:
+        """
+        Seconds left for the call once ``wait`` seconds have passed
+
+        Raises:
+            EDUZENTimeoutError: The deadline would be reached first
+        """
+        left = remaining(event.deadline)
+        if left is None:
+            return None
+        left -= wait
+        if left <= 0:
+            raise EDUZENTimeoutError(message=f"Deadline exceeded for {event.method} {event.endpoint}")
+        return left
+
+    def _download_target(self, response: Dict[str, Any]) -> Tuple[str, Dict[str, str]]:
+        """URL of a generated document and the headers to download it with"""
+        url = document_url(response)
+        if url is None:
+            raise EDUZENAPIError(message="Generated document has no download URL", code="NO_DOCUMENT_URL")
+        url = urljoin(f"{self.base_url}/", url)
+        # Storage URLs are signed: credentials are only sent to the API's own host
+        if urlsplit(url)[:2] != urlsplit(self.base_url)[:2]:
+            return url, {}
+        headers = self._build_headers()
+        del headers["Content-Type"]
+        return url, headers
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Union[Dict[str, Any], bytes]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Call any API endpoint
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path, e.g. "/v1/students"
+            data: Request body data, or JSON bytes from encode_body()
+            params: Query parameters
+            deadline: Seconds allowed for the call, retries included
+                (default: the endpoint's entry in ``deadlines``, if any)
+        """
+        return self._request(method, path, data=data, params=params, deadline=deadline)
+
+    # ========== 2FA ==========
+
+    def generate_2fa_secret(self) -> Dict[str, Any]:
+        """Generate 2FA secret and QR code"""
+        return self._request("POST", "/2fa/generate-secret")
+
+    def verify_2fa_activation(self, code: str) -> Dict[str, Any]:
+        """Verify 2FA activation code"""
+        return self._request("POST", "/2fa/verify-activation", data={"code": code})
+
+    # ========== USERS ==========
+
+    def create_user(
+        self,
+        email: str,
+        full_name: str,
+        organization_id: str,
+        phone: Optional[str] = None,
+        password: Optional[str] = None,
+        role: Optional[str] = None,
+        is_active: bool = True,
+        send_invitation: bool = False,
+    ) -> Dict[str, Any]:
+        """Create a new user"""
+        data = {
+            "email": email,
+            "full_name": full_name,
+            "organization_id": organization_id,
+            "phone": phone,
+            "password": password,
+            "role": role,
+            "is_active": is_active,
+            "send_invitation": send_invitation,
+        }
+        return self._request(
+            "POST", "/users/create", data={k: v for k, v in data.items() if v is not None}, model=("User", "user")
+        )
+
+    # ========== STUDENTS ==========
+
+    def get_students(
+        self,
+        organization_id: str,
+        page: int = 1,
+        limit: int = 10,
+        search: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Get all students"""
+        params = {
+            "organization_id": organization_id,
+            "page": page,
+            "limit": limit,
+        }
+        if search:
+            params["search"] = search
+        return self._request("GET", "/v1/students", params=params, model=("Student", "data"))
+
+    # ========== PAYMENTS ==========
+
+    def create_stripe_intent(
+        self,
+        amount: int,
+        customer_email: str,
+        currency: str = "EUR",
+        description: Optional[str] = None,
+        customer_name: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        return_url: Optional[str] = None,
+        cancel_url: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Create Stripe payment intent (retry-safe: an Idempotency-Key is generated if not given)"""
+        data = {
+            "amount": amount,
+            "currency": currency,
+            "customer_email": customer_email,
+            "description": description,
+            "customer_name": customer_name,
+            "metadata": metadata,
+            "return_url": return_url,
+            "cancel_url": cancel_url,
+        }
+        return self._request(
+            "POST",
+            "/payments/stripe/create-intent",
+            data={k: v for k, v in data.items() if v is not None},
+            idempotency_key=idempotency_key or new_idempotency_key(),
+            model=("PaymentIntent", None),
+        )
+
+    def create_sepa_direct_debit(
+        self,
+        amount: float,
+        debtor_iban: str,
+        mandate_id: str,
+        creditor_id: str,
+        debtor_name: Optional[str] = None,
+        debtor_bic: Optional[str] = None,
+        reference: Optional[str] = None,
+        due_date: Optional[str] = None,
+        creditor_name: Optional[str] = None,
+        creditor_iban: Optional[str] = None,
+        currency: str = "EUR",
+        description: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Create SEPA direct debit (retry-safe: an Idempotency-Key is generated if not given)"""
+        data = {
+            "amount": amount,
+            "currency": currency,
+            "description": description,
+            "debtor_name": debtor_name,
+            "debtor_iban": debtor_iban,
+            "debtor_bic": debtor_bic,
+            "reference": reference,
+            "due_date": due_date,
+            "mandate_id": mandate_id,
+            "creditor_name": creditor_name,
+            "creditor_iban": creditor_iban,
+            "creditor_id": creditor_id,
+        }
+        return self._request(
+            "POST",
+            "/payments/sepa/create-direct-debit",
+            data={k: v for k, v in data.items() if v is not None},
+            idempotency_key=idempotency_key or new_idempotency_key(),
+        )
+
+    def initiate_mobile_money(
+        self,
+        provider: str,
+        amount: int,
+        phone_number: str,
+        currency: str = "XOF",
+        description: Optional[str] = None,
+        invoice_id: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Initiate Mobile Money payment (retry-safe: an Idempotency-Key is generated if not given)"""
+        data = {
+            "provider": provider,
+            "amount": amount,
+            "currency": currency,
+            "phone_number": phone_number,
+            "description": description,
+            "invoice_id": invoice_id,
+        }
+        return self._request(
+            "POST",
+            "/mobile-money/initiate",
+            data={k: v for k, v in data.items() if v is not None},
+            idempotency_key=idempotency_key or new_idempotency_key(),
+        )
+
+    # ========== DOCUMENTS ==========
+
+    def generate_document(
+        self,
+        template_id: str,
+        format: str = "pdf",
+        variables: Optional[Dict[str, Any]] = None,
+        send_email: bool = False,
+        email_to: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Generate document from template"""
+        data = {
+            "template_id": template_id,
+            "format": format,
+            "variables": variables,
+            "send_email": send_email,
+            "email_to": email_to,
+        }
+        return self._request("POST", "/documents/generate", data={k: v for k, v in data.items() if v is not None})
+
+    # ========== QR ATTENDANCE ==========
+
+    def generate_qr_code(
+        self,
+        session_id: str,
+        duration_minutes: int = 15,
+        max_scans: Optional[int] = None,
+        require_location: bool = False,
+        allowed_radius_meters: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Generate QR code for session"""
+        data = {
+            "session_id": session_id,
+            "duration_minutes": duration_minutes,
+            "max_scans": max_scans,
+            "require_location": require_location,
+            "allowed_radius_meters": allowed_radius_meters,
+        }
+        return self._request(
+            "POST",
+            "/qr-attendance/generate",
+            data={k: v for k, v in data.items() if v is not None},
+            model=("QRCode", "qr_code"),
+        )
+
+    def scan_qr_code(
+        self,
+        qr_code: str,
+        student_id: str,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Scan QR code for attendance"""
+        data = {
+            "qr_code": qr_code,
+            "student_id": student_id,
+            "latitude": latitude,
+            "longitude": longitude,
+        }
+        return self._request("POST", "/qr-attendance/scan", data={k: v for k, v in data.items() if v is not None})
+
+    # ========== COMPLIANCE ==========
+
+    def check_compliance_alerts(self) -> Dict[str, Any]:
+        """Check compliance alerts"""
+        return self._request("POST", "/compliance/alerts/check")
+
+    # ========== SESSIONS ==========
+
+    def get_active_sessions(self) -> Dict[str, Any]:
+        """Get active sessions"""
+        return self._request("GET", "/sessions/active", model=("Session", "sessions"))
+
+    def configure_timeout_rules(
+        self,
+        organization_id: str,
+        idle_timeout_minutes: Optional[int] = None,
+        absolute_timeout_minutes: Optional[int] = None,
+        warning_before_timeout_minutes: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Configure session timeout rules"""
+        data = {
+            "organization_id": organization_id,
+            "idle_timeout_minutes": idle_timeout_minutes,
+            "absolute_timeout_minutes": absolute_timeout_minutes,
+            "warning_before_timeout_minutes": warning_before_timeout_minutes,
+        }
+        return self._request("POST", "/sessions/timeout-rules", data={k: v for k, v in data.items() if v is not None})
+
+    def revoke_session(self, session_id: str) -> Dict[str, Any]:
+        """Revoke a session"""
+        return self._request("POST", "/sessions/revoke", data={"session_id": session_id})
+
+    # ========== QR ATTENDANCE ==========
+
+    def get_active_qr_code(self, session_id: str) -> Dict[str, Any]:
+        """Get active QR code for a session"""
+        return self._request(
+            "GET",
+            f"/qr-attendance/active/{session_id}",
+            endpoint="/qr-attendance/active/{session_id}",
+            model=("QRCode", "qr_code"),
+        )
+
+    def deactivate_qr_code(self, qr_code_id: str) -> Dict[str, Any]:
+        """Deactivate a QR code"""
+        return self._request(
+            "POST", f"/qr-attendance/deactivate/{qr_code_id}", endpoint="/qr-attendance/deactivate/{qr_code_id}"
+        )
+
+    # ========== BULK ==========
+
+    def create_users_bulk(
+        self,
+        users: Iterable[Dict[str, Any]],
+        concurrency: int = 8,
+        ordered: bool = False,
+    ):
+        """
+        Create many users concurrently
+
+        Args:
+            users: Iterable of create_user keyword dicts (read lazily)
+            concurrency: Maximum calls in flight; keep it <= pool_maxsize (default: 8)
+            ordered: Yield results in input order instead of completion order
+
+        Returns:
+            Iterator (async iterator for AsyncEDUZENClient) of BulkResult
+        """
+        return self._bulk(lambda user: self.create_user(**user), users, concurrency, ordered)
+
+    def scan_qr_codes_bulk(
+        self,
+        scans: Iterable[Dict[str, Any]],
+        concurrency: int = 8,
+        ordered: bool = False,
+    ):
+        """
+        Record many QR code scans concurrently
+
+        Args:
+            scans: Iterable of scan_qr_code keyword dicts (read lazily)
+            concurrency: Maximum calls in flight; keep it <= pool_maxsize (default: 8)
+            ordered: Yield results in input order instead of completion order
+
+        Returns:
+            Iterator (async iterator for AsyncEDUZENClient) of BulkResult
+        """
+        return self._bulk(lambda scan: self.scan_qr_code(**scan), scans, concurrency, ordered)
+
+    def create_sepa_direct_debits_bulk(
+        self,
+        debits: Iterable[Dict[str, Any]],
+        concurrency: int = 8,
+        ordered: bool = False,
+    ):
+        """
+        Create many SEPA direct debits concurrently
+
+        Pass an ``idempotency_key`` per debit to make a re-run safe; see
+        eduzen.sepa.CollectionRun for local validation and a result ledger.
+
+        Args:
+            debits: Iterable of create_sepa_direct_debit keyword dicts (read lazily)
+            concurrency: Maximum calls in flight; keep it <= pool_maxsize (default: 8)
+            ordered: Yield results in input order instead of completion order
+
+        Returns:
+            Iterator (async iterator for AsyncEDUZENClient) of BulkResult
+        """
+        return self._bulk(lambda debit: self.create_sepa_direct_debit(**debit), debits, concurrency, ordered)
@@ -8,7 +8,9 @@ from typing import Optional, Dict, Any
 class EDUZENError(Exception):
     """Base exception for EDUZEN SDK"""
 
-    pass
+    # Set by the client once the call has failed
+    request_id: Optional[str] = None
+    elapsed: Optional[float] = None
 
 
 class EDUZENAPIError(EDUZENError):
@@ -35,3 +37,6 @@ class EDUZENNetworkError(EDUZENError):
         self.message = message
         super().__init__(message)
 
+
+class EDUZENTimeoutError(EDUZENNetworkError):
+    """Call deadline exceeded before a response was received"""
@@ -0,0 +1,380 @@
+"""
+EDUZEN streaming exports
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .models import Model, Student
+
+FORMATS = ("csv", "jsonl", "parquet")
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+# Parquet part files (and their in-progress .tmp) inside an export directory
+_PART_RE = re.compile(r"part-(\d{5})\.parquet(?:\.tmp)?$")
+
+# Student fields in CSV/Parquet column order; nested values are written as JSON
+DEFAULT_COLUMNS: Tuple[str, ...] = Student._keys
+
+
+class ExportResult(NamedTuple):
+    """Outcome of an export"""
+
+    path: str
+    rows: int
+    pages: int
+    resumed_from_page: int
+    bytes_written: int
+
+
+def infer_format(path: str) -> str:
+    """Export format from a file name (students.csv.gz -> "csv"), csv by default"""
+    name = path.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    for fmt in FORMATS:
+        if name.endswith(f".{fmt}"):
+            return fmt
+    if name.endswith(".ndjson"):
+        return "jsonl"
+    return "csv"
+
+
+def _cell(value: Any) -> Optional[str]:
+    """Flatten a field for CSV/Parquet: nested objects and lists become JSON"""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, Model):
+        value = value.to_dict()
+    if isinstance(value, (dict, list, bool)):
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return str(value)
+
+
+class _TextWriter:
+    """
+    CSV or JSON Lines through a fixed-size buffer, optionally gzipped
+
+    With gzip, every checkpoint ends a gzip member and the next page opens a
+    new one; concatenated members form a valid gzip file, so an interrupted
+    export can be truncated back to the last checkpoint and appended to.
+    """
+
+    def __init__(self, path: str, fmt: str, compress: bool, buffer_size: int, columns: Sequence[str], codec: Any):
+        self.path = path
+        self.fmt = fmt
+        self.compress = compress
+        self.columns = list(columns)
+        self.codec = codec
+        self._raw = None
+        self._buffer: Optional[io.BufferedWriter] = None
+        self._buffer_size = buffer_size
+        self._member: Optional[gzip.GzipFile] = None
+        self._text: Optional[io.TextIOWrapper] = None
+        self._csv = None
+
+    def open(self, offset: int) -> None:
+        """Open for writing, truncating anything after ``offset``"""
+        self._raw = open(self.path, "r+b" if offset else "wb", buffering=0)
+        self._raw.truncate(offset)
+        self._raw.seek(offset)
+        self._buffer = io.BufferedWriter(self._raw, buffer_size=self._buffer_size)
+        if self.fmt == "csv" and offset == 0:
+            self._stream()
+            self._csv.writerow(self.columns)
+
+    def _stream(self) -> Any:
+        """Current output stream, opening a gzip member if needed"""
+        if self.compress and self._member is None:
+            self._member = gzip.GzipFile(fileobj=self._buffer, mode="wb", compresslevel=6)
+        target = self._member if self.compress else self._buffer
+        if self.fmt == "csv" and self._text is None:
+            # write_through: the fixed-size buffer below is the only one
+            self._text = io.TextIOWrapper(target, encoding="utf-8", newline="", write_through=True)
+            self._csv = csv.writer(self._text)
+        return target
+
+    def write_page(self, records: List[Dict[str, Any]]) -> None:
+        stream = self._stream()
+        if self.fmt == "csv":
+            columns = self.columns
+            self._csv.writerows([_cell(record.get(c)) for c in columns] for record in records)
+        else:
+            dumps = self.codec.dumps
+            stream.write(b"".join(dumps(record) + b"\n" for record in records))
+
+    def checkpoint(self) -> int:
+        """Make everything written so far durable; returns the file offset to resume from"""
+        if self._text is not None:
+            self._text.flush()
+            self._text.detach()
+            self._text = None
+            self._csv = None
+        if self._member is not None:
+            self._member.close()
+            self._member = None
+        self._buffer.flush()
+        os.fsync(self._raw.fileno())
+        return self._raw.tell()
+
+    def close(self) -> None:
+        if self._text is not None:
+            self._text.detach()
+            self._text = None
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+
+
+class _ParquetWriter:
+    """
+    Parquet parts in a directory, one per checkpoint
+
+    A Parquet file cannot be appended to once closed, so the export is a
+    dataset directory (``part-00000.parquet``, ...) that pyarrow, pandas and
+    DuckDB read as one table. Rows are held in memory only until the next
+    checkpoint.
+    """
+
+    def __init__(self, path: str, compress: bool, columns: Sequence[str]):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet export requires pyarrow: pip install eduzen-sdk[columnar]")
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.path = path
+        self.compression = "gzip" if compress else "snappy"
+        self.columns = list(columns)
+        self._schema = pyarrow.schema([(c, pyarrow.string()) for c in self.columns])
+        self._rows: List[Dict[str, Any]] = []
+        self._part = 0
+
+    @staticmethod
+    def _part_number(name: str) -> Optional[int]:
+        """Part number of one of this writer's files, None for anything else"""
+        match = _PART_RE.match(name)
+        return int(match.group(1)) if match else None
+
+    def foreign_files(self) -> List[str]:
+        """Entries in the output directory that this writer did not create"""
+        try:
+            names = os.listdir(self.path)
+        except FileNotFoundError:
+            return []
+        return sorted(name for name in names if self._part_number(name) is None)
+
+    def open(self, offset: int) -> None:
+        """Open for writing, removing parts after part number ``offset``"""
+        os.makedirs(self.path, exist_ok=True)
+        self._part = offset
+        for name in os.listdir(self.path):
+            number = self._part_number(name)
+            if number is not None and number >= offset:
+                os.remove(os.path.join(self.path, name))
+
+    def size(self) -> int:
+        return sum(
+            os.path.getsize(os.path.join(self.path, name))
+            for name in os.listdir(self.path)
+            if self._part_number(name) is not None
+        )
+
+    def write_page(self, records: List[Dict[str, Any]]) -> None:
+        columns = self.columns
+        self._rows.extend({c: _cell(record.get(c)) for c in columns} for record in records)
+
+    def checkpoint(self) -> int:
+        if self._rows:
+            table = self._pa.Table.from_pylist(self._rows, schema=self._schema)
+            final = os.path.join(self.path, f"part-{self._part:05d}.parquet")
+            self._pq.write_table(table, final + ".tmp", compression=self.compression)
+            os.replace(final + ".tmp", final)
+            self._rows = []
+            self._part += 1
+        return self._part
+
+    def close(self) -> None:
+        self._rows = []
+
+
+def _iter_pages(
+    client: Any, organization_id: str, page_size: int, start_page: int, search: Optional[str]
+) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+    """Yield (page number, records), fetching page N+1 while page N is written"""
+
+    def fetch(page: int) -> List[Dict[str, Any]]:
+        response = client.get_students(organization_id=organization_id, page=page, limit=page_size, search=search)
+        return [r.to_dict() if isinstance(r, Model) else r for r in response.get("data") or []]
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="eduzen-export")
+    pending = None
+    try:
+        page = start_page
+        pending = executor.submit(fetch, page)
+        while pending is not None:
+            records = pending.result()
+            pending = None
+            if len(records) >= page_size:
+                pending = executor.submit(fetch, page + 1)
+            yield page, records
+            page += 1
+    finally:
+        if pending is not None:
+            pending.cancel()
+        executor.shutdown(wait=True)
+
+
+def _load_checkpoint(path: str, expected: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            state = json.load(fh)
+    except FileNotFoundError:
+        return None
+    for key, value in expected.items():
+        if state.get(key) != value:
+            raise ValueError(
+                f"Checkpoint {path} was written with {key}={state.get(key)!r}, not {value!r};"
+                " delete it or pass resume=False to start over"
+            )
+    return state
+
+
+def _size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        return -1
+
+
+def _save_checkpoint(path: str, state: Dict[str, Any]) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(state, fh)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
+def export_students(
+    client: Any,
+    organization_id: str,
+    path: str,
+    format: Optional[str] = None,
+    compress: bool = False,
+    columns: Optional[Sequence[str]] = None,
+    search: Optional[str] = None,
+    page_size: int = 500,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    checkpoint_every: int = 10,
+    resume: bool = True,
+) -> ExportResult:
+    """
+    Stream an organization's students to a CSV, JSON Lines or Parquet export
+
+    Pages go straight from the API to the file through a fixed-size buffer;
+    at most two pages (or, for Parquet, one checkpoint interval) are held in
+    memory. Every ``checkpoint_every`` pages the output is flushed to disk
+    and ``<path>.checkpoint`` records the last completed page, so a rerun
+    after an interruption resumes from there. The checkpoint file is removed
+    once the export completes.
+
+    Args:
+        client: EDUZENClient
+        organization_id: Organization ID
+        path: Output file (a directory for Parquet)
+        format: "csv", "jsonl" or "parquet" (default: inferred from path, else csv)
+        compress: gzip CSV/JSON Lines output; gzip instead of snappy for Parquet
+        columns: CSV/Parquet columns (default: Student fields); JSON Lines
+            always holds complete records
+        search: Optional search filter
+        page_size: Records per request (default: 500)
+        buffer_size: Write buffer size in bytes (default: 1 MiB)
+        checkpoint_every: Pages between checkpoints (default: 10)
+        resume: Continue from an existing checkpoint (default: True)
+
+    Returns:
+        ExportResult
+
+    Raises:
+        ValueError: Invalid arguments, a checkpoint from a different export,
+            or a Parquet directory holding files the export did not write
+        ImportError: Parquet requested without pyarrow installed
+    """
+    fmt = format or infer_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt} (expected one of {', '.join(FORMATS)})")
+    if page_size < 1 or checkpoint_every < 1:
+        raise ValueError("page_size and checkpoint_every must be >= 1")
+    columns = tuple(columns or DEFAULT_COLUMNS)
+
+    if fmt == "parquet":
+        writer: Any = _ParquetWriter(path, compress, columns)
+    else:
+        writer = _TextWriter(path, fmt, compress, buffer_size, columns, client.codec)
+
+    checkpoint_path = f"{path}.checkpoint"
+    expected = {
+        "organization_id": organization_id,
+        "format": fmt,
+        "compress": compress,
+        "columns": list(columns),
+        "search": search,
+        "page_size": page_size,
+    }
+    state = _load_checkpoint(checkpoint_path, expected) if resume else None
+    if state is not None and fmt != "parquet" and _size(path) < state["offset"]:
+        # Output removed or truncated since the checkpoint: start over
+        state = None
+    if state is None:
+        state = dict(expected, page=0, offset=0, rows=0)
+        if fmt == "parquet":
+            foreign = writer.foreign_files()
+            if foreign:
+                raise ValueError(
+                    f"{path} already contains files not written by an export ({', '.join(foreign[:3])}"
+                    f"{', ...' if len(foreign) > 3 else ''}); choose an empty or new directory"
+                )
+    resumed_from = state["page"]
+
+    rows = state["rows"]
+    last_page = state["page"]
+    writer.open(state["offset"])
+    try:
+        pages_since_checkpoint = 0
+        for page, records in _iter_pages(client, organization_id, page_size, last_page + 1, search):
+            writer.write_page(records)
+            rows += len(records)
+            last_page = page
+            pages_since_checkpoint += 1
+            if pages_since_checkpoint >= checkpoint_every:
+                offset = writer.checkpoint()
+                _save_checkpoint(checkpoint_path, dict(expected, page=last_page, offset=offset, rows=rows))
+                pages_since_checkpoint = 0
+        offset = writer.checkpoint()
+    finally:
+        writer.close()
+
+    try:
+        os.remove(checkpoint_path)
+    except FileNotFoundError:
+        pass
+
+    if fmt == "parquet":
+        size = writer.size()
+    else:
+        size = offset
+    return ExportResult(
+        path=path,
+        rows=rows,
+        pages=last_page - resumed_from,
+        resumed_from_page=resumed_from,
+        bytes_written=size,
+    )
@@ -0,0 +1,245 @@
+"""
+EDUZEN QR attendance scan precheck
+"""
+
+import math
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence
+
+# Mean Earth radius used by the API's haversine check, in meters
+EARTH_RADIUS_METERS = 6371e3
+
+# Radius the API applies when a session sets none
+DEFAULT_RADIUS_METERS = 100
+
+MISSING_FIELD = "MISSING_FIELD"
+INVALID_COORDINATES = "INVALID_COORDINATES"
+LOCATION_REQUIRED = "LOCATION_REQUIRED"
+OUT_OF_RANGE = "OUT_OF_RANGE"
+DUPLICATE = "DUPLICATE"
+
+_MESSAGES = {
+    MISSING_FIELD: "qr_code and student_id are required",
+    INVALID_COORDINATES: "latitude and longitude must both be given, within [-90, 90] and [-180, 180]",
+    LOCATION_REQUIRED: "this QR code requires a location",
+    OUT_OF_RANGE: "scan is outside the allowed radius",
+    DUPLICATE: "same qr_code and student_id as an earlier scan of the batch",
+}
+
+
+class Geofence(NamedTuple):
+    """Where the scans of a QR code must be made"""
+
+    latitude: float
+    longitude: float
+    radius_meters: float = DEFAULT_RADIUS_METERS
+    require_location: bool = True
+
+
+class ScanRejection(NamedTuple):
+    """A scan the API would refuse, and why"""
+
+    index: int
+    scan: Dict[str, Any]
+    reason: str
+    distance: Optional[float] = None
+
+    @property
+    def message(self) -> str:
+        """Human-readable reason"""
+        if self.reason == OUT_OF_RANGE and self.distance is not None:
+            return f"{_MESSAGES[OUT_OF_RANGE]} ({round(self.distance)} m)"
+        return _MESSAGES[self.reason]
+
+
+class ScanPrecheck(NamedTuple):
+    """Outcome of validate_scans"""
+
+    scans: List[Dict[str, Any]]
+    indices: List[int]
+    rejections: List[ScanRejection]
+
+    @property
+    def ok(self) -> bool:
+        """Whether every scan passed"""
+        return not self.rejections
+
+
+def haversine(lat1: Any, lon1: Any, lat2: Any, lon2: Any) -> Any:
+    """
+    Great-circle distance in meters, the formula the API uses
+
+    Works element-wise on numpy arrays as well as on floats.
+    """
+    if isinstance(lat1, float):
+        sin, cos, atan2, sqrt = math.sin, math.cos, math.atan2, math.sqrt
+    else:
+        import numpy
+
+        sin, cos, atan2, sqrt = numpy.sin, numpy.cos, numpy.arctan2, numpy.sqrt
+    phi1 = lat1 * (math.pi / 180)
+    phi2 = lat2 * (math.pi / 180)
+    half_dphi = (lat2 - lat1) * (math.pi / 360)
+    half_dlambda = (lon2 - lon1) * (math.pi / 360)
+    a = sin(half_dphi) ** 2 + cos(phi1) * cos(phi2) * sin(half_dlambda) ** 2
+    return EARTH_RADIUS_METERS * 2 * atan2(sqrt(a), sqrt(1 - a))
+
+
+def validate_scans(scans: Sequence[Dict[str, Any]], geofences: Mapping[str, Geofence]) -> ScanPrecheck:
+    """
+    Find the scans of a batch the API would reject, without calling it
+
+    Checks that qr_code and student_id are present, that coordinates are
+    complete and in range, that QR codes requiring a location get one within
+    their geofence, and that a (qr_code, student_id) pair is only scanned
+    once. Distances are computed for the whole batch at once with numpy when
+    it is installed (``pip install eduzen-sdk[geo]``), row by row otherwise.
+
+    Usage:
+        precheck = validate_scans(scans, {"QR-1": Geofence(48.8566, 2.3522, radius_meters=150)})
+        for result in client.scan_qr_codes_bulk(precheck.scans):
+            row = precheck.indices[result.index]
+        for rejection in precheck.rejections:
+            print(rejection.index, rejection.reason, rejection.message)
+
+    Args:
+        scans: scan_qr_code keyword dicts
+        geofences: QR code -> Geofence; QR codes not listed are not geo-checked
+
+    Returns:
+        ScanPrecheck with the scans to send, their positions in ``scans`` and
+        one ScanRejection per refused scan, in input order
+    """
+    if not isinstance(scans, list):
+        scans = list(scans)
+    qr_codes = [scan.get("qr_code") for scan in scans]
+    student_ids = [scan.get("student_id") for scan in scans]
+    latitudes = [scan.get("latitude") for scan in scans]
+    longitudes = [scan.get("longitude") for scan in scans]
+    reasons: List[Optional[str]] = [
+        None if isinstance(qr_code, str) and qr_code and isinstance(student_id, str) and student_id else MISSING_FIELD
+        for qr_code, student_id in zip(qr_codes, student_ids)
+    ]
+    distances: List[Optional[float]] = [None] * len(scans)
+
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    check = _check_arrays if numpy is not None else _check_rows
+    check(qr_codes, latitudes, longitudes, geofences, reasons, distances)
+
+    accepted, indices, rejections = [], [], []
+    seen = set()
+    for i, reason in enumerate(reasons):
+        if reason is None:
+            pair = (qr_codes[i], student_ids[i])
+            if pair in seen:
+                reason = DUPLICATE
+            else:
+                seen.add(pair)
+                accepted.append(scans[i])
+                indices.append(i)
+                continue
+        rejections.append(ScanRejection(i, scans[i], reason, distances[i]))
+    return ScanPrecheck(accepted, indices, rejections)
+
+
+_PLAIN = frozenset({float, int, type(None)})
+
+
+def _coordinate(value: Any) -> float:
+    """NaN when missing, infinity (always out of range) when not a finite number"""
+    if value is None:
+        return math.nan
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        return math.inf
+    return float(value)
+
+
+def _coordinates(values: List[Any]) -> Any:
+    """Coordinates as a float array, with the same encoding as _coordinate"""
+    import numpy
+
+    # numpy would also accept bools and numeric strings: only plain numbers
+    # take the fast path, where None converts to NaN without a call per value
+    if set(map(type, values)) <= _PLAIN:
+        array = numpy.array(values, dtype=float)
+        for i in numpy.flatnonzero(~numpy.isfinite(array)).tolist():
+            if values[i] is not None:
+                array[i] = numpy.inf
+        return array
+    return numpy.array([_coordinate(value) for value in values], dtype=float)
+
+
+def _check_arrays(
+    qr_codes: List[Any],
+    latitudes: List[Any],
+    longitudes: List[Any],
+    geofences: Mapping[str, Geofence],
+    reasons: List[Optional[str]],
+    distances: List[Optional[float]],
+) -> None:
+    """Coordinate and geofence checks over the whole batch as numpy arrays"""
+    import numpy
+
+    # One row per geofence plus a last one for QR codes without any, so the
+    # per-scan columns are gathered with a single fancy index
+    fences = list(geofences.values())
+    position = {qr_code: i for i, qr_code in enumerate(geofences)}
+    rows = numpy.array([position.get(q, -1) if isinstance(q, str) else -1 for q in qr_codes], dtype=numpy.intp)
+    table = numpy.array(
+        [(f.latitude, f.longitude, f.radius_meters, bool(f.require_location)) for f in fences] + [(0, 0, 0, 0)],
+        dtype=float,
+    )
+    center_lat, center_lon, radius, required = table[rows].T
+    fenced = rows >= 0
+    required = required.astype(bool)
+
+    lat = _coordinates(latitudes)
+    lon = _coordinates(longitudes)
+    has_lat = ~numpy.isnan(lat)
+    has_lon = ~numpy.isnan(lon)
+    located = has_lat & has_lon
+    with numpy.errstate(invalid="ignore"):
+        invalid = (has_lat ^ has_lon) | (located & ((numpy.abs(lat) > 90) | (numpy.abs(lon) > 180)))
+        measured = fenced & located & ~invalid
+        distance = haversine(lat, lon, center_lat, center_lon)
+        out_of_range = measured & (distance > radius)
+    missing = required & ~has_lat & ~has_lon
+
+    # The masks are disjoint; a missing qr_code or student_id takes precedence
+    for reason, mask in ((OUT_OF_RANGE, out_of_range), (LOCATION_REQUIRED, missing), (INVALID_COORDINATES, invalid)):
+        for i in numpy.flatnonzero(mask).tolist():
+            if reasons[i] is None:
+                reasons[i] = reason
+                if reason == OUT_OF_RANGE:
+                    distances[i] = float(distance[i])
+
+
+def _check_rows(
+    qr_codes: List[Any],
+    latitudes: List[Any],
+    longitudes: List[Any],
+    geofences: Mapping[str, Geofence],
+    reasons: List[Optional[str]],
+    distances: List[Optional[float]],
+) -> None:
+    """Same checks as _check_arrays, one scan at a time (numpy not installed)"""
+    for i, (qr_code, lat, lon) in enumerate(zip(qr_codes, latitudes, longitudes)):
+        if reasons[i] is not None:
+            continue
+        lat, lon = _coordinate(lat), _coordinate(lon)
+        has_lat, has_lon = not math.isnan(lat), not math.isnan(lon)
+        fence = geofences.get(qr_code)
+        if has_lat != has_lon or (has_lat and (abs(lat) > 90 or abs(lon) > 180)):
+            reasons[i] = INVALID_COORDINATES
+        elif fence is None:
+            continue
+        elif not has_lat:
+            if fence.require_location:
+                reasons[i] = LOCATION_REQUIRED
+        else:
+            distance = haversine(lat, lon, float(fence.latitude), float(fence.longitude))
+            if distance > fence.radius_meters:
+                reasons[i] = OUT_OF_RANGE
+                distances[i] = distance
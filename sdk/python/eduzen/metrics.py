@@ -0,0 +1,244 @@
+"""
+EDUZEN API request instrumentation
+"""
+
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+HOOK_TYPES = ("before_request", "after_response", "on_error")
+
+
+class RequestEvent:
+    """
+    One API call as seen by the caller, passed to request hooks
+
+    Timings are in seconds:
+
+    - ``wait``: time spent sleeping for the rate limiter and retry backoff
+    - ``send``: request sent until response headers received, last attempt
+      (includes DNS, connect and TLS when a new connection was opened; the
+      HTTP stack does not report them separately)
+    - ``read``: response body download, last attempt
+    - ``decode``: JSON decoding
+    - ``total``: wall time of the whole call, retries included
+
+    ``hedged`` is True when a second attempt was sent for a slow GET (see
+    HedgePolicy); the event then reports the attempt that answered first.
+    """
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "path",
+        "status_code",
+        "retries",
+        "attempts",
+        "request_bytes",
+        "response_bytes",
+        "timings",
+        "rate_limit_remaining",
+        "rate_limit_reset",
+        "request_id",
+        "cache",
+        "coalesced",
+        "error",
+        "hedged",
+        "deadline",
+        "started_at",
+    )
+
+    def __init__(self, method: str, endpoint: str, path: str):
+        self.method = method
+        self.endpoint = endpoint
+        self.path = path
+        self.status_code: Optional[int] = None
+        self.retries = 0
+        self.attempts = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.timings: Dict[str, float] = {"wait": 0.0, "send": 0.0, "read": 0.0, "decode": 0.0, "total": 0.0}
+        self.rate_limit_remaining: Optional[str] = None
+        self.rate_limit_reset: Optional[str] = None
+        self.request_id: Optional[str] = None
+        self.cache: Optional[str] = None
+        self.coalesced = False
+        self.error: Optional[BaseException] = None
+        self.hedged = False
+        # Absolute time.monotonic() deadline of the call, None when unbounded
+        self.deadline: Optional[float] = None
+        self.started_at = time.perf_counter()
+
+    def record_response(self, status_code: int, headers: Any) -> None:
+        """Copy status and tracing headers from a response"""
+        self.status_code = status_code
+        self.rate_limit_remaining = headers.get("X-RateLimit-Remaining")
+        self.rate_limit_reset = headers.get("X-RateLimit-Reset")
+        self.request_id = headers.get("X-Request-Id") or headers.get("X-Vercel-Id")
+
+    def attempt(self) -> "RequestEvent":
+        """Child event for one of the concurrent attempts of a hedged call"""
+        child = RequestEvent(self.method, self.endpoint, self.path)
+        child.deadline = self.deadline
+        return child
+
+    def adopt(self, winner: "RequestEvent", *others: "RequestEvent") -> None:
+        """Take the outcome of the attempt that answered a hedged call"""
+        for name in (
+            "status_code",
+            "request_bytes",
+            "response_bytes",
+            "rate_limit_remaining",
+            "rate_limit_reset",
+            "request_id",
+            "retries",
+        ):
+            setattr(self, name, getattr(winner, name))
+        self.attempts = winner.attempts + sum(other.attempts for other in others)
+        for name in ("wait", "send", "read", "decode"):
+            self.timings[name] = winner.timings[name]
+
+    def mark_coalesced(self) -> None:
+        """Record that the call shared the response of an identical call in flight"""
+        self.coalesced = True
+
+    def finish(self) -> None:
+        """Freeze the total duration"""
+        self.timings["total"] = time.perf_counter() - self.started_at
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Event as a plain dict, e.g. for structured logging"""
+        data = {name: getattr(self, name) for name in self.__slots__ if name not in ("error", "deadline", "started_at")}
+        data["timings"] = dict(self.timings)
+        data["error"] = repr(self.error) if self.error is not None else None
+        return data
+
+
+class Hooks:
+    """Registry of request hooks"""
+
+    def __init__(self):
+        self._hooks: Dict[str, List[Callable[[RequestEvent], None]]] = {name: [] for name in HOOK_TYPES}
+
+    def add(self, name: str, hook: Callable[[RequestEvent], None]) -> None:
+        if name not in self._hooks:
+            raise ValueError(f"Unknown hook type: {name} (expected one of {', '.join(HOOK_TYPES)})")
+        self._hooks[name].append(hook)
+
+    def remove(self, name: str, hook: Callable[[RequestEvent], None]) -> None:
+        self._hooks[name].remove(hook)
+
+    def __bool__(self) -> bool:
+        return any(self._hooks.values())
+
+    def emit(self, name: str, event: RequestEvent) -> None:
+        for hook in self._hooks[name]:
+            hook(event)
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram with constant memory
+
+    Buckets grow geometrically by ``precision`` (5% by default), so reported
+    percentiles are within that relative error whatever the sample count.
+    """
+
+    def __init__(self, precision: float = 0.05):
+        self._log_base = math.log1p(precision)
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        millis = max(seconds * 1000.0, 0.001)
+        index = math.ceil(math.log(millis) / self._log_base)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Latency in seconds below which a fraction ``q`` of samples fall"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(math.exp(index * self._log_base) / 1000.0, self.max)
+        return self.max
+
+
+class MetricsCollector:
+    """
+    In-memory aggregation of request events per endpoint
+
+    Usage:
+        metrics = MetricsCollector()
+        metrics.attach(client)
+        ...
+        print(metrics.dump())
+    """
+
+    def __init__(self, precision: float = 0.05):
+        self.precision = precision
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+
+    def attach(self, client: Any) -> "MetricsCollector":
+        """Register on a client's after_response and on_error hooks"""
+        client.add_hook("after_response", self.record)
+        client.add_hook("on_error", self.record)
+        return self
+
+    def record(self, event: RequestEvent) -> None:
+        key = f"{event.method} {event.endpoint}"
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = {
+                    "latency": LatencyHistogram(self.precision),
+                    "errors": 0,
+                    "retries": 0,
+                    "request_bytes": 0,
+                    "response_bytes": 0,
+                }
+            stats["latency"].record(event.timings["total"])
+            stats["errors"] += event.error is not None
+            stats["retries"] += event.retries
+            stats["request_bytes"] += event.request_bytes
+            stats["response_bytes"] += event.response_bytes
+
+    def percentile(self, method: str, endpoint: str, q: float) -> Optional[float]:
+        """Latency percentile in seconds for one endpoint, None without samples"""
+        with self._lock:
+            stats = self._endpoints.get(f"{method} {endpoint}")
+            return stats["latency"].percentile(q) if stats else None
+
+    def dump(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint counts and p50/p95/p99/max latencies in milliseconds"""
+        with self._lock:
+            report = {}
+            for key, stats in sorted(self._endpoints.items()):
+                latency = stats["latency"]
+                report[key] = {
+                    "count": latency.count,
+                    "errors": stats["errors"],
+                    "retries": stats["retries"],
+                    "request_bytes": stats["request_bytes"],
+                    "response_bytes": stats["response_bytes"],
+                    "mean_ms": round(latency.total / latency.count * 1000.0, 3),
+                    "p50_ms": round(latency.percentile(0.50) * 1000.0, 3),
+                    "p95_ms": round(latency.percentile(0.95) * 1000.0, 3),
+                    "p99_ms": round(latency.percentile(0.99) * 1000.0, 3),
+                    "max_ms": round(latency.max * 1000.0, 3),
+                }
+            return report
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
@@ -0,0 +1,368 @@
+"""
+EDUZEN local student mirror
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .models import Model, Student
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    id TEXT PRIMARY KEY,
+    first_name TEXT COLLATE NOCASE,
+    last_name TEXT COLLATE NOCASE,
+    email TEXT COLLATE NOCASE,
+    student_number TEXT COLLATE NOCASE,
+    updated_at TEXT,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS students_email ON students (email);
+CREATE INDEX IF NOT EXISTS students_last_name ON students (last_name);
+CREATE INDEX IF NOT EXISTS students_first_name ON students (first_name);
+CREATE INDEX IF NOT EXISTS students_number ON students (student_number);
+CREATE TABLE IF NOT EXISTS pages (
+    page INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Trigram full-text index for substring search, kept in sync by triggers
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS students_fts USING fts5 (
+    name, email, student_number, tokenize = 'trigram'
+);
+CREATE TRIGGER IF NOT EXISTS students_fts_insert AFTER INSERT ON students BEGIN
+    INSERT INTO students_fts (rowid, name, email, student_number)
+    VALUES (new.rowid, coalesce(new.first_name, '') || ' ' || coalesce(new.last_name, ''),
+            new.email, new.student_number);
+END;
+CREATE TRIGGER IF NOT EXISTS students_fts_delete AFTER DELETE ON students BEGIN
+    DELETE FROM students_fts WHERE rowid = old.rowid;
+END;
+CREATE TRIGGER IF NOT EXISTS students_fts_update
+AFTER UPDATE OF first_name, last_name, email, student_number ON students BEGIN
+    DELETE FROM students_fts WHERE rowid = old.rowid;
+    INSERT INTO students_fts (rowid, name, email, student_number)
+    VALUES (new.rowid, coalesce(new.first_name, '') || ' ' || coalesce(new.last_name, ''),
+            new.email, new.student_number);
+END;
+"""
+
+# Trigram matching needs at least three characters
+_MIN_SUBSTRING = 3
+
+
+class SyncStats(NamedTuple):
+    """Outcome of one StudentMirror.sync()"""
+
+    pages: int
+    unchanged_pages: int
+    inserted: int
+    updated: int
+    deleted: int
+    duration: float
+
+
+class StudentMirror:
+    """
+    Local SQLite copy of an organization's students
+
+    ``sync()`` walks the paginated ``/v1/students`` endpoint and only writes
+    what changed: a page whose content hash matches the previous sync is
+    skipped entirely, and within a changed page a record is rewritten only
+    when its ``updated_at`` (or, without one, its content) differs. Students
+    no longer returned by the API are removed once a sync has provably seen
+    every current student.
+
+    Lookups by id, email and name search are served from the local database
+    without any network access. The mirror may be read from other threads
+    while a sync runs.
+
+    Usage:
+        with StudentMirror(client, "org-123", "students-org-123.sqlite") as mirror:
+            mirror.sync()
+            mirror.get_by_email("jane@example.com")
+            mirror.search("dup")
+    """
+
+    def __init__(self, client: Any, organization_id: str, path: str = ":memory:", page_size: int = 100):
+        """
+        Args:
+            client: EDUZENClient used to fetch pages
+            organization_id: Organization ID
+            path: SQLite database file, one per organization (default: in memory)
+            page_size: Records per request during sync (default: 100)
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        self.client = client
+        self.organization_id = organization_id
+        self.path = path
+        self.page_size = page_size
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        # Ids returned by the sync in progress; TEMP, so never written to the database file
+        self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS seen (id TEXT PRIMARY KEY)")
+        try:
+            self._conn.executescript(_FTS_SCHEMA)
+            self.substring_index = True
+        except sqlite3.OperationalError:
+            # SQLite without FTS5 or the trigram tokenizer (< 3.34): LIKE scans
+            self.substring_index = False
+
+        owner = self._meta("organization_id")
+        if owner is None:
+            with self._conn:
+                self._set_meta("organization_id", organization_id)
+        elif owner != organization_id:
+            raise ValueError(f"{path} mirrors organization {owner}, not {organization_id}")
+
+    # ========== SYNC ==========
+
+    def sync(self) -> SyncStats:
+        """
+        Bring the mirror up to date with the API
+
+        The API pages by ``last_name`` with offsets, so students sharing a
+        last name may move between pages during a pass and be missed. Stale
+        students are therefore only deleted after a pass that saw as many
+        students as the reported total, or after a second, confirming pass
+        whose ids are added to the first; when the two passes together still
+        fall short of the total, nothing is deleted until a later sync.
+
+        Returns:
+            SyncStats with the pages fetched and records written
+        """
+        started = time.monotonic()
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM temp.seen")
+
+        pages, unchanged, inserted, updated, total = self._pass()
+        last_pages = pages
+        if total is None or self._seen() < total:
+            last_pages, more_unchanged, more_inserted, more_updated, total = self._pass()
+            pages += last_pages
+            unchanged += more_unchanged
+            inserted += more_inserted
+            updated += more_updated
+
+        # Only reached after complete passes: a failed sync never deletes anything
+        with self._lock, self._conn:
+            deleted = 0
+            if total is None or self._seen() >= total:
+                deleted = self._conn.execute("DELETE FROM students WHERE id NOT IN (SELECT id FROM temp.seen)").rowcount
+            self._conn.execute("DELETE FROM pages WHERE page > ?", (last_pages,))
+            self._conn.execute("DELETE FROM temp.seen")
+            self._set_meta("synced_at", str(time.time()))
+
+        return SyncStats(pages, unchanged, inserted, updated, deleted, time.monotonic() - started)
+
+    def _pass(self) -> Tuple[int, int, int, int, Optional[int]]:
+        """Walk every page once; returns (pages, unchanged pages, inserted, updated, last reported total)"""
+        pages = unchanged = inserted = updated = 0
+        total = None
+
+        def fetch(page: int) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+            response = self.client.get_students(
+                organization_id=self.organization_id,
+                page=page,
+                limit=self.page_size,
+            )
+            records = [r.to_dict() if isinstance(r, Model) else r for r in response.get("data") or []]
+            return records, (response.get("meta") or {}).get("total")
+
+        # Fetch page N+1 while page N is written, as iter_students does
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="eduzen-mirror")
+        try:
+            page = 1
+            pending = executor.submit(fetch, page)
+            while pending is not None:
+                records, page_total = pending.result()
+                pending = None
+                if len(records) >= self.page_size:
+                    pending = executor.submit(fetch, page + 1)
+                if page_total is not None:
+                    total = page_total
+
+                page_unchanged, page_inserted, page_updated = self._apply_page(page, records)
+                pages += 1
+                unchanged += page_unchanged
+                inserted += page_inserted
+                updated += page_updated
+                page += 1
+        finally:
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=True)
+        return pages, unchanged, inserted, updated, total
+
+    def _seen(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM temp.seen").fetchone()[0]
+
+    def _apply_page(self, page: int, records: List[Dict[str, Any]]) -> Tuple[bool, int, int]:
+        """Write one page; returns (unchanged since last sync, inserted, updated)"""
+        encoded = [self.client.codec.dumps(record) for record in records]
+        digest = hashlib.sha256(b"\n".join(encoded)).hexdigest()
+        ids = [record["id"] for record in records if record.get("id") is not None]
+        inserted = updated = 0
+
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT hash FROM pages WHERE page = ?", (page,)).fetchone()
+            if row is not None and row[0] == digest:
+                self._mark_seen(ids)
+                return True, 0, 0
+
+            existing = {}
+            if ids:
+                existing = dict(
+                    self._conn.execute(
+                        f"SELECT id, updated_at FROM students WHERE id IN ({','.join('?' * len(ids))})", ids
+                    )
+                )
+            for record, data in zip(records, encoded):
+                student_id = record.get("id")
+                if student_id is None:
+                    continue
+                values = (
+                    record.get("first_name"),
+                    record.get("last_name"),
+                    record.get("email"),
+                    record.get("student_number"),
+                    record.get("updated_at"),
+                    data,
+                    student_id,
+                )
+                if student_id not in existing:
+                    self._conn.execute(
+                        "INSERT OR IGNORE INTO students"
+                        " (first_name, last_name, email, student_number, updated_at, data, id)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        values,
+                    )
+                    inserted += 1
+                    continue
+                previous = existing[student_id]
+                if previous is not None and previous == record.get("updated_at"):
+                    continue
+                updated += self._conn.execute(
+                    "UPDATE students SET first_name = ?, last_name = ?, email = ?, student_number = ?,"
+                    " updated_at = ?, data = ? WHERE id = ? AND data != ?",
+                    values + (data,),
+                ).rowcount
+
+            self._mark_seen(ids)
+            self._conn.execute("INSERT OR REPLACE INTO pages (page, hash) VALUES (?, ?)", (page, digest))
+            return False, inserted, updated
+
+    def _mark_seen(self, ids: List[str]) -> None:
+        self._conn.executemany("INSERT OR IGNORE INTO temp.seen (id) VALUES (?)", [(i,) for i in ids])
+
+    # ========== LOOKUPS ==========
+
+    def get(self, student_id: str) -> Optional[Dict[str, Any]]:
+        """Student by id, or None"""
+        return self._one("SELECT data FROM students WHERE id = ?", (student_id,))
+
+    def get_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """Student by email (case-insensitive), or None"""
+        return self._one("SELECT data FROM students WHERE email = ?", (email,))
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Find students by name, email or student number
+
+        Queries of three characters or more match anywhere in those fields;
+        shorter queries match their beginning. Matching is case-insensitive.
+
+        Args:
+            query: Text to look for
+            limit: Maximum number of results (default: 20)
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        if len(query) < _MIN_SUBSTRING:
+            pattern = _escape_like(query) + "%"
+            sql = (
+                "SELECT data FROM students WHERE last_name LIKE ?1 ESCAPE '\\' OR first_name LIKE ?1 ESCAPE '\\'"
+                " OR email LIKE ?1 ESCAPE '\\' OR student_number LIKE ?1 ESCAPE '\\'"
+                " ORDER BY last_name, first_name LIMIT ?2"
+            )
+            params = (pattern, limit)
+        elif self.substring_index:
+            sql = (
+                "SELECT s.data FROM students_fts f JOIN students s ON s.rowid = f.rowid"
+                " WHERE students_fts MATCH ? ORDER BY f.rank LIMIT ?"
+            )
+            params = ('"' + query.replace('"', '""') + '"', limit)
+        else:
+            pattern = "%" + _escape_like(query) + "%"
+            sql = (
+                "SELECT data FROM students WHERE (coalesce(first_name, '') || ' ' || coalesce(last_name, ''))"
+                " LIKE ?1 ESCAPE '\\' OR email LIKE ?1 ESCAPE '\\' OR student_number LIKE ?1 ESCAPE '\\'"
+                " ORDER BY last_name, first_name LIMIT ?2"
+            )
+            params = (pattern, limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._load(row[0]) for row in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM students").fetchone()[0]
+
+    @property
+    def synced_at(self) -> Optional[float]:
+        """Wall-clock time of the last completed sync, None before the first one"""
+        value = self._meta("synced_at")
+        return float(value) if value is not None else None
+
+    def _one(self, sql: str, params: tuple) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(sql, params).fetchone()
+        return self._load(row[0]) if row is not None else None
+
+    def _load(self, data: bytes) -> Any:
+        record = self.client.codec.loads(data)
+        return Student.from_dict(record) if getattr(self.client, "models", False) else record
+
+    def _meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row is not None else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    # ========== LIFECYCLE ==========
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "StudentMirror":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
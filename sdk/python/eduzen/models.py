@@ -0,0 +1,271 @@
+"""
+EDUZEN API response models
+
+Compact, read-only views of API records. Each model stores its known fields
+in ``__slots__`` instead of a per-record dict, interns low-cardinality
+strings (statuses, organization ids) and wraps nested objects into models
+only when they are first accessed. Fields the model does not declare are
+kept as is, so nothing returned by the API is lost.
+
+Models are Mappings: ``student["first_name"]``, ``student.get("email")``,
+``dict(student)`` and ``student == {...}`` behave as with the plain dicts
+returned by default, and ``to_dict()`` gives back a plain dict.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, FrozenSet, Iterator, Optional, Tuple, Type, TypeVar, Union
+
+M = TypeVar("M", bound="Model")
+
+
+class Model(Mapping):
+    """Base class of the response models"""
+
+    __slots__ = ("_extra",)
+
+    # API key -> slot name, filled by __init_subclass__
+    _slot_names: Dict[str, str] = {}
+    _keys: Tuple[str, ...] = ()
+    # Nested object fields, wrapped on first access
+    _nested: Dict[str, Type["Model"]] = {}
+    # Low-cardinality string fields shared between records
+    _interned: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        keys = tuple(name.lstrip("_") for name in cls.__dict__.get("__slots__", ()))
+        cls._keys = keys
+        cls._slot_names = {key: f"_{key}" if key in cls._nested else key for key in keys}
+        for key, model in cls._nested.items():
+            setattr(cls, key, _NestedField(f"_{key}", model))
+
+    @classmethod
+    def from_dict(cls: Type[M], data: Dict[str, Any]) -> M:
+        """Build a model from a decoded API record"""
+        obj = cls.__new__(cls)
+        slot_names = cls._slot_names
+        interned = cls._interned
+        extra = None
+        for key, value in data.items():
+            slot = slot_names.get(key)
+            if slot is None:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+                continue
+            if key in interned and type(value) is str:
+                value = sys.intern(value)
+            object.__setattr__(obj, slot, value)
+        object.__setattr__(obj, "_extra", extra)
+        return obj
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for unset slots and undeclared fields
+        if name in self._slot_names:
+            return None
+        extra = object.__getattribute__(self, "_extra")
+        if extra is not None and name in extra:
+            return extra[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __getitem__(self, key: str) -> Any:
+        slot = self._slot_names.get(key)
+        if slot is not None:
+            try:
+                object.__getattribute__(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+            return getattr(self, key)
+        if self._extra is not None:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._keys:
+            try:
+                object.__getattribute__(self, self._slot_names[key])
+            except AttributeError:
+                continue
+            yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={self[key]!r}" for key in self)
+        return f"{type(self).__name__}({fields})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy of the record, nested models included"""
+        return {key: _plain(self[key]) for key in self}
+
+
+class _NestedField:
+    """Descriptor wrapping a nested object into a model on first access"""
+
+    __slots__ = ("slot", "model")
+
+    def __init__(self, slot: str, model: Type[Model]):
+        self.slot = slot
+        self.model = model
+
+    def __get__(self, obj: Optional[Model], owner: type) -> Any:
+        if obj is None:
+            return self
+        try:
+            value = object.__getattribute__(obj, self.slot)
+        except AttributeError:
+            return None
+        if isinstance(value, dict):
+            value = self.model.from_dict(value)
+            object.__setattr__(obj, self.slot, value)
+        return value
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+class StudentClass(Model):
+    """Class summary embedded in student records"""
+
+    __slots__ = ("id", "name", "level")
+
+
+class Student(Model):
+    """Student record (``/v1/students``)"""
+
+    _nested = {"classes": StudentClass}
+    _interned = frozenset({"organization_id", "class_id", "status", "gender", "country", "city"})
+
+    __slots__ = (
+        "id",
+        "organization_id",
+        "class_id",
+        "student_number",
+        "first_name",
+        "last_name",
+        "email",
+        "phone",
+        "date_of_birth",
+        "gender",
+        "address",
+        "city",
+        "postal_code",
+        "country",
+        "photo_url",
+        "status",
+        "enrollment_date",
+        "created_at",
+        "updated_at",
+        "_classes",
+    )
+
+
+class User(Model):
+    """User account"""
+
+    _interned = frozenset({"organization_id", "role", "theme_preference"})
+
+    __slots__ = (
+        "id",
+        "organization_id",
+        "email",
+        "full_name",
+        "phone",
+        "role",
+        "is_active",
+        "avatar_url",
+        "permissions",
+        "theme_preference",
+        "last_login_at",
+        "created_at",
+        "updated_at",
+    )
+
+
+class Session(Model):
+    """Training session"""
+
+    _interned = frozenset({"organization_id", "formation_id", "teacher_id", "status", "location"})
+
+    __slots__ = (
+        "id",
+        "organization_id",
+        "formation_id",
+        "teacher_id",
+        "name",
+        "status",
+        "location",
+        "capacity_max",
+        "start_date",
+        "end_date",
+        "start_time",
+        "end_time",
+        "created_at",
+        "updated_at",
+    )
+
+
+class QRCode(Model):
+    """Attendance QR code of a session"""
+
+    _interned = frozenset({"session_id", "created_by"})
+
+    __slots__ = (
+        "id",
+        "session_id",
+        "qr_code_data",
+        "qr_code_token",
+        "is_active",
+        "expires_at",
+        "max_scans",
+        "current_scans",
+        "require_location",
+        "allowed_radius_meters",
+        "created_by",
+        "created_at",
+        "updated_at",
+    )
+
+
+class PaymentIntent(Model):
+    """Stripe payment intent created by ``create_stripe_intent``"""
+
+    _interned = frozenset({"status"})
+
+    __slots__ = ("paymentIntentId", "clientSecret", "status", "paymentId")
+
+
+def wrap(data: Any, model: Union[str, Type[Model]], key: Optional[str] = None) -> Any:
+    """
+    Replace the record(s) at ``data[key]`` with models, in place
+
+    Args:
+        data: Decoded response
+        model: Model class, or its name in this module
+        key: Response key holding one record or a list of records; None when
+            the response itself is the record
+
+    Returns:
+        The response, or the model when ``key`` is None
+    """
+    if isinstance(model, str):
+        model = globals()[model]
+    if key is None:
+        return model.from_dict(data) if isinstance(data, dict) else data
+    if not isinstance(data, dict):
+        return data
+    value = data.get(key)
+    if isinstance(value, list):
+        data[key] = [model.from_dict(item) if isinstance(item, dict) else item for item in value]
+    elif isinstance(value, dict):
+        data[key] = model.from_dict(value)
+    return data
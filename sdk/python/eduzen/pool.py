@@ -0,0 +1,509 @@
+"""
+EDUZEN multi-tenant client pool
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+from .client import EDUZENClient, create_session
+from .ratelimit import RateLimitBudget
+
+_DONE = object()
+# Returned by ClientPool._take after reading an input outside the lock
+_RESCAN = object()
+
+
+class PoolResult(NamedTuple):
+    """
+    Outcome of one item of ClientPool.run
+
+    An exception raised by a tenant's input iterable is reported once, with
+    ``index`` -1 and ``item`` None; the rest of that input is not read.
+    """
+
+    tenant: str
+    index: int
+    item: Any
+    result: Any
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item succeeded"""
+        return self.error is None
+
+
+class TenantStats(NamedTuple):
+    """Work counters of one tenant"""
+
+    queued: int
+    in_flight: int
+    completed: int
+    errors: int
+    budget: RateLimitBudget
+
+
+class _Run:
+    """Bookkeeping of one ClientPool.run call"""
+
+    __slots__ = ("results", "open_sources", "outstanding", "unread", "window")
+
+    def __init__(self, sources: int, window: int):
+        self.results: "queue.Queue[Any]" = queue.Queue()
+        self.open_sources = sources
+        # Items taken by a worker and not completed yet
+        self.outstanding = 0
+        # Items read from the inputs and not yielded to the caller yet
+        self.unread = 0
+        self.window = window
+
+    @property
+    def full(self) -> bool:
+        return self.unread >= self.window
+
+    def check_done(self) -> None:
+        if self.open_sources == 0 and self.outstanding == 0:
+            self.results.put(_DONE)
+
+
+class _Source:
+    """One tenant's input to a ClientPool.run call"""
+
+    __slots__ = ("run", "func", "items", "reading")
+
+    def __init__(self, run: _Run, func: Callable[[EDUZENClient, Any], Any], items: Iterable[Any]):
+        self.run = run
+        self.func = func
+        self.items: Iterator[Tuple[int, Any]] = enumerate(items)
+        # A worker is reading the next item, outside the pool lock
+        self.reading = False
+
+
+class _Tenant:
+    __slots__ = (
+        "id",
+        "client",
+        "weight",
+        "max_concurrency",
+        "tasks",
+        "sources",
+        "vtime",
+        "in_flight",
+        "completed",
+        "errors",
+    )
+
+    def __init__(self, tenant_id: str, client: EDUZENClient, weight: float, max_concurrency: Optional[int]):
+        self.id = tenant_id
+        self.client = client
+        self.weight = weight
+        self.max_concurrency = max_concurrency
+        # Submitted calls: (future, func, args, kwargs)
+        self.tasks: Deque[Tuple[Future, Callable[..., Any], tuple, dict]] = deque()
+        # Lazily read run() inputs
+        self.sources: Deque[_Source] = deque()
+        self.vtime = 0.0
+        self.in_flight = 0
+        self.completed = 0
+        self.errors = 0
+
+    @property
+    def has_work(self) -> bool:
+        return bool(self.tasks or self.sources)
+
+    @property
+    def saturated(self) -> bool:
+        return self.max_concurrency is not None and self.in_flight >= self.max_concurrency
+
+
+class ClientPool:
+    """
+    Clients for many API keys (one per organization) over one connection pool
+
+    The API rate-limits every key separately. The pool keeps one
+    EDUZENClient, hence one RateLimiter, per tenant, all sharing a single
+    keep-alive session, and runs their calls on ``concurrency`` worker
+    threads:
+
+    - Work is scheduled weighted-fair across tenants (start-time fair
+      queuing): with equal weights every tenant with pending work gets the
+      same share of the workers, so a large organization cannot starve the
+      small ones, and a tenant that was idle does not bank credit.
+    - A tenant whose key is throttled (paced near the end of its budget, or
+      blocked by a 429 Retry-After) is skipped until it may send again;
+      workers serve the other keys meanwhile instead of sleeping.
+
+    Total throughput is therefore bounded by ``concurrency`` and by the sum
+    of the keys' budgets, never by the slowest key.
+
+    Usage:
+        with ClientPool(concurrency=32) as pool:
+            for org in organizations:
+                pool.add_tenant(org.id, org.api_key)
+            work = {org.id: org.new_users for org in organizations}
+            for result in pool.run(lambda client, user: client.create_user(**user), work):
+                if not result.ok:
+                    print(result.tenant, result.error)
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://app.eduzen.com/api",
+        concurrency: int = 16,
+        pool_maxsize: Optional[int] = None,
+        timeout: int = 30,
+        **client_options: Any,
+    ):
+        """
+        Args:
+            base_url: Base URL for API (default: https://app.eduzen.com/api)
+            concurrency: Worker threads, i.e. calls in flight across all tenants (default: 16)
+            pool_maxsize: Keep-alive connections of the shared session (default: concurrency)
+            timeout: Request timeout in seconds (default: 30)
+            **client_options: Other EDUZENClient options applied to every tenant
+                (retry_policy, codec, models, deadlines, ...)
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.client_options = client_options
+        self.session = create_session(pool_maxsize=pool_maxsize or concurrency)
+
+        self._cond = threading.Condition()
+        self._tenants: Dict[str, _Tenant] = {}
+        # Virtual time of the last dispatched call; tenants (re)joining start from here
+        self._vclock = 0.0
+        self._workers: List[threading.Thread] = []
+        self._closed = False
+
+    # ========== TENANTS ==========
+
+    def add_tenant(
+        self,
+        tenant_id: str,
+        api_key: Optional[str] = None,
+        access_token: Optional[str] = None,
+        weight: float = 1.0,
+        max_concurrency: Optional[int] = None,
+    ) -> EDUZENClient:
+        """
+        Register an organization and its credentials
+
+        Args:
+            tenant_id: Tenant name, usually the organization ID
+            api_key: API key of the organization
+            access_token: Access token, for user-scoped calls
+            weight: Share of the workers relative to other tenants (default: 1)
+            max_concurrency: Cap on this tenant's calls in flight (default: none)
+
+        Returns:
+            The tenant's client, which may also be used directly
+        """
+        if weight <= 0:
+            raise ValueError("weight must be > 0")
+        client = EDUZENClient(
+            base_url=self.base_url,
+            api_key=api_key,
+            access_token=access_token,
+            timeout=self.timeout,
+            session=self.session,
+            **self.client_options,
+        )
+        with self._cond:
+            if tenant_id in self._tenants:
+                raise ValueError(f"Tenant {tenant_id} is already registered")
+            self._tenants[tenant_id] = _Tenant(tenant_id, client, weight, max_concurrency)
+        return client
+
+    def remove_tenant(self, tenant_id: str) -> None:
+        """Unregister a tenant, cancelling its queued calls (calls in flight complete)"""
+        with self._cond:
+            tenant = self._tenants.pop(tenant_id)
+            for future, _, _, _ in tenant.tasks:
+                future.cancel()
+            tenant.tasks.clear()
+            for source in tenant.sources:
+                source.run.open_sources -= 1
+                source.run.check_done()
+            tenant.sources.clear()
+
+    def client(self, tenant_id: str) -> EDUZENClient:
+        """Client of a tenant"""
+        return self._tenant(tenant_id).client
+
+    def _tenant(self, tenant_id: str) -> _Tenant:
+        try:
+            return self._tenants[tenant_id]
+        except KeyError:
+            raise KeyError(f"Unknown tenant: {tenant_id}") from None
+
+    # ========== WORK ==========
+
+    def submit(self, tenant_id: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Schedule ``func(client, *args, **kwargs)`` with the tenant's client
+
+        Usage:
+            future = pool.submit("org-123", EDUZENClient.get_students, organization_id="org-123")
+            students = future.result()
+        """
+        future: Future = Future()
+        with self._cond:
+            self._check_open()
+            tenant = self._tenant(tenant_id)
+            self._activate(tenant)
+            tenant.tasks.append((future, func, args, kwargs))
+            self._start_workers()
+            self._cond.notify()
+        return future
+
+    def run(
+        self,
+        func: Callable[[EDUZENClient, Any], Any],
+        work: Mapping[str, Iterable[Any]],
+    ) -> Iterator[PoolResult]:
+        """
+        Apply ``func(client, item)`` to every item of every tenant
+
+        Inputs are read lazily, a few items ahead of the workers, so the
+        memory used does not depend on their size. A failing item, or a
+        failing input, is reported in a PoolResult and never aborts the run.
+
+        Args:
+            func: Callable receiving the tenant's client and one item
+            work: Tenant ID -> iterable of items (generators welcome)
+
+        Yields:
+            PoolResult per item, in completion order
+        """
+        run = _Run(len(work), window=2 * self.concurrency)
+        with self._cond:
+            self._check_open()
+            tenants = [self._tenant(tenant_id) for tenant_id in work]
+            for tenant, items in zip(tenants, work.values()):
+                self._activate(tenant)
+                tenant.sources.append(_Source(run, func, items))
+            run.check_done()
+            self._start_workers()
+            self._cond.notify_all()
+
+        try:
+            while True:
+                result = run.results.get()
+                if result is _DONE:
+                    return
+                with self._cond:
+                    run.unread -= 1
+                    if run.unread == run.window - 1:
+                        self._cond.notify_all()
+                yield result
+        finally:
+            # Iteration stopped early: read no more items (calls in flight complete)
+            with self._cond:
+                for tenant in tenants:
+                    tenant.sources = deque(source for source in tenant.sources if source.run is not run)
+
+    def _activate(self, tenant: _Tenant) -> None:
+        # An idle tenant resumes at the current virtual time: it gets its fair
+        # share from now on, not a burst for the time it had nothing to do
+        if not tenant.has_work and tenant.in_flight == 0:
+            tenant.vtime = max(tenant.vtime, self._vclock)
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("ClientPool is closed")
+
+    # ========== SCHEDULING ==========
+
+    def _start_workers(self) -> None:
+        while len(self._workers) < self.concurrency:
+            worker = threading.Thread(target=self._work, name=f"eduzen-pool-{len(self._workers)}", daemon=True)
+            self._workers.append(worker)
+            worker.start()
+
+    def _work(self) -> None:
+        while True:
+            task = self._next_task()
+            if task is None:
+                return
+            tenant, run, call = task
+            ok = False
+            try:
+                ok = call()
+            finally:
+                with self._cond:
+                    tenant.in_flight -= 1
+                    if ok:
+                        tenant.completed += 1
+                    else:
+                        tenant.errors += 1
+                    if run is not None:
+                        run.outstanding -= 1
+                        run.check_done()
+                    self._cond.notify_all()
+
+    def _next_task(self) -> Optional[Tuple[_Tenant, Optional[_Run], Callable[[], bool]]]:
+        """Block until a tenant may send, then take its next call"""
+        with self._cond:
+            while True:
+                retry_in = None
+                ready = []
+                for tenant in self._tenants.values():
+                    if not tenant.has_work or tenant.saturated:
+                        continue
+                    delay = tenant.client.rate_limiter.delay()
+                    if delay > 0:
+                        retry_in = delay if retry_in is None else min(retry_in, delay)
+                        continue
+                    ready.append(tenant)
+
+                for tenant in sorted(ready, key=lambda t: t.vtime):
+                    task = self._take(tenant)
+                    if task is _RESCAN:
+                        break
+                    if task is not None:
+                        return task
+                else:
+                    if self._closed and not any(t.has_work or t.in_flight for t in self._tenants.values()):
+                        return None
+                    self._cond.wait(retry_in)
+
+    def _take(self, tenant: _Tenant) -> Any:
+        """
+        Dequeue the tenant's next call and charge it to the tenant's virtual time
+
+        Returns None when the tenant has nothing to send now, and _RESCAN when
+        the pool lock was released to read an input, so the caller's view of
+        the other tenants is stale.
+        """
+        while True:
+            if tenant.tasks:
+                future, func, args, kwargs = tenant.tasks.popleft()
+                if not future.set_running_or_notify_cancel():
+                    continue
+                run = None
+
+                def call(future=future, func=func, args=args, kwargs=kwargs) -> bool:
+                    try:
+                        result = func(tenant.client, *args, **kwargs)
+                    except Exception as e:
+                        future.set_exception(e)
+                        return False
+                    future.set_result(result)
+                    return True
+
+            else:
+                # First input whose run has room: a caller not consuming its
+                # results stops its own reads, not those of other runs
+                source = next((s for s in tenant.sources if not s.run.full and not s.reading), None)
+                if source is None:
+                    return None
+                item = self._read(tenant, source)
+                if item is None:
+                    return _RESCAN
+                run = source.run
+                index, item = item
+                run.outstanding += 1
+                run.unread += 1
+
+                def call(run=run, func=source.func, index=index, item=item) -> bool:
+                    try:
+                        result = PoolResult(tenant.id, index, item, func(tenant.client, item), None)
+                    except Exception as e:
+                        result = PoolResult(tenant.id, index, item, None, e)
+                    run.results.put(result)
+                    return result.error is None
+
+            self._vclock = tenant.vtime
+            tenant.vtime += 1.0 / tenant.weight
+            tenant.in_flight += 1
+            return tenant, run, call
+
+    def _read(self, tenant: _Tenant, source: _Source) -> Optional[Tuple[int, Any]]:
+        """
+        Read the next item of an input without holding the pool lock
+
+        A slow input (a CSV file, a database cursor) then delays only its own
+        run, never the other workers or submit(). Called and returns with the
+        lock held; None when no call results from the read.
+        """
+        source.reading = True
+        # Counts as in flight while read, so max_concurrency holds
+        tenant.in_flight += 1
+        item = error = None
+        self._cond.release()
+        try:
+            item = next(source.items)
+        except StopIteration:
+            pass
+        except Exception as e:
+            error = e
+        finally:
+            self._cond.acquire()
+            source.reading = False
+            tenant.in_flight -= 1
+            self._cond.notify_all()
+
+        run = source.run
+        if source not in tenant.sources:
+            # Tenant removed or run abandoned meanwhile: drop what was read
+            return None
+        if item is not None:
+            return item
+        tenant.sources.remove(source)
+        if error is not None:
+            # The input itself failed: report it and read no further from it
+            tenant.errors += 1
+            run.unread += 1
+            run.results.put(PoolResult(tenant.id, -1, None, None, error))
+        run.open_sources -= 1
+        run.check_done()
+        return None
+
+    # ========== METRICS ==========
+
+    @property
+    def budgets(self) -> Dict[str, RateLimitBudget]:
+        """Rate limit budget last reported by the API, per tenant"""
+        with self._cond:
+            tenants = list(self._tenants.values())
+        return {tenant.id: tenant.client.rate_limit for tenant in tenants}
+
+    def stats(self) -> Dict[str, TenantStats]:
+        """Queued, in-flight, completed and failed calls and budget, per tenant"""
+        with self._cond:
+            return {
+                tenant.id: TenantStats(
+                    queued=len(tenant.tasks),
+                    in_flight=tenant.in_flight,
+                    completed=tenant.completed,
+                    errors=tenant.errors,
+                    budget=tenant.client.rate_limit,
+                )
+                for tenant in self._tenants.values()
+            }
+
+    # ========== LIFECYCLE ==========
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Finish the queued work, stop the workers and close the shared session"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            workers = list(self._workers)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in workers:
+            worker.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        self.session.close()
+
+    def __enter__(self) -> "ClientPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
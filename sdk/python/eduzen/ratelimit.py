@@ -0,0 +1,170 @@
+"""
+EDUZEN API client-side rate limiting
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Mapping, NamedTuple
+
+
+class RateLimitBudget(NamedTuple):
+    """Snapshot of the rate limit budget reported by the API"""
+
+    limit: Optional[int]
+    remaining: Optional[int]
+    reset_at: Optional[datetime]
+    retry_after: float
+
+
+def _parse_reset(value: str) -> Optional[float]:
+    """Parse X-RateLimit-Reset (ISO 8601 or epoch seconds) into a wall-clock timestamp"""
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _parse_retry_after(value: str) -> float:
+    """Parse Retry-After (delta seconds or HTTP date) into seconds to wait"""
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+
+
+class RateLimiter:
+    """
+    Client-side limiter fed by the API's X-RateLimit-* and Retry-After headers
+
+    Requests run unthrottled while the budget is comfortable. Once the
+    remaining budget drops to ``reserve`` requests, they are spread evenly
+    until X-RateLimit-Reset instead of being spent in a burst that ends in a
+    429. After a 429 every caller waits for Retry-After.
+
+    A single instance may be shared by threads and by asyncio tasks: it only
+    computes delays under a lock, callers do the sleeping.
+    """
+
+    def __init__(self, reserve: int = 100):
+        """
+        Args:
+            reserve: Remaining-budget threshold below which requests are paced (default: 100)
+        """
+        self.reserve = reserve
+        self._lock = threading.Lock()
+        self._limit: Optional[int] = None
+        self._remaining: Optional[int] = None
+        self._reset_at: Optional[float] = None
+        self._blocked_until = 0.0
+        self._next_slot = 0.0
+
+    @property
+    def budget(self) -> RateLimitBudget:
+        """Current view of the rate limit budget"""
+        with self._lock:
+            now = time.time()
+            if self._reset_at is not None and self._reset_at <= now:
+                remaining = self._limit
+                reset_at = None
+            else:
+                remaining = self._remaining
+                reset_at = self._reset_at
+            return RateLimitBudget(
+                limit=self._limit,
+                remaining=remaining,
+                reset_at=datetime.fromtimestamp(reset_at, timezone.utc) if reset_at else None,
+                retry_after=max(0.0, self._blocked_until - now),
+            )
+
+    def delay(self) -> float:
+        """
+        Seconds acquire() would make a caller wait right now, without reserving a slot
+
+        Lets a scheduler serve another API key instead of parking a worker
+        on this one.
+        """
+        with self._lock:
+            now = time.time()
+            start = max(now, self._blocked_until, self._next_slot)
+            if self._remaining is not None and self._reset_at is not None and self._reset_at > start:
+                if self._remaining <= 0:
+                    start = self._reset_at
+            return start - now
+
+    def acquire(self) -> float:
+        """
+        Reserve a slot for the next request
+
+        Returns:
+            Seconds the caller must wait before sending the request
+        """
+        with self._lock:
+            now = time.time()
+            start = max(now, self._blocked_until, self._next_slot)
+
+            if self._reset_at is not None and self._reset_at <= start:
+                # The window rolled over: the server will report the new budget
+                self._remaining = None
+                self._reset_at = None
+
+            if self._remaining is not None and self._reset_at is not None:
+                if self._remaining <= 0:
+                    start = max(start, self._reset_at)
+                    self._remaining = None
+                    self._reset_at = None
+                else:
+                    if self._remaining <= self.reserve:
+                        self._next_slot = start + (self._reset_at - start) / self._remaining
+                    self._remaining -= 1
+
+            return start - now
+
+    def update(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """
+        Record the budget advertised by a response
+
+        Args:
+            status_code: HTTP status code of the response
+            headers: Response headers
+        """
+        try:
+            remaining = headers.get("X-RateLimit-Remaining")
+            reset = headers.get("X-RateLimit-Reset")
+            limit = headers.get("X-RateLimit-Limit")
+            retry_after = headers.get("Retry-After")
+
+            remaining = int(remaining) if remaining is not None else None
+            reset_at = _parse_reset(reset) if reset is not None else None
+            limit = int(limit) if limit is not None else None
+            retry_after = _parse_retry_after(retry_after) if retry_after is not None else None
+        except (TypeError, ValueError, AttributeError):
+            # Missing or malformed headers never break a request
+            return
+
+        with self._lock:
+            if limit is not None:
+                self._limit = limit
+            if remaining is not None:
+                if reset_at is not None and reset_at != self._reset_at:
+                    # New window: the server figure is authoritative
+                    self._remaining = remaining
+                    self._reset_at = reset_at
+                elif self._remaining is None or remaining < self._remaining:
+                    # Responses may arrive out of order; keep the lowest figure
+                    self._remaining = remaining
+            if status_code == 429:
+                self._remaining = 0
+                if retry_after is None and self._reset_at is not None:
+                    retry_after = max(0.0, self._reset_at - time.time())
+                if retry_after is not None:
+                    self._blocked_until = max(self._blocked_until, time.time() + retry_after)
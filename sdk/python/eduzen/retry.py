@@ -0,0 +1,117 @@
+"""
+EDUZEN API retry policy
+"""
+
+import random
+import threading
+import time
+import uuid
+from typing import Optional, Iterable
+
+
+def new_idempotency_key() -> str:
+    """Generate a fresh Idempotency-Key value"""
+    return uuid.uuid4().hex
+
+
+class RetryPolicy:
+    """
+    Retry policy for transient failures (connection errors, timeouts, 502/503/504)
+
+    Only idempotent requests are retried: methods listed in ``retry_methods``
+    and requests carrying an Idempotency-Key. Delays use exponential backoff
+    with full jitter, every retry must fit in ``deadline`` seconds measured
+    from the first attempt, and a shared retry budget caps retries to a
+    fraction of the traffic so an outage cannot turn into a retry storm.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = (502, 503, 504),
+        retry_methods: Iterable[str] = ("GET",),
+        deadline: Optional[float] = 60.0,
+        budget_ratio: float = 0.2,
+        budget_min: int = 10,
+    ):
+        """
+        Args:
+            max_attempts: Maximum attempts per call, first one included (default: 3)
+            backoff_factor: Base delay in seconds, doubled on every attempt (default: 0.5)
+            max_backoff: Upper bound for a single delay in seconds (default: 30)
+            jitter: Randomize delays between 0 and the backoff (default: True)
+            retry_statuses: HTTP statuses treated as transient (default: 502, 503, 504)
+            retry_methods: Methods retried without an Idempotency-Key (default: GET)
+            deadline: Total seconds allowed across all attempts, None for no limit (default: 60)
+            budget_ratio: Retries allowed per request sent (default: 0.2)
+            budget_min: Burst of retries allowed before budget_ratio applies (default: 10)
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(m.upper() for m in retry_methods)
+        self.deadline = deadline
+        self.budget_ratio = budget_ratio
+        self.budget_min = budget_min
+
+        self._lock = threading.Lock()
+        self._tokens = float(budget_min)
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        """Policy that never retries"""
+        return cls(max_attempts=1)
+
+    def is_retryable(self, method: str, idempotency_key: Optional[str] = None) -> bool:
+        """Whether a request may be sent more than once"""
+        return idempotency_key is not None or method.upper() in self.retry_methods
+
+    def start(self) -> Optional[float]:
+        """
+        Register a new call and compute its deadline
+
+        Returns:
+            Absolute time.monotonic() deadline, or None when unbounded
+        """
+        with self._lock:
+            self._tokens = min(self._tokens + self.budget_ratio, float(self.budget_min))
+        if self.deadline is None:
+            return None
+        return time.monotonic() + self.deadline
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retrying after the given (1-based) failed attempt"""
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def next_delay(self, attempt: int, deadline: Optional[float]) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt
+
+        Args:
+            attempt: Number of attempts made so far
+            deadline: Deadline returned by start()
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        delay = self.backoff(attempt)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return None
+
+        with self._lock:
+            if self._tokens < 1:
+                return None
+            self._tokens -= 1
+
+        return delay
@@ -0,0 +1,346 @@
+"""
+EDUZEN SEPA direct debit collection runs
+"""
+
+import hashlib
+import json
+import os
+import re
+from contextlib import nullcontext
+from datetime import date, timedelta
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+# IBAN length per SEPA country (overseas departments use FR IBANs)
+IBAN_LENGTHS: Dict[str, int] = {
+    "AD": 24, "AT": 20, "BE": 16, "BG": 22, "CH": 21, "CY": 28, "CZ": 24, "DE": 22,
+    "DK": 18, "EE": 20, "ES": 24, "FI": 18, "FR": 27, "GB": 22, "GI": 23, "GR": 27,
+    "HR": 21, "HU": 28, "IE": 22, "IS": 26, "IT": 27, "LI": 21, "LT": 20, "LU": 20,
+    "LV": 21, "MC": 27, "MT": 31, "NL": 18, "NO": 15, "PL": 28, "PT": 25, "RO": 24,
+    "SE": 24, "SI": 19, "SK": 24, "SM": 27, "VA": 22,
+}
+
+# Largest amount of a SEPA instruction
+MAX_AMOUNT = Decimal("999999999.99")
+
+INVALID_AMOUNT = "INVALID_AMOUNT"
+INVALID_CURRENCY = "INVALID_CURRENCY"
+INVALID_IBAN = "INVALID_IBAN"
+INVALID_BIC = "INVALID_BIC"
+INVALID_MANDATE = "INVALID_MANDATE"
+INVALID_CREDITOR_ID = "INVALID_CREDITOR_ID"
+INVALID_DUE_DATE = "INVALID_DUE_DATE"
+DUPLICATE = "DUPLICATE"
+
+SUBMITTED = "submitted"
+REJECTED = "rejected"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+_IBAN = re.compile(r"[A-Z]{2}[0-9]{2}[A-Z0-9]{11,30}")
+_BIC = re.compile(r"[A-Z]{4}[A-Z]{2}[A-Z0-9]{2}(?:[A-Z0-9]{3})?")
+_CREDITOR_ID = re.compile(r"([A-Z]{2})([0-9]{2})[A-Z0-9]{3}([A-Z0-9]{1,28})")
+# SEPA character set, as allowed in a mandate reference
+_MANDATE = re.compile(r"[A-Za-z0-9/?:().,'+ -]{1,35}")
+_DATE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+# ISO 13616 / ISO 7064: letters count as 10 (A) to 35 (Z)
+_LETTERS = str.maketrans({chr(c): str(c - 55) for c in range(ord("A"), ord("Z") + 1)})
+
+
+def _mod97(digits: str) -> int:
+    return int(digits.translate(_LETTERS)) % 97
+
+
+def _compact(value: str) -> str:
+    """Upper case, without the spaces of the printed form"""
+    return "".join(value.split()).upper()
+
+
+def normalize_iban(iban: str) -> str:
+    """IBAN without spaces, upper case"""
+    return _compact(iban)
+
+
+def validate_iban(iban: str) -> bool:
+    """Whether an IBAN is well formed, of a SEPA country, with a valid mod-97 checksum"""
+    iban = normalize_iban(iban)
+    if not _IBAN.fullmatch(iban) or IBAN_LENGTHS.get(iban[:2]) != len(iban):
+        return False
+    return _mod97(iban[4:] + iban[:4]) == 1
+
+
+def validate_bic(bic: str) -> bool:
+    """Whether a BIC has the 8 or 11 character ISO 9362 format"""
+    return _BIC.fullmatch(_compact(bic)) is not None
+
+
+def validate_creditor_id(creditor_id: str) -> bool:
+    """Whether a SEPA creditor identifier is well formed with valid check digits"""
+    match = _CREDITOR_ID.fullmatch(_compact(creditor_id))
+    if match is None:
+        return False
+    country, check, national = match.groups()
+    # The creditor business code (characters 5-7) is not part of the checksum
+    return _mod97(national + country + check) == 1
+
+
+class LedgerEntry(NamedTuple):
+    """Outcome of one debit of a collection run"""
+
+    index: int
+    status: str
+    idempotency_key: Optional[str]
+    due_date: Optional[str]
+    creditor_id: Optional[str]
+    amount: Optional[str]
+    reference: Optional[str]
+    payment_id: Optional[str] = None
+    errors: Tuple[str, ...] = ()
+
+    @property
+    def ok(self) -> bool:
+        """Whether the debit is submitted (in this run or a previous one)"""
+        return self.status in (SUBMITTED, SKIPPED)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+class _Debit(NamedTuple):
+    index: int
+    kwargs: Dict[str, Any]
+    idempotency_key: str
+    due_date: str
+    creditor_id: str
+    amount: str
+
+
+class CollectionRun:
+    """
+    Validate, group and submit a batch of SEPA direct debits
+
+    Debits are ``create_sepa_direct_debit`` keyword dicts. One local pass
+    checks amounts, currency, IBAN and creditor identifier checksums, BIC
+    format, mandate references and due dates, so invalid rows never cost a
+    call. Valid debits are grouped by due date and creditor, earliest due
+    date first, and submitted concurrently through the client's bulk helper.
+
+    Every debit gets an Idempotency-Key derived from the run ID and its
+    content, so re-running an interrupted run cannot debit twice. With a
+    ``ledger`` file, the run appends one JSON line per debit as it completes
+    and skips debits a previous attempt already submitted.
+
+    Usage:
+        run = CollectionRun(client, run_id="tuition-2026-10", ledger="tuition-2026-10.jsonl")
+        for entry in run.run(debits):
+            if not entry.ok:
+                print(entry.index, entry.status, entry.errors)
+        print(run.stats)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        run_id: str,
+        concurrency: int = 16,
+        ledger: Optional[str] = None,
+        today: Optional[date] = None,
+        min_lead_days: int = 1,
+    ):
+        """
+        Args:
+            client: EDUZENClient submitting the debits
+            run_id: Stable name of the run, e.g. "tuition-2026-10"; part of
+                every Idempotency-Key, so reuse it when resuming a run
+            concurrency: Debits submitted in parallel; keep it <= pool_maxsize (default: 16)
+            ledger: JSON Lines file the entries are appended to (default: none)
+            today: Reference date for due date checks (default: date.today())
+            min_lead_days: Days required between today and a due date (default: 1)
+        """
+        self.client = client
+        self.run_id = run_id
+        self.concurrency = concurrency
+        self.ledger = ledger
+        self.today = today
+        self.min_lead_days = min_lead_days
+        self.stats: Dict[str, int] = {SUBMITTED: 0, REJECTED: 0, FAILED: 0, SKIPPED: 0}
+        self._earliest: Optional[str] = None
+
+    def validate(self, debit: Dict[str, Any]) -> Tuple[str, ...]:
+        """Reasons the API or the banks would refuse a debit (empty when valid)"""
+        errors = []
+        amount = _amount(debit.get("amount"))
+        if amount is None:
+            errors.append(INVALID_AMOUNT)
+        if str(debit.get("currency", "EUR")).upper() != "EUR":
+            errors.append(INVALID_CURRENCY)
+        iban = debit.get("debtor_iban")
+        if not isinstance(iban, str) or not validate_iban(iban):
+            errors.append(INVALID_IBAN)
+        bic = debit.get("debtor_bic")
+        if bic is not None and (not isinstance(bic, str) or not validate_bic(bic)):
+            errors.append(INVALID_BIC)
+        mandate_id = debit.get("mandate_id")
+        if not isinstance(mandate_id, str) or not _MANDATE.fullmatch(mandate_id):
+            errors.append(INVALID_MANDATE)
+        creditor_id = debit.get("creditor_id")
+        if not isinstance(creditor_id, str) or not validate_creditor_id(creditor_id):
+            errors.append(INVALID_CREDITOR_ID)
+        if not self._valid_due_date(debit.get("due_date")):
+            errors.append(INVALID_DUE_DATE)
+        return tuple(errors)
+
+    def run(self, debits: Iterable[Dict[str, Any]]) -> Iterator[LedgerEntry]:
+        """
+        Validate and submit the debits
+
+        Rejected debits are reported during the validation pass, before any
+        call is made; submitted and failed ones as their calls complete.
+
+        Yields:
+            LedgerEntry per debit
+        """
+        done = self._submitted_keys()
+        self._earliest = self._earliest_due_date()
+        with self._open_ledger() as ledger:
+            groups: Dict[Tuple[str, str], List[_Debit]] = {}
+            seen: Set[str] = set()
+            for index, debit in enumerate(debits):
+                errors = self.validate(debit)
+                if errors:
+                    yield self._record(ledger, _rejected(index, debit, errors))
+                    continue
+                prepared = self._prepare(index, debit)
+                if prepared.idempotency_key in seen:
+                    yield self._record(ledger, _rejected(index, debit, (DUPLICATE,)))
+                    continue
+                seen.add(prepared.idempotency_key)
+                if prepared.idempotency_key in done:
+                    yield self._record(ledger, _entry(prepared, SKIPPED))
+                    continue
+                groups.setdefault((prepared.due_date, prepared.creditor_id), []).append(prepared)
+
+            batch = [debit for key in sorted(groups) for debit in groups[key]]
+            del groups
+            results = self.client.create_sepa_direct_debits_bulk(
+                (debit.kwargs for debit in batch), concurrency=self.concurrency
+            )
+            for result in results:
+                debit = batch[result.index]
+                if result.ok:
+                    payment_id = (result.result or {}).get("paymentId")
+                    yield self._record(ledger, _entry(debit, SUBMITTED, payment_id=payment_id))
+                else:
+                    yield self._record(ledger, _entry(debit, FAILED, errors=(str(result.error),)))
+
+    def idempotency_key(self, debit: Dict[str, Any]) -> str:
+        """Idempotency-Key of a debit in this run (an explicit ``idempotency_key`` wins)"""
+        explicit = debit.get("idempotency_key")
+        if explicit:
+            return explicit
+        fields = (
+            self.run_id,
+            normalize_iban(debit["debtor_iban"]),
+            debit["mandate_id"],
+            debit["creditor_id"],
+            debit["due_date"],
+            str(_amount(debit["amount"])),
+            debit.get("reference") or "",
+        )
+        return hashlib.sha256("\n".join(fields).encode("utf-8")).hexdigest()[:32]
+
+    # ========== INTERNALS ==========
+
+    def _earliest_due_date(self) -> str:
+        return ((self.today or date.today()) + timedelta(days=self.min_lead_days)).isoformat()
+
+    def _valid_due_date(self, value: Any) -> bool:
+        if not isinstance(value, str) or not _DATE.fullmatch(value):
+            return False
+        try:
+            date.fromisoformat(value)
+        except ValueError:
+            return False
+        # ISO dates order as strings
+        return value >= (self._earliest or self._earliest_due_date())
+
+    def _prepare(self, index: int, debit: Dict[str, Any]) -> _Debit:
+        key = self.idempotency_key(debit)
+        amount = _amount(debit["amount"])
+        # The API takes the amount in euros as a JSON number; a Decimal is not serializable
+        kwargs = dict(
+            debit, idempotency_key=key, debtor_iban=normalize_iban(debit["debtor_iban"]), amount=float(amount)
+        )
+        if debit.get("debtor_bic") is not None:
+            kwargs["debtor_bic"] = _compact(debit["debtor_bic"])
+        return _Debit(index, kwargs, key, debit["due_date"], debit["creditor_id"], str(amount))
+
+    def _submitted_keys(self) -> Set[str]:
+        """Idempotency keys the ledger records as submitted"""
+        if self.ledger is None or not os.path.exists(self.ledger):
+            return set()
+        keys = set()
+        with open(self.ledger, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Last line cut short by a crash
+                    continue
+                if entry.get("status") in (SUBMITTED, SKIPPED) and entry.get("idempotency_key"):
+                    keys.add(entry["idempotency_key"])
+        return keys
+
+    def _open_ledger(self) -> Any:
+        if self.ledger is None:
+            return nullcontext()
+        return open(self.ledger, "a", encoding="utf-8")
+
+    def _record(self, ledger: Any, entry: LedgerEntry) -> LedgerEntry:
+        self.stats[entry.status] += 1
+        if ledger is not None:
+            ledger.write(json.dumps(entry.as_dict(), ensure_ascii=False) + "\n")
+            # One line per completed debit survives a crash of the run
+            ledger.flush()
+        return entry
+
+
+def _amount(value: Any) -> Optional[Decimal]:
+    """Amount with at most two decimals, within SEPA bounds, or None"""
+    if isinstance(value, bool) or not isinstance(value, (int, float, str, Decimal)):
+        return None
+    try:
+        amount = Decimal(str(value))
+    except InvalidOperation:
+        return None
+    if not amount.is_finite() or amount <= 0 or amount > MAX_AMOUNT or amount != amount.quantize(Decimal("0.01")):
+        return None
+    return amount.quantize(Decimal("0.01"))
+
+
+def _rejected(index: int, debit: Dict[str, Any], errors: Tuple[str, ...]) -> LedgerEntry:
+    amount = _amount(debit.get("amount"))
+    return LedgerEntry(
+        index=index,
+        status=REJECTED,
+        idempotency_key=None,
+        due_date=debit.get("due_date"),
+        creditor_id=debit.get("creditor_id"),
+        amount=str(amount) if amount is not None else None,
+        reference=debit.get("reference"),
+        errors=errors,
+    )
+
+
+def _entry(debit: _Debit, status: str, payment_id: Optional[str] = None, errors: Tuple[str, ...] = ()) -> LedgerEntry:
+    return LedgerEntry(
+        index=debit.index,
+        status=status,
+        idempotency_key=debit.idempotency_key,
+        due_date=debit.due_date,
+        creditor_id=debit.creditor_id,
+        amount=debit.amount,
+        reference=debit.kwargs.get("reference"),
+        payment_id=payment_id,
+        errors=errors,
+    )
@@ -0,0 +1,143 @@
+"""
+EDUZEN API in-flight request coalescing
+"""
+
+import threading
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional
+
+from .deadline import remaining
+from .exceptions import EDUZENError, EDUZENTimeoutError
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+def _follower_error(error: BaseException) -> BaseException:
+    """
+    Copy of the shared call's exception for one waiting caller
+
+    Every caller then sets its own request_id and elapsed and grows its own
+    traceback; the shared call's exception is kept as the cause.
+    """
+    try:
+        copy = type(error).__new__(type(error))
+        copy.__dict__.update(error.__dict__)
+        copy.args = error.args
+    except Exception:
+        copy = EDUZENError(str(error))
+    copy.request_id = None
+    copy.elapsed = None
+    copy.__cause__ = error
+    return copy
+
+
+def _wait_timeout() -> EDUZENTimeoutError:
+    return EDUZENTimeoutError(message="Deadline exceeded waiting for an identical request in flight")
+
+
+class SingleFlight:
+    """
+    Collapse identical concurrent calls into one
+
+    While a call for a key is running, other threads asking for the same key
+    wait for it and receive the same result object (or a copy of its
+    exception) instead of issuing their own request. A waiting caller gives
+    up with EDUZENTimeoutError at its own deadline; the shared call goes on.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.coalesced = 0
+
+    def do(
+        self,
+        key: str,
+        func: Callable[[], Any],
+        on_coalesced: Optional[Callable[[], None]] = None,
+        deadline: Optional[float] = None,
+    ) -> Any:
+        """
+        Run ``func`` unless an identical call is already in flight
+
+        Args:
+            key: Identity of the call
+            func: Performs the call
+            on_coalesced: Called when the caller joins a call in flight
+            deadline: Absolute time.monotonic() limit on waiting for that call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            if on_coalesced is not None:
+                on_coalesced()
+            timeout = None if deadline is None else max(0.0, remaining(deadline))
+            if not call.done.wait(timeout):
+                raise _wait_timeout()
+            if call.error is not None:
+                raise _follower_error(call.error)
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """asyncio counterpart of SingleFlight, for calls on one event loop"""
+
+    def __init__(self):
+        self._calls: Dict[str, "asyncio.Future[Any]"] = {}
+        self.coalesced = 0
+
+    async def do(
+        self,
+        key: str,
+        func: Callable[[], Awaitable[Any]],
+        on_coalesced: Optional[Callable[[], None]] = None,
+        deadline: Optional[float] = None,
+    ) -> Any:
+        """Await ``func`` unless an identical call is already in flight; see SingleFlight.do"""
+        # Imported here, not with the module: the sync client never needs asyncio
+        import asyncio
+
+        future = self._calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+            if on_coalesced is not None:
+                on_coalesced()
+            timeout = None if deadline is None else max(0.0, remaining(deadline))
+            # wait() never cancels the shared call, whether the follower times out or is cancelled
+            await asyncio.wait({future}, timeout=timeout)
+            if not future.done():
+                raise _wait_timeout()
+            if not future.cancelled() and future.exception() is not None:
+                raise _follower_error(future.exception())
+            return future.result()
+
+        future = asyncio.ensure_future(func())
+        self._calls[key] = future
+        future.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(future)
@@ -0,0 +1,345 @@
+"""
+EDUZEN durable QR attendance scan spool
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .exceptions import EDUZENAPIError, EDUZENNetworkError
+from .retry import RetryPolicy
+
+_PENDING = 0
+_SENT = 1
+_REJECTED = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scans (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    qr_code TEXT NOT NULL,
+    student_id TEXT NOT NULL,
+    latitude REAL,
+    longitude REAL,
+    scanned_at REAL NOT NULL,
+    state INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    done_at REAL,
+    error TEXT,
+    UNIQUE (qr_code, student_id)
+);
+CREATE INDEX IF NOT EXISTS scans_due ON scans (state, next_attempt_at);
+"""
+
+
+class SpoolStats(NamedTuple):
+    """Queue depth and counters of a ScanSpool"""
+
+    pending: int
+    rejected: int
+    oldest_pending_age: Optional[float]
+    recorded: int
+    duplicates: int
+    delivered: int
+    retries: int
+
+
+class ScanSpool:
+    """
+    Durable local queue for QR attendance scans
+
+    ``record()`` only appends the scan to a SQLite (WAL) file and returns,
+    typically in tens of microseconds, whatever the state of the network.
+    A background thread sends spooled scans through ``scan_qr_codes_bulk``
+    with bounded concurrency. Network errors, 429 and 5xx responses are
+    retried with exponential backoff for as long as it takes, including
+    across restarts. Other 4xx responses (expired or invalid QR code) are
+    parked as rejected with their error until ``purge_rejected()`` hands them
+    over.
+
+    A (qr_code, student_id) pair is spooled once: repeated scans of the same
+    code by the same student are ignored while the pair is kept (``retention``
+    seconds after delivery, until purged when rejected). Delivery is at least once: a scan whose
+    response was lost is sent again.
+
+    Usage:
+        spool = ScanSpool(client, "scans.sqlite")
+        spool.record(qr_code="QR-123", student_id="student-1")
+        ...
+        spool.close(timeout=30)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        path: str,
+        concurrency: int = 8,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        max_attempts: Optional[int] = None,
+        backoff_factor: float = 1.0,
+        max_backoff: float = 60.0,
+        retention: float = 86400.0,
+        start: bool = True,
+    ):
+        """
+        Args:
+            client: EDUZENClient used to send scans
+            path: SQLite spool file
+            concurrency: Scans sent in parallel; keep it <= pool_maxsize (default: 8)
+            batch_size: Scans taken from the spool per round (default: 100)
+            flush_interval: Seconds between rounds when idle (default: 0.5)
+            max_attempts: Attempts before a scan is rejected, None to retry
+                until delivered (default: None)
+            backoff_factor: Base retry delay in seconds, doubled per attempt (default: 1)
+            max_backoff: Upper bound of a retry delay in seconds (default: 60)
+            retention: Seconds delivered scans are kept for deduplication (default: 1 day)
+            start: Start the background flusher now (default: True)
+        """
+        self.client = client
+        self.path = path
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self.retention = retention
+        self._backoff = RetryPolicy(backoff_factor=backoff_factor, max_backoff=max_backoff)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL: a commit survives a process crash, only an OS crash may lose the last scans
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        self._counters = {"recorded": 0, "duplicates": 0, "delivered": 0, "retries": 0}
+        self._wakeup = threading.Event()
+        self._idle = threading.Condition()
+        self._force = False
+        self._closed = False
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        if start:
+            self.start()
+
+    def start(self) -> None:
+        """Start the background flusher"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="eduzen-scan-spool", daemon=True)
+            self._thread.start()
+
+    # ========== RECORDING ==========
+
+    def record(
+        self,
+        qr_code: str,
+        student_id: str,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+    ) -> bool:
+        """
+        Spool a scan for delivery
+
+        Returns:
+            False when the same (qr_code, student_id) was already spooled
+        """
+        if self._closed:
+            raise RuntimeError("ScanSpool is closed")
+        with self._lock:
+            inserted = self._conn.execute(
+                "INSERT OR IGNORE INTO scans (qr_code, student_id, latitude, longitude, scanned_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (qr_code, student_id, latitude, longitude, time.time()),
+            ).rowcount
+            self._conn.commit()
+            self._counters["recorded" if inserted else "duplicates"] += 1
+        if inserted:
+            self._wakeup.set()
+        return bool(inserted)
+
+    # ========== FLUSHING ==========
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send every pending scan now, ignoring retry delays, and wait for delivery
+
+        Args:
+            timeout: Seconds to wait, None to wait until the spool is empty
+
+        Returns:
+            True when no scan is pending anymore
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while True:
+                depth = self._depth()
+                if depth == 0:
+                    return True
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                wait = self.flush_interval if remaining is None else min(self.flush_interval, remaining)
+                # Every round of the flush skips retry delays, not only the first
+                self._force = True
+                if self._thread is None:
+                    # No flusher thread: send from the caller, pausing when a round delivered nothing
+                    self._round()
+                    if self._depth() >= depth:
+                        time.sleep(wait)
+                    continue
+                self._wakeup.set()
+                self._idle.wait(wait)
+
+    def close(self, timeout: Optional[float] = 10.0) -> bool:
+        """
+        Stop accepting scans, try to deliver the pending ones and stop the flusher
+
+        Scans still pending after ``timeout`` stay in the spool file and are
+        sent by the next ScanSpool opened on it.
+
+        Returns:
+            True when every scan was delivered or rejected
+        """
+        self._closed = True
+        drained = self.flush(timeout)
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            self._conn.close()
+        return drained
+
+    def __enter__(self) -> "ScanSpool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self._stopping:
+                break
+            while self._round() >= self.batch_size and not self._stopping:
+                pass
+            self._prune()
+            with self._idle:
+                self._idle.notify_all()
+
+    def _round(self) -> int:
+        """Send one batch of due scans; returns the number of scans attempted"""
+        now = time.time()
+        force, self._force = self._force, False
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, qr_code, student_id, latitude, longitude, attempts FROM scans"
+                " WHERE state = ? AND next_attempt_at <= ? ORDER BY id LIMIT ?",
+                (_PENDING, float("inf") if force else now, self.batch_size),
+            ).fetchall()
+        if not rows:
+            return 0
+
+        scans = []
+        for _, qr_code, student_id, latitude, longitude, _ in rows:
+            scan: Dict[str, Any] = {"qr_code": qr_code, "student_id": student_id}
+            if latitude is not None:
+                scan["latitude"] = latitude
+            if longitude is not None:
+                scan["longitude"] = longitude
+            scans.append(scan)
+
+        delivered, retried, rejected = [], [], []
+        for result in self.client.scan_qr_codes_bulk(scans, concurrency=self.concurrency):
+            row_id, attempts = rows[result.index][0], rows[result.index][5] + 1
+            error = result.error
+            if error is None or (isinstance(error, EDUZENAPIError) and error.status_code == 409):
+                # 409: the API already has this scan (an earlier response was lost)
+                delivered.append((time.time(), row_id))
+            elif self._transient(error) and (self.max_attempts is None or attempts < self.max_attempts):
+                retried.append((attempts, time.time() + self._backoff.backoff(attempts), str(error), row_id))
+            else:
+                rejected.append((attempts, time.time(), str(error), row_id))
+
+        with self._lock:
+            self._conn.executemany(
+                f"UPDATE scans SET state = {_SENT}, attempts = attempts + 1, done_at = ?, error = NULL WHERE id = ?",
+                delivered,
+            )
+            self._conn.executemany(
+                "UPDATE scans SET attempts = ?, next_attempt_at = ?, error = ? WHERE id = ?", retried
+            )
+            self._conn.executemany(
+                f"UPDATE scans SET state = {_REJECTED}, attempts = ?, done_at = ?, error = ? WHERE id = ?", rejected
+            )
+            self._conn.commit()
+            self._counters["delivered"] += len(delivered)
+            self._counters["retries"] += len(retried)
+        return len(rows)
+
+    @staticmethod
+    def _transient(error: BaseException) -> bool:
+        if isinstance(error, EDUZENNetworkError):
+            return True
+        if isinstance(error, EDUZENAPIError):
+            return error.status_code is None or error.status_code == 429 or error.status_code >= 500
+        return False
+
+    def _prune(self) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM scans WHERE state = ? AND done_at < ?", (_SENT, time.time() - self.retention)
+            )
+            self._conn.commit()
+
+    # ========== METRICS ==========
+
+    def _depth(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM scans WHERE state = ?", (_PENDING,)).fetchone()[0]
+
+    @property
+    def stats(self) -> SpoolStats:
+        """Queue depth and counters since this spool was opened"""
+        with self._lock:
+            pending, oldest = self._conn.execute(
+                "SELECT count(*), min(scanned_at) FROM scans WHERE state = ?", (_PENDING,)
+            ).fetchone()
+            rejected = self._conn.execute("SELECT count(*) FROM scans WHERE state = ?", (_REJECTED,)).fetchone()[0]
+            counters = dict(self._counters)
+        return SpoolStats(
+            pending=pending,
+            rejected=rejected,
+            oldest_pending_age=time.time() - oldest if oldest is not None else None,
+            **counters,
+        )
+
+    def rejected(self) -> List[Dict[str, Any]]:
+        """Scans the API refused, with the error received"""
+        with self._lock:
+            return self._rejected_rows()
+
+    def purge_rejected(self) -> List[Dict[str, Any]]:
+        """
+        Remove the rejected scans from the spool and return them
+
+        Their (qr_code, student_id) pairs can then be recorded again, e.g.
+        once the student was given a fresh QR code.
+        """
+        with self._lock:
+            rows = self._rejected_rows()
+            self._conn.execute("DELETE FROM scans WHERE state = ?", (_REJECTED,))
+            self._conn.commit()
+        return rows
+
+    def _rejected_rows(self) -> List[Dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT qr_code, student_id, latitude, longitude, scanned_at, attempts, error"
+            " FROM scans WHERE state = ? ORDER BY id",
+            (_REJECTED,),
+        ).fetchall()
+        columns = ("qr_code", "student_id", "latitude", "longitude", "scanned_at", "attempts", "error")
+        return [dict(zip(columns, row)) for row in rows]
@@ -33,6 +33,18 @@ setup(
         "requests>=2.28.0",
     ],
     extras_require={
+        "async": [
+            "aiohttp>=3.8.0",
+        ],
+        "fast": [
+            "orjson>=3.6.0",
+        ],
+        "columnar": [
+            "pyarrow>=10.0.0",
+        ],
+        "geo": [
+            "numpy>=1.20.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -40,4 +52,3 @@ setup(
     },
     test_suite="tests",
 )
-
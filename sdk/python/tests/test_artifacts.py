@@ -0,0 +1,225 @@
+"""
+Tests unitaires pour le stockage local des documents générés
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from datetime import date
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+from eduzen import AsyncEDUZENClient, EDUZENAPIError, EDUZENClient
+from eduzen.artifacts import ArtifactStore
+
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+except ImportError:  # pragma: no cover - optional dependency
+    web = None
+
+PDF = b"%PDF-1.7 attestation"
+
+
+def _json_response(payload):
+    response = Mock()
+    response.status_code = 200
+    response.headers = {}
+    response.content = json.dumps(payload).encode()
+    response.raise_for_status = Mock()
+    return response
+
+
+def _file_response(content, status_code=200):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = {}
+    response.iter_content = lambda chunk_size: iter([content[:4], content[4:]])
+    return response
+
+
+class TestArtifactStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.store = ArtifactStore(self.directory, max_bytes=100)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_key_is_canonical(self):
+        """Test the key ignores variable order and depends on template version and format"""
+        key = ArtifactStore.key("tpl-1", 3, "pdf", {"name": "Jane", "amount": Decimal("10.50")})
+
+        self.assertEqual(key, ArtifactStore.key("tpl-1", "3", "PDF", {"amount": Decimal("10.50"), "name": "Jane"}))
+        self.assertNotEqual(key, ArtifactStore.key("tpl-1", 4, "pdf", {"name": "Jane", "amount": Decimal("10.50")}))
+        self.assertNotEqual(key, ArtifactStore.key("tpl-1", 3, "docx", {"name": "Jane", "amount": Decimal("10.50")}))
+        self.assertEqual(len(ArtifactStore.key("tpl-1", 3, "pdf", {"date": date(2026, 1, 5)})), 64)
+
+    def test_put_and_mmap_read(self):
+        """Test a stored document is read back through a read-only map"""
+        key = ArtifactStore.key("tpl-1", 1, "pdf")
+        self.assertIsNone(self.store.get(key))
+
+        self.store.put(key, PDF)
+        artifact = self.store.get(key)
+
+        self.assertEqual(artifact.size, len(PDF))
+        with artifact.open() as mapped:
+            self.assertEqual(mapped[:4], b"%PDF")
+            with self.assertRaises(TypeError):
+                mapped[0] = 0
+        self.assertEqual(artifact.read(), PDF)
+
+    def test_lru_eviction_by_size(self):
+        """Test the least recently used documents are removed beyond max_bytes"""
+        for name in ("a", "b"):
+            self.store.put(name * 64, b"x" * 40)
+        self.store.get("a" * 64)
+
+        self.store.put("c" * 64, b"x" * 40)
+
+        self.assertIn("a" * 64, self.store)
+        self.assertNotIn("b" * 64, self.store)
+        self.assertIn("c" * 64, self.store)
+        self.assertEqual(self.store.stats["bytes"], 80)
+
+    def test_failed_write_leaves_nothing(self):
+        """Test an interrupted write neither publishes the document nor leaves a temporary file"""
+        key = "e" * 64
+        with self.assertRaises(RuntimeError):
+            with self.store.writer(key) as f:
+                f.write(b"partial")
+                raise RuntimeError("connection lost")
+        with self.assertRaises(ValueError):
+            with self.store.writer(key):
+                pass
+
+        self.assertIsNone(self.store.get(key))
+        self.assertEqual(os.listdir(os.path.join(self.directory, "ee")), [])
+
+    def test_write_is_synced_before_rename(self):
+        """Test the document reaches the disk before it is published under its key"""
+        calls = []
+        fsync, replace = os.fsync, os.replace
+
+        def record_fsync(fd):
+            calls.append("fsync")
+            fsync(fd)
+
+        def record_replace(src, dst):
+            calls.append("replace")
+            replace(src, dst)
+
+        with patch("eduzen.artifacts.os.fsync", side_effect=record_fsync), patch(
+            "eduzen.artifacts.os.replace", side_effect=record_replace
+        ):
+            self.store.put("f" * 64, PDF)
+
+        self.assertEqual(calls, ["fsync", "replace"])
+
+    def test_reopen_indexes_existing_documents(self):
+        """Test a new store finds the documents of previous runs in LRU order"""
+        self.store.put("a" * 64, b"x" * 40)
+        self.store.put("b" * 64, b"x" * 40)
+        past = time.time() - 60
+        os.utime(self.store.path("b" * 64), (past, past))
+
+        reopened = ArtifactStore(self.directory, max_bytes=60)
+
+        self.assertEqual(len(reopened), 1)
+        self.assertIn("a" * 64, reopened)
+        self.assertNotIn("b" * 64, reopened)
+
+
+class TestFetchDocument(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.store = ArtifactStore(self.directory)
+        self.client = EDUZENClient(api_key="test-api-key", document_store=self.store)
+
+    def tearDown(self):
+        self.client.close()
+        shutil.rmtree(self.directory)
+
+    @patch("requests.Session.request")
+    def test_second_fetch_is_served_from_disk(self, mock_request):
+        """Test an identical document is generated and downloaded once"""
+        mock_request.side_effect = [
+            _json_response({"downloadUrl": "https://storage.example.com/doc.pdf?token=abc"}),
+            _file_response(PDF),
+        ]
+        variables = {"student_name": "Jane Doe", "date": "2026-01-05"}
+
+        first = self.client.fetch_document("tpl-1", "2026-01-01", variables=variables)
+        second = self.client.fetch_document("tpl-1", "2026-01-01", variables=dict(reversed(variables.items())))
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(second.path, first.path)
+        self.assertEqual(second.read(), PDF)
+        self.assertEqual((self.store.hits, self.store.misses), (1, 1))
+        download = mock_request.call_args_list[1]
+        self.assertEqual(download[0][:2], ("GET", "https://storage.example.com/doc.pdf?token=abc"))
+        self.assertNotIn("X-API-Key", download[1]["headers"])
+
+    @patch("requests.Session.request")
+    def test_failed_download_is_not_stored(self, mock_request):
+        """Test a download error raises and leaves the store empty"""
+        mock_request.side_effect = [_json_response({"file_url": "/files/doc.pdf"}), _file_response(b"", 404)]
+
+        with self.assertRaises(EDUZENAPIError):
+            self.client.fetch_document("tpl-1", 1)
+
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(mock_request.call_args_list[1][0][1], "https://app.eduzen.com/files/doc.pdf")
+
+    def test_requires_document_store(self):
+        """Test fetch_document is refused without a document store"""
+        with self.assertRaises(ValueError):
+            EDUZENClient(api_key="test-api-key").fetch_document("tpl-1", 1)
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncFetchDocument(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.downloads = []
+
+        async def generate(request):
+            return web.json_response({"document": {"id": "doc-1"}, "downloadUrl": "/api/files/doc-1.pdf"})
+
+        async def download(request):
+            self.downloads.append(request.headers.get("X-API-Key"))
+            return web.Response(body=PDF, content_type="application/pdf")
+
+        app = web.Application()
+        app.router.add_post("/api/documents/generate", generate)
+        app.router.add_get("/api/files/doc-1.pdf", download)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.client = AsyncEDUZENClient(
+            base_url=str(self.server.make_url("/api")),
+            api_key="test-api-key",
+            document_store=ArtifactStore(self.directory),
+        )
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.server.close()
+        shutil.rmtree(self.directory)
+
+    async def test_second_fetch_is_served_from_disk(self):
+        """Test the async client downloads a document once and then serves it from disk"""
+        first = await self.client.fetch_document("tpl-1", 1, variables={"name": "Jane"})
+        second = await self.client.fetch_document("tpl-1", 1, variables={"name": "Jane"})
+
+        self.assertEqual(first.read(), PDF)
+        self.assertEqual(second.path, first.path)
+        # Same host as the API: the download is authenticated
+        self.assertEqual(self.downloads, ["test-api-key"])
+
+
+if __name__ == "__main__":
+    unittest.main()
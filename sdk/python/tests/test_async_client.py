@@ -0,0 +1,194 @@
+"""
+Tests unitaires pour AsyncEDUZENClient
+"""
+
+import asyncio
+import io
+import unittest
+import zipfile
+
+from eduzen import EDUZENClient, AsyncEDUZENClient, EDUZENAPIError, EDUZENNetworkError
+
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+except ImportError:  # pragma: no cover - optional dependency
+    web = None
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncEDUZENClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.qr_requests = 0
+        self.batch_chunk_delay = 0.0
+
+        async def students(request):
+            page, limit = int(request.query["page"]), int(request.query["limit"])
+            records = [{"id": f"student-{i}", "email": "jane@example.com"} for i in range(5)]
+            return web.json_response({
+                "data": records[(page - 1) * limit:page * limit],
+                "meta": {"page": page, "limit": limit, "total": len(records)},
+                "api_key": request.headers.get("X-API-Key"),
+            })
+
+        async def create_user(request):
+            body = await request.json()
+            if "@" not in body["email"]:
+                return web.json_response(
+                    {"message": "Validation error", "code": "VALIDATION_ERROR"}, status=400
+                )
+            return web.json_response({"user": body})
+
+        async def active_sessions(request):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return web.json_response({"sessions": []})
+
+        async def active_qr_code(request):
+            self.qr_requests += 1
+            await asyncio.sleep(0.02)
+            return web.json_response({"session_id": request.match_info["session_id"]})
+
+        async def compliance(request):
+            return web.Response(status=502, text="Bad gateway")
+
+        async def generate_batch(request):
+            body = await request.json()
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, "w") as archive:
+                for i, item in enumerate(body["items"]):
+                    archive.writestr(f"doc_{i}.{body['format'].lower()}", item["variables"]["name"])
+            if not self.batch_chunk_delay:
+                return web.Response(body=buffer.getvalue(), content_type="application/zip")
+            # Trickle the archive out, slower overall than the client timeout
+            response = web.StreamResponse(headers={"Content-Type": "application/zip"})
+            await response.prepare(request)
+            data = buffer.getvalue()
+            for start in range(0, len(data), 64):
+                await asyncio.sleep(self.batch_chunk_delay)
+                await response.write(data[start:start + 64])
+            await response.write_eof()
+            return response
+
+        app = web.Application()
+        app.router.add_get("/api/v1/students", students)
+        app.router.add_post("/api/users/create", create_user)
+        app.router.add_get("/api/sessions/active", active_sessions)
+        app.router.add_post("/api/compliance/alerts/check", compliance)
+        app.router.add_get("/api/qr-attendance/active/{session_id}", active_qr_code)
+        app.router.add_post("/api/documents/generate-batch", generate_batch)
+
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.client = AsyncEDUZENClient(
+            base_url=str(self.server.make_url("/api")),
+            api_key="test-api-key",
+            max_concurrency=4,
+        )
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.server.close()
+
+    def test_mirrors_sync_client_methods(self):
+        """Test every public EDUZENClient endpoint exists on the async client"""
+        sync_methods = {name for name in dir(EDUZENClient) if not name.startswith("_")}
+        async_methods = {name for name in dir(AsyncEDUZENClient) if not name.startswith("_")}
+        self.assertEqual(sync_methods - async_methods, set())
+
+    async def test_get_students(self):
+        """Test getting students"""
+        result = await self.client.get_students(organization_id="org-123", limit=10)
+
+        self.assertEqual(result["data"][0]["email"], "jane@example.com")
+        self.assertEqual(result["meta"]["limit"], 10)
+        self.assertEqual(result["api_key"], "test-api-key")
+
+    async def test_iter_students(self):
+        """Test iter_students streams every page"""
+        ids = [student["id"] async for student in self.client.iter_students("org-123", page_size=2)]
+
+        self.assertEqual(ids, [f"student-{i}" for i in range(5)])
+
+    async def test_create_users_bulk(self):
+        """Test bulk creation reports each row"""
+        users = [
+            {"email": "a@example.com", "full_name": "A", "organization_id": "org-123"},
+            {"email": "invalid", "full_name": "B", "organization_id": "org-123"},
+        ]
+
+        results = [r async for r in self.client.create_users_bulk(users, ordered=True)]
+
+        self.assertTrue(results[0].ok)
+        self.assertEqual(results[1].error.code, "VALIDATION_ERROR")
+
+    async def test_iter_documents_batch(self):
+        """Test batch documents are streamed and iterated"""
+        items = [{"variables": {"name": "Jane"}}, {"variables": {"name": "John"}}]
+
+        documents = [d async for d in self.client.iter_documents_batch("template-123", items)]
+
+        self.assertEqual([(d.filename, d.content) for d in documents], [("doc_0.pdf", b"Jane"), ("doc_1.pdf", b"John")])
+
+    async def test_slow_download_is_not_cut_off(self):
+        """Test timeout bounds each read, not a streamed body that keeps arriving"""
+        client = AsyncEDUZENClient(base_url=str(self.server.make_url("/api")), api_key="test-api-key", timeout=0.2)
+        self.addAsyncCleanup(client.close)
+        self.batch_chunk_delay = 0.08
+        items = [{"variables": {"name": "Jane"}}, {"variables": {"name": "John"}}]
+
+        started = asyncio.get_running_loop().time()
+        documents = [d async for d in client.iter_documents_batch("template-123", items)]
+
+        self.assertGreater(asyncio.get_running_loop().time() - started, 0.2)
+        self.assertEqual([d.content for d in documents], [b"Jane", b"John"])
+
+    async def test_identical_gets_are_coalesced(self):
+        """Test concurrent identical GETs share a single request"""
+        results = await asyncio.gather(*(self.client.get_active_qr_code("session-1") for _ in range(50)))
+
+        self.assertEqual(self.qr_requests, 1)
+        self.assertTrue(all(r == {"session_id": "session-1"} for r in results))
+        self.assertEqual(self.client.coalesced_requests, 49)
+
+    async def test_api_error_handling(self):
+        """Test API error handling"""
+        with self.assertRaises(EDUZENAPIError) as context:
+            await self.client.create_user(
+                email="invalid-email",
+                full_name="Test",
+                organization_id="org-123",
+            )
+
+        self.assertEqual(context.exception.code, "VALIDATION_ERROR")
+        self.assertEqual(context.exception.status_code, 400)
+
+    async def test_non_json_error_handling(self):
+        """Test errors without a JSON body map to HTTP_<status>"""
+        with self.assertRaises(EDUZENAPIError) as context:
+            await self.client.check_compliance_alerts()
+
+        self.assertEqual(context.exception.code, "HTTP_502")
+
+    async def test_network_error_handling(self):
+        """Test network error handling"""
+        client = AsyncEDUZENClient(base_url="http://127.0.0.1:1/api", api_key="test-api-key")
+        try:
+            with self.assertRaises(EDUZENNetworkError):
+                await client.get_active_sessions()
+        finally:
+            await client.close()
+
+    async def test_concurrency_is_bounded(self):
+        """Test in-flight requests never exceed max_concurrency"""
+        await asyncio.gather(*(self.client.get_active_sessions() for _ in range(20)))
+
+        self.assertLessEqual(self.max_in_flight, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Tests unitaires pour les appels en masse
+"""
+
+import itertools
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from eduzen import EDUZENClient, EDUZENAPIError
+from eduzen.bulk import bulk_map
+
+
+class TestBulkMap(unittest.TestCase):
+    def test_ordered_results(self):
+        """Test ordered mode yields results in input order"""
+        def slow_double(n):
+            time.sleep(0.001 * (10 - n))
+            return {"value": n * 2}
+
+        results = list(bulk_map(slow_double, range(10), concurrency=4, ordered=True))
+
+        self.assertEqual([r.index for r in results], list(range(10)))
+        self.assertEqual([r.result["value"] for r in results], [n * 2 for n in range(10)])
+
+    def test_concurrency_is_bounded(self):
+        """Test no more than `concurrency` calls run at once"""
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def work(n):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.005)
+            with lock:
+                state["running"] -= 1
+            return {}
+
+        list(bulk_map(work, range(40), concurrency=3))
+
+        self.assertLessEqual(state["peak"], 3)
+
+    def test_input_is_read_lazily(self):
+        """Test the input iterable is not drained ahead of consumption"""
+        source = itertools.count()
+        results = bulk_map(lambda n: {"value": n}, source, concurrency=2)
+
+        next(results)
+        results.close()
+
+        self.assertLess(next(source), 10)
+
+
+class TestClientBulk(unittest.TestCase):
+    def setUp(self):
+        self.client = EDUZENClient(api_key="test-api-key")
+
+    def test_create_users_bulk_reports_bad_rows(self):
+        """Test a failing row is reported without aborting the batch"""
+        def create_user(**user):
+            if "@" not in user["email"]:
+                raise EDUZENAPIError(message="Validation error", code="VALIDATION_ERROR", status_code=400)
+            return {"user": user}
+
+        users = [
+            {"email": "a@example.com", "full_name": "A", "organization_id": "org-123"},
+            {"email": "invalid", "full_name": "B", "organization_id": "org-123"},
+            {"full_name": "C"},
+            {"email": "d@example.com", "full_name": "D", "organization_id": "org-123"},
+        ]
+        with patch.object(self.client, "create_user", side_effect=create_user):
+            results = sorted(self.client.create_users_bulk(users, concurrency=2), key=lambda r: r.index)
+
+        self.assertEqual([r.ok for r in results], [True, False, False, True])
+        self.assertEqual(results[1].error.code, "VALIDATION_ERROR")
+        self.assertIsInstance(results[2].error, KeyError)
+
+    def test_scan_qr_codes_bulk(self):
+        """Test scans are forwarded to scan_qr_code"""
+        scans = [{"qr_code": "QR-1", "student_id": f"student-{i}"} for i in range(5)]
+
+        with patch.object(self.client, "scan_qr_code", return_value={"success": True}) as mock_scan:
+            results = list(self.client.scan_qr_codes_bulk(scans, concurrency=3, ordered=True))
+
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual(mock_scan.call_count, 5)
+        mock_scan.assert_any_call(qr_code="QR-1", student_id="student-4")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+Tests unitaires pour le cache de réponses
+"""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from eduzen import EDUZENClient
+from eduzen.cache import ResponseCache
+
+
+def make_response(status_code, payload=None, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = json.dumps(payload).encode() if payload is not None else b""
+    response.json.return_value = payload
+    response.raise_for_status = Mock()
+    return response
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResponseCache(maxsize=2)
+        self.client = EDUZENClient(api_key="test-api-key", cache=self.cache)
+
+    @patch("requests.Session.request")
+    def test_fresh_entry_served_without_request(self, mock_request):
+        """Test identical reads within the TTL hit the cache"""
+        mock_request.return_value = make_response(200, {"sessions": [1]})
+
+        first = self.client.get_active_sessions()
+        second = self.client.get_active_sessions()
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(self.cache.stats["hits"], 1)
+
+    @patch("requests.Session.request")
+    def test_cached_results_are_independent_copies(self, mock_request):
+        """Test mutating a returned dict does not corrupt the cache"""
+        mock_request.return_value = make_response(200, {"sessions": [1]})
+
+        self.client.get_active_sessions()["sessions"].append(2)
+
+        self.assertEqual(self.client.get_active_sessions(), {"sessions": [1]})
+
+    @patch("requests.Session.request")
+    def test_key_includes_params_and_identity(self, mock_request):
+        """Test different params or credentials do not share entries"""
+        mock_request.side_effect = lambda *a, **kw: make_response(200, {"page": kw["params"]["page"]})
+        other = EDUZENClient(api_key="other-key", cache=self.cache)
+
+        self.client.get_students("org-123", page=1)
+        self.client.get_students("org-123", page=2)
+        other.get_students("org-123", page=1)
+
+        self.assertEqual(mock_request.call_count, 3)
+
+    def test_key_escapes_param_values(self):
+        """Test values containing & or = do not collide with other params"""
+        key = self.cache.key
+
+        self.assertNotEqual(
+            key("GET", "/v1/students", {"search": "a&page=2"}, "identity"),
+            key("GET", "/v1/students", {"search": "a", "page": "2"}, "identity"),
+        )
+        self.assertNotEqual(
+            key("GET", "/v1/students", {"search": "a=b"}, "identity"),
+            key("GET", "/v1/students", {"search=a": "b"}, "identity"),
+        )
+
+    @patch("requests.Session.request")
+    def test_stale_entry_revalidated_with_etag(self, mock_request):
+        """Test stale entries send If-None-Match and reuse the body on 304"""
+        self.cache.ttls["/sessions/active"] = 0
+        mock_request.side_effect = [
+            make_response(200, {"sessions": [1]}, {"ETag": '"v1"'}),
+            make_response(304),
+        ]
+
+        self.client.get_active_sessions()
+        result = self.client.get_active_sessions()
+
+        self.assertEqual(result, {"sessions": [1]})
+        self.assertEqual(mock_request.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(self.cache.stats["revalidations"], 1)
+
+    @patch("requests.Session.request")
+    def test_mutation_invalidates_related_entries(self, mock_request):
+        """Test deactivate_qr_code drops cached active QR codes"""
+        mock_request.side_effect = lambda *a, **kw: make_response(200, {"url": a[1]})
+
+        self.client.get_active_qr_code("session-1")
+        self.client.deactivate_qr_code("qr-1")
+        self.client.get_active_qr_code("session-1")
+
+        self.assertEqual(mock_request.call_count, 3)
+
+    @patch("requests.Session.request")
+    def test_lru_eviction(self, mock_request):
+        """Test the least recently used entry is evicted"""
+        mock_request.side_effect = lambda *a, **kw: make_response(200, {"url": a[1]})
+
+        self.client.get_active_qr_code("s1")
+        self.client.get_active_qr_code("s2")
+        self.client.get_active_qr_code("s1")
+        self.client.get_active_qr_code("s3")
+        self.client.get_active_qr_code("s1")
+        self.client.get_active_qr_code("s2")
+
+        self.assertEqual(mock_request.call_count, 4)
+
+    @patch("requests.Session.request")
+    def test_uncached_paths_bypass_cache(self, mock_request):
+        """Test endpoints without a TTL always reach the API"""
+        mock_request.return_value = make_response(200, {"ok": True})
+        self.cache.ttls.clear()
+
+        self.client.get_active_sessions()
+        self.client.get_active_sessions()
+
+        self.assertEqual(mock_request.call_count, 2)
+
+
+class TestDiskCache(unittest.TestCase):
+    def test_entries_survive_restart(self):
+        """Test the on-disk backend persists entries across cache instances"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite")
+            cache = ResponseCache(path=path)
+            key = cache.key("GET", "/sessions/active", None, "identity")
+            cache.store(key, "/sessions/active", b'{"sessions": []}', {"ETag": '"v1"'})
+            cache.backend.close()
+
+            reopened = ResponseCache(path=path)
+            entry = reopened.get(key)
+            self.assertEqual(entry.body, b'{"sessions": []}')
+            self.assertEqual(entry.etag, '"v1"')
+            self.assertGreater(entry.expires_at, time.time())
+
+            self.assertEqual(reopened.invalidate("/sessions/revoke"), 1)
+            self.assertIsNone(reopened.get(key))
+            reopened.backend.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
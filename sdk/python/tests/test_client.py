@@ -2,6 +2,8 @@
 Tests unitaires pour EDUZENClient
 """
 
+import json
+import time
 import unittest
 from unittest.mock import Mock, patch
 from eduzen import EDUZENClient, EDUZENAPIError, EDUZENNetworkError
@@ -15,15 +17,15 @@ class TestEDUZENClient(unittest.TestCase):
             api_key="test-api-key",
         )
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_generate_2fa_secret(self, mock_request):
         """Test generation of 2FA secret"""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "secret": "JBSWY3DPEHPK3PXP",
             "qrCodeUrl": "data:image/png;base64,...",
             "backupCodes": ["A1B2C3D4", "E5F6G7H8"],
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_request.return_value = mock_response
 
@@ -35,11 +37,11 @@ class TestEDUZENClient(unittest.TestCase):
         self.assertEqual(call_args[0][0], "POST")
         self.assertIn("/2fa/generate-secret", call_args[0][1])
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_create_user(self, mock_request):
         """Test user creation"""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "user": {
                 "id": "user-123",
                 "email": "teacher@example.com",
@@ -48,7 +50,7 @@ class TestEDUZENClient(unittest.TestCase):
                 "is_active": True,
             },
             "message": "Utilisateur créé avec succès",
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_request.return_value = mock_response
 
@@ -62,11 +64,11 @@ class TestEDUZENClient(unittest.TestCase):
         self.assertEqual(result["user"]["email"], "teacher@example.com")
         mock_request.assert_called_once()
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_get_students(self, mock_request):
         """Test getting students"""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "data": [
                 {
                     "id": "student-123",
@@ -85,7 +87,7 @@ class TestEDUZENClient(unittest.TestCase):
                 "hasNextPage": False,
                 "hasPreviousPage": False,
             },
-        }
+        }).encode()
         mock_response.raise_for_status = Mock()
         mock_request.return_value = mock_response
 
@@ -98,7 +100,7 @@ class TestEDUZENClient(unittest.TestCase):
         self.assertEqual(len(result["data"]), 1)
         self.assertEqual(result["data"][0]["email"], "jane@example.com")
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_api_error_handling(self, mock_request):
         """Test API error handling"""
         mock_response = Mock()
@@ -123,7 +125,7 @@ class TestEDUZENClient(unittest.TestCase):
         self.assertEqual(context.exception.code, "VALIDATION_ERROR")
         self.assertEqual(context.exception.status_code, 400)
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_network_error_handling(self, mock_request):
         """Test network error handling"""
         mock_request.side_effect = requests.exceptions.RequestException("Network error")
@@ -133,11 +135,69 @@ class TestEDUZENClient(unittest.TestCase):
 
         self.assertIn("Network error", str(context.exception))
 
+    def test_iter_students_streams_all_pages(self):
+        """Test iter_students walks pages until a short page"""
+        students = [{"id": f"student-{i}"} for i in range(5)]
 
-if __name__ == "__main__":
-    unittest.main()
+        def get_students(organization_id, page, limit, search):
+            return {"data": students[(page - 1) * limit:page * limit], "meta": {"total": 999}}
+
+        with patch.object(self.client, "get_students", side_effect=get_students) as mock_get:
+            result = list(self.client.iter_students("org-123", page_size=2))
+
+        self.assertEqual([s["id"] for s in result], [s["id"] for s in students])
+        self.assertEqual([c.kwargs["page"] for c in mock_get.call_args_list], [1, 2, 3])
 
+    def test_iter_students_prefetches_next_page(self):
+        """Test page N+1 is requested before page N is fully consumed"""
+        calls = []
 
+        def get_students(organization_id, page, limit, search):
+            calls.append(page)
+            return {"data": [{"id": f"p{page}-{i}"} for i in range(2)] if page < 3 else []}
 
+        with patch.object(self.client, "get_students", side_effect=get_students):
+            iterator = self.client.iter_students("org-123", page_size=2)
+            self.assertEqual(next(iterator)["id"], "p1-0")
+            for _ in range(50):
+                if 2 in calls:
+                    break
+                time.sleep(0.01)
+            self.assertIn(2, calls)
+            iterator.close()
 
 
+class TestEDUZENClientTransport(unittest.TestCase):
+    def test_session_is_pooled_and_reused(self):
+        """Test the client keeps a single pooled session"""
+        client = EDUZENClient(api_key="test-api-key", pool_maxsize=32)
+
+        session = client.session
+        self.assertIs(client.session, session)
+        adapter = session.get_adapter("https://app.eduzen.com/api")
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+        client.close()
+        self.assertIsNot(client.session, session)
+
+    def test_context_manager_closes_session(self):
+        """Test the context manager closes the owned session"""
+        with patch.object(requests.Session, "close") as mock_close:
+            with EDUZENClient(api_key="test-api-key") as client:
+                client.session
+        mock_close.assert_called_once()
+
+    def test_shared_session_is_not_closed(self):
+        """Test a session passed in by the caller is left open"""
+        shared = requests.Session()
+        client = EDUZENClient(api_key="test-api-key", session=shared)
+
+        with patch.object(shared, "close") as mock_close:
+            client.close()
+
+        mock_close.assert_not_called()
+        self.assertIs(client.session, shared)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Tests unitaires pour les codecs JSON
+"""
+
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+from eduzen import EDUZENClient, EDUZENNetworkError
+from eduzen.codec import JSONCodec, get_codec
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class TestCodecs(unittest.TestCase):
+    def test_stdlib_roundtrip(self):
+        """Test the stdlib codec encodes to bytes and decodes bytes and memoryviews"""
+        codec = get_codec("json")
+        payload = {"student_name": "Élodie", "amount": 10000, "tags": [1, 2]}
+
+        encoded = codec.dumps(payload)
+
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(codec.loads(encoded), payload)
+        self.assertEqual(codec.loads(memoryview(encoded)), payload)
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_fastest_codec_is_selected(self):
+        """Test orjson is preferred when installed"""
+        codec = get_codec()
+
+        self.assertEqual(codec.name, "orjson")
+        self.assertEqual(codec.loads(codec.dumps({1: "a"})), {"1": "a"})
+
+    def test_falls_back_to_stdlib(self):
+        """Test the stdlib codec is used when no fast library imports"""
+        with patch.dict("sys.modules", {"orjson": None, "ujson": None}):
+            self.assertIsInstance(get_codec(), JSONCodec)
+            self.assertEqual(get_codec().name, "json")
+
+    def test_unknown_codec(self):
+        """Test an unknown codec name is rejected"""
+        with self.assertRaises(ValueError):
+            get_codec("yaml")
+
+
+class TestClientCodec(unittest.TestCase):
+    def setUp(self):
+        self.client = EDUZENClient(api_key="test-api-key")
+
+    def make_response(self, content):
+        response = Mock()
+        response.status_code = 200
+        response.headers = {}
+        response.content = content
+        response.raise_for_status = Mock()
+        return response
+
+    @patch("requests.Session.request")
+    def test_body_is_encoded_with_codec(self, mock_request):
+        """Test request bodies are sent as encoded bytes"""
+        mock_request.return_value = self.make_response(b'{"success": true}')
+
+        self.client.scan_qr_code(qr_code="QR-1", student_id="student-1")
+
+        body = mock_request.call_args.kwargs["data"]
+        self.assertIsInstance(body, bytes)
+        self.assertEqual(json.loads(body), {"qr_code": "QR-1", "student_id": "student-1"})
+
+    @patch("requests.Session.request")
+    def test_pre_encoded_body_is_sent_untouched(self, mock_request):
+        """Test bytes bodies skip encoding"""
+        mock_request.return_value = self.make_response(b'{"success": true}')
+        body = self.client.encode_body({"qr_code": "QR-1", "student_id": "student-1"})
+
+        result = self.client.request("POST", "/qr-attendance/scan", data=body)
+
+        self.assertIs(mock_request.call_args.kwargs["data"], body)
+        self.assertEqual(result, {"success": True})
+
+    @patch("requests.Session.request")
+    def test_invalid_json_raises_network_error(self, mock_request):
+        """Test an undecodable body maps to EDUZENNetworkError"""
+        mock_request.return_value = self.make_response(b"<html>")
+
+        with self.assertRaises(EDUZENNetworkError):
+            self.client.get_active_sessions()
+
+
+if __name__ == "__main__":
+    unittest.main()
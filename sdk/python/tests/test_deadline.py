@@ -0,0 +1,285 @@
+"""
+Tests unitaires pour les délais d'appel et les requêtes couvertes (hedging)
+"""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from eduzen import AsyncEDUZENClient, EDUZENAPIError, EDUZENClient
+from eduzen.deadline import HedgePolicy, deadline
+from eduzen.exceptions import EDUZENNetworkError, EDUZENTimeoutError
+from eduzen.retry import RetryPolicy
+
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+except ImportError:  # pragma: no cover - optional dependency
+    web = None
+
+QR_ENDPOINT = "/qr-attendance/active/{session_id}"
+
+
+def _response(payload, status_code=200):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = {}
+    response.content = json.dumps(payload).encode()
+    response.raise_for_status = Mock()
+    return response
+
+
+def _warm(policy, endpoint=QR_ENDPOINT, seconds=0.02, count=20):
+    for _ in range(count):
+        policy.record(endpoint, seconds)
+
+
+class TestDeadlines(unittest.TestCase):
+    def setUp(self):
+        self.client = EDUZENClient(
+            api_key="test-api-key",
+            deadlines={"/qr-attendance/scan": 0.5},
+            coalesce_requests=False,
+        )
+
+    @patch("requests.Session.request")
+    def test_endpoint_deadline_bounds_attempt_timeout(self, mock_request):
+        """Test an endpoint deadline caps the connect/read timeout of its calls only"""
+        mock_request.return_value = _response({"success": True})
+
+        self.client.scan_qr_code(qr_code="QR-1", student_id="student-1")
+        self.client.check_compliance_alerts()
+
+        scan_timeout = mock_request.call_args_list[0][1]["timeout"]
+        self.assertLessEqual(scan_timeout, 0.5)
+        self.assertGreater(scan_timeout, 0.4)
+        self.assertEqual(mock_request.call_args_list[1][1]["timeout"], 30)
+
+    @patch("requests.Session.request")
+    def test_call_deadline_overrides_endpoint_deadline(self, mock_request):
+        """Test a per-call deadline replaces the endpoint's"""
+        mock_request.return_value = _response({"success": True})
+
+        self.client.request("POST", "/qr-attendance/scan", data={}, deadline=5.0)
+
+        self.assertGreater(mock_request.call_args[1]["timeout"], 4.5)
+
+    @patch("requests.Session.request")
+    def test_spent_deadline_raises_without_sending(self, mock_request):
+        """Test a call is not sent once the deadline() block has no budget left"""
+        with deadline(0.05):
+            time.sleep(0.06)
+            with self.assertRaises(EDUZENTimeoutError) as context:
+                self.client.get_active_sessions()
+
+        mock_request.assert_not_called()
+        self.assertIsInstance(context.exception, EDUZENNetworkError)
+        self.assertIsNotNone(context.exception.elapsed)
+
+    @patch("requests.Session.request")
+    def test_nested_deadline_only_shortens(self, mock_request):
+        """Test an inner deadline() block cannot extend the outer one"""
+        mock_request.return_value = _response({"sessions": []})
+
+        with self.client.deadline(0.2), self.client.deadline(10):
+            self.client.get_active_sessions()
+
+        self.assertLessEqual(mock_request.call_args[1]["timeout"], 0.2)
+
+    @patch("requests.Session.request")
+    def test_deadline_block_applies_to_bulk_workers(self, mock_request):
+        """Test calls made by bulk worker threads inherit the deadline() block"""
+        with deadline(0.05):
+            time.sleep(0.06)
+            results = list(self.client.scan_qr_codes_bulk([{"qr_code": "QR-1", "student_id": "student-1"}] * 3))
+
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(isinstance(r.error, EDUZENTimeoutError) for r in results))
+        mock_request.assert_not_called()
+
+    @patch("requests.Session.request")
+    def test_rate_limit_wait_beyond_deadline_fails_fast(self, mock_request):
+        """Test a rate-limit pause longer than the budget fails at once instead of sleeping"""
+        self.client.rate_limiter = Mock()
+        self.client.rate_limiter.acquire.return_value = 10.0
+
+        started = time.monotonic()
+        with self.assertRaises(EDUZENTimeoutError):
+            self.client.scan_qr_code(qr_code="QR-1", student_id="student-1")
+
+        self.assertLess(time.monotonic() - started, 0.5)
+        mock_request.assert_not_called()
+
+    @patch("requests.Session.request")
+    def test_retries_stop_at_deadline(self, mock_request):
+        """Test retries are not attempted past the call deadline"""
+        mock_request.return_value = _response({"message": "unavailable"}, status_code=503)
+        mock_request.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=mock_request.return_value
+        )
+        self.client.retry_policy = RetryPolicy(max_attempts=10, backoff_factor=0.2, jitter=False)
+
+        with self.assertRaises(EDUZENAPIError):
+            self.client.request("GET", "/sessions/active", deadline=0.5)
+
+        # Backoffs of 0.2 s then 0.4 s: the third attempt would end past the deadline
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch("requests.Session.request")
+    def test_timeout_after_deadline_is_a_timeout_error(self, mock_request):
+        """Test a read timeout that exhausts the budget raises EDUZENTimeoutError"""
+
+        def slow(*args, **kwargs):
+            time.sleep(kwargs["timeout"])
+            raise requests.exceptions.ReadTimeout("read timed out")
+
+        mock_request.side_effect = slow
+
+        with self.assertRaises(EDUZENTimeoutError):
+            self.client.scan_qr_code(qr_code="QR-1", student_id="student-1")
+
+
+class TestHedging(unittest.TestCase):
+    def setUp(self):
+        self.policy = HedgePolicy(endpoints=[QR_ENDPOINT], min_samples=20)
+        self.client = EDUZENClient(api_key="test-api-key", hedge_policy=self.policy)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+        self.client.close()
+
+    def slow_first(self, *args, **kwargs):
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+        if call == 1:
+            time.sleep(0.5)
+        return _response({"qr_code": {"id": f"qr-{call}"}})
+
+    @patch("requests.Session.request")
+    def test_no_hedge_before_latencies_are_known(self, mock_request):
+        """Test an endpoint is not hedged until min_samples latencies were observed"""
+        mock_request.side_effect = self.slow_first
+
+        self.client.get_active_qr_code("session-1")
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.policy.hedged, 0)
+
+    @patch("requests.Session.request")
+    def test_slow_get_is_hedged(self, mock_request):
+        """Test a GET slower than the observed p95 is answered by its hedge"""
+        mock_request.side_effect = self.slow_first
+        _warm(self.policy)
+        events = []
+        self.client.add_hook("after_response", events.append)
+
+        started = time.monotonic()
+        result = self.client.get_active_qr_code("session-1")
+
+        self.assertLess(time.monotonic() - started, 0.3)
+        self.assertEqual(result["qr_code"]["id"], "qr-2")
+        self.assertEqual((self.policy.hedged, self.policy.won), (1, 1))
+        self.assertTrue(events[0].hedged)
+        self.assertEqual(events[0].attempts, 2)
+
+    @patch("requests.Session.request")
+    def test_only_listed_endpoints_are_hedged(self, mock_request):
+        """Test GETs outside HedgePolicy.endpoints are never hedged"""
+        mock_request.side_effect = self.slow_first
+        _warm(self.policy, endpoint="/sessions/active")
+
+        self.client.get_active_sessions()
+
+        self.assertEqual(self.calls, 1)
+
+    @patch("requests.Session.request")
+    def test_hedge_budget_caps_extra_load(self, mock_request):
+        """Test hedges stop once the budget is spent"""
+        mock_request.side_effect = lambda *args, **kwargs: time.sleep(0.05) or _response({"qr_code": {}})
+        policy = HedgePolicy(min_samples=20, budget_ratio=0.0, budget_min=2)
+        client = EDUZENClient(api_key="test-api-key", hedge_policy=policy, coalesce_requests=False)
+        _warm(policy, seconds=0.01)
+
+        for i in range(5):
+            client.get_active_qr_code(f"session-{i}")
+        client.close()
+
+        self.assertEqual(policy.hedged, 2)
+        self.assertEqual(mock_request.call_count, 7)
+
+    @patch("requests.Session.request")
+    def test_post_is_never_hedged(self, mock_request):
+        """Test non-idempotent calls are sent once whatever the policy"""
+        mock_request.side_effect = self.slow_first
+        policy = HedgePolicy(min_samples=0)
+        client = EDUZENClient(api_key="test-api-key", hedge_policy=policy)
+
+        client.scan_qr_code(qr_code="QR-1", student_id="student-1")
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(policy.hedged, 0)
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncDeadlinesAndHedging(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.qr_requests = 0
+        self.cancelled = 0
+
+        async def active_qr_code(request):
+            self.qr_requests += 1
+            delay = 1.0 if self.qr_requests == 1 else 0.01
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+            return web.json_response({"qr_code": {"id": f"qr-{self.qr_requests}"}})
+
+        app = web.Application()
+        app.router.add_get("/api/qr-attendance/active/{session_id}", active_qr_code)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.policy = HedgePolicy(min_samples=20)
+        self.client = AsyncEDUZENClient(
+            base_url=str(self.server.make_url("/api")),
+            api_key="test-api-key",
+            hedge_policy=self.policy,
+            deadlines={QR_ENDPOINT: 0.3},
+        )
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.server.close()
+
+    async def test_endpoint_deadline(self):
+        """Test a slow response fails with EDUZENTimeoutError at the endpoint deadline"""
+        started = time.monotonic()
+        with self.assertRaises(EDUZENTimeoutError):
+            await self.client.get_active_qr_code("session-1")
+
+        self.assertLess(time.monotonic() - started, 0.6)
+
+    async def test_slow_get_is_hedged(self):
+        """Test the hedge answers a slow GET and the slow attempt is cancelled"""
+        _warm(self.policy)
+
+        started = time.monotonic()
+        result = await self.client.get_active_qr_code("session-1")
+
+        self.assertLess(time.monotonic() - started, 0.3)
+        self.assertEqual(result["qr_code"]["id"], "qr-2")
+        self.assertEqual(self.policy.won, 1)
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.cancelled, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
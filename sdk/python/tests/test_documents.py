@@ -0,0 +1,74 @@
+"""
+Tests unitaires pour la génération de documents en masse
+"""
+
+import io
+import json
+import unittest
+import zipfile
+from unittest.mock import Mock, patch
+
+from eduzen import EDUZENClient
+
+
+def make_zip(documents):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in documents.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+def make_stream_response(body):
+    response = Mock()
+    response.status_code = 200
+    response.headers = {"Content-Type": "application/zip"}
+    response.raise_for_status = Mock()
+    response.iter_content = lambda chunk_size: (body[i:i + chunk_size] for i in range(0, len(body), chunk_size))
+    return response
+
+
+class TestDocumentsBatch(unittest.TestCase):
+    def setUp(self):
+        self.client = EDUZENClient(api_key="test-api-key")
+        self.archive = make_zip({
+            "attestation_1.pdf": b"%PDF-1 one",
+            "attestation_2.pdf": b"%PDF-1 two",
+        })
+
+    @patch("requests.Session.request")
+    def test_streams_zip_to_file_object(self, mock_request):
+        """Test the ZIP body is streamed in chunks to the destination"""
+        response = make_stream_response(self.archive)
+        mock_request.return_value = response
+        destination = io.BytesIO()
+
+        written = self.client.generate_documents_batch(
+            "template-123",
+            [{"variables": {"student_name": "Jane Doe"}}],
+            destination,
+            format="pdf",
+            chunk_size=16,
+        )
+
+        self.assertEqual(written, len(self.archive))
+        self.assertEqual(destination.getvalue(), self.archive)
+        self.assertTrue(mock_request.call_args.kwargs["stream"])
+        self.assertEqual(json.loads(mock_request.call_args.kwargs["data"])["format"], "PDF")
+        response.close.assert_called_once()
+
+    @patch("requests.Session.request")
+    def test_iterates_archive_members(self, mock_request):
+        """Test archive members are yielded one by one"""
+        mock_request.return_value = make_stream_response(self.archive)
+
+        documents = list(self.client.iter_documents_batch("template-123", [{"variables": {}}] * 2))
+
+        self.assertEqual(
+            [(d.filename, d.content) for d in documents],
+            [("attestation_1.pdf", b"%PDF-1 one"), ("attestation_2.pdf", b"%PDF-1 two")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+Tests unitaires pour l'export des étudiants
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from eduzen import EDUZENClient
+from eduzen.__main__ import main
+from eduzen.export import export_students, infer_format
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    pyarrow = None
+
+
+def make_student(index):
+    return {
+        "id": f"student-{index}",
+        "first_name": f"Prénom{index}",
+        "last_name": f"Nom, {index}",
+        "email": f"student{index}@example.com",
+        "classes": {"id": "class-1", "name": "Terminale"},
+    }
+
+
+class FakeStudentsAPI:
+    """Serves self.students through get_students pagination, failing on fail_on_page"""
+
+    def __init__(self, count):
+        self.students = [make_student(i) for i in range(count)]
+        self.fail_on_page = None
+        self.pages = []
+
+    def __call__(self, organization_id, page=1, limit=50, search=None):
+        if page == self.fail_on_page:
+            raise RuntimeError("connection lost")
+        self.pages.append(page)
+        start = (page - 1) * limit
+        return {"data": self.students[start : start + limit], "meta": {}}
+
+
+class TestExportStudents(unittest.TestCase):
+    def setUp(self):
+        self.client = EDUZENClient(api_key="test-api-key")
+        self.api = FakeStudentsAPI(95)
+        patcher = patch.object(self.client, "get_students", side_effect=self.api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def test_csv(self):
+        """Test CSV export writes a header, quotes values and flattens nested fields"""
+        result = export_students(self.client, "org-123", self.path("students.csv"), page_size=10)
+
+        with open(self.path("students.csv"), newline="", encoding="utf-8") as fh:
+            rows = list(csv.DictReader(fh))
+        self.assertEqual(result.rows, 95)
+        self.assertEqual(len(rows), 95)
+        self.assertEqual(rows[3]["last_name"], "Nom, 3")
+        self.assertEqual(json.loads(rows[3]["classes"])["name"], "Terminale")
+        self.assertFalse(os.path.exists(self.path("students.csv.checkpoint")))
+
+    def test_jsonl_gzip(self):
+        """Test gzipped JSON Lines export holds complete records"""
+        export_students(self.client, "org-123", self.path("students.jsonl.gz"), compress=True, page_size=10)
+
+        with gzip.open(self.path("students.jsonl.gz"), "rt", encoding="utf-8") as fh:
+            records = [json.loads(line) for line in fh]
+        self.assertEqual(records, self.api.students)
+
+    def test_resume_after_interruption(self):
+        """Test an interrupted export resumes after the last checkpoint and matches a full run"""
+        path = self.path("students.csv.gz")
+        self.api.fail_on_page = 7
+
+        with self.assertRaises(RuntimeError):
+            export_students(self.client, "org-123", path, compress=True, page_size=10, checkpoint_every=3)
+        with open(f"{path}.checkpoint", encoding="utf-8") as fh:
+            self.assertEqual(json.load(fh)["page"], 6)
+
+        self.api.fail_on_page = None
+        self.api.pages = []
+        result = export_students(self.client, "org-123", path, compress=True, page_size=10, checkpoint_every=3)
+
+        self.assertEqual(self.api.pages, [7, 8, 9, 10])
+        self.assertEqual(result.resumed_from_page, 6)
+        self.assertEqual(result.rows, 95)
+        with gzip.open(path, "rt", encoding="utf-8", newline="") as fh:
+            rows = list(csv.DictReader(fh))
+        self.assertEqual([r["id"] for r in rows], [s["id"] for s in self.api.students])
+
+    def test_checkpoint_from_other_export_rejected(self):
+        """Test a checkpoint is not reused with different export settings"""
+        path = self.path("students.csv")
+        self.api.fail_on_page = 2
+        with self.assertRaises(RuntimeError):
+            export_students(self.client, "org-123", path, page_size=10, checkpoint_every=1)
+
+        with self.assertRaises(ValueError):
+            export_students(self.client, "org-123", path, page_size=20)
+
+        self.api.fail_on_page = None
+        self.assertEqual(export_students(self.client, "org-123", path, page_size=20, resume=False).rows, 95)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_parquet(self):
+        """Test Parquet export writes a dataset readable as one table"""
+        import pyarrow.parquet as pq
+
+        export_students(self.client, "org-123", self.path("students.parquet"), page_size=10, checkpoint_every=3)
+
+        table = pq.read_table(self.path("students.parquet"))
+        self.assertEqual(table.num_rows, 95)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_parquet_keeps_unrelated_files(self):
+        """Test Parquet export refuses a directory it did not create and rewrites only its own parts"""
+        path = self.path("students.parquet")
+        os.makedirs(path)
+        notes = os.path.join(path, "notes.txt")
+        with open(notes, "w") as fh:
+            fh.write("keep me")
+
+        with self.assertRaises(ValueError):
+            export_students(self.client, "org-123", path, page_size=10)
+        self.assertTrue(os.path.exists(notes))
+
+        os.remove(notes)
+        export_students(self.client, "org-123", path, page_size=10, checkpoint_every=3)
+        result = export_students(self.client, "org-123", path, page_size=10, checkpoint_every=5, resume=False)
+        self.assertEqual(result.rows, 95)
+        self.assertEqual(sorted(os.listdir(path)), ["part-00000.parquet", "part-00001.parquet"])
+
+    def test_infer_format(self):
+        """Test the format is inferred from the output name"""
+        self.assertEqual(infer_format("a.csv.gz"), "csv")
+        self.assertEqual(infer_format("a.ndjson"), "jsonl")
+        self.assertEqual(infer_format("a.parquet"), "parquet")
+
+    def test_cli(self):
+        """Test python -m eduzen export students"""
+        path = self.path("students.jsonl")
+        with patch("eduzen.client.EDUZENClient.get_students", side_effect=self.api), patch(
+            "sys.stderr", new_callable=io.StringIO
+        ) as stderr:
+            code = main(["export", "students", "--organization-id", "org-123", "-o", path, "--api-key", "key"])
+
+        self.assertEqual(code, 0)
+        self.assertIn("Exported 95 students", stderr.getvalue())
+        with open(path, encoding="utf-8") as fh:
+            self.assertEqual(sum(1 for _ in fh), 95)
+
+
+if __name__ == "__main__":
+    unittest.main()
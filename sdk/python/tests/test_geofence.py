@@ -0,0 +1,126 @@
+"""
+Tests unitaires pour la pré-validation des scans QR (géorepérage)
+"""
+
+import sys
+import unittest
+from unittest.mock import patch
+
+from eduzen.geofence import (
+    DUPLICATE,
+    INVALID_COORDINATES,
+    LOCATION_REQUIRED,
+    MISSING_FIELD,
+    OUT_OF_RANGE,
+    Geofence,
+    haversine,
+    validate_scans,
+)
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+PARIS = (48.8566, 2.3522)
+LONDON = (51.5074, -0.1278)
+
+GEOFENCES = {
+    "QR-PARIS": Geofence(*PARIS, radius_meters=150),
+    "QR-OPTIONAL": Geofence(*PARIS, radius_meters=150, require_location=False),
+}
+
+SCANS = [
+    {"qr_code": "QR-PARIS", "student_id": "s1", "latitude": 48.8570, "longitude": 2.3525},
+    {"qr_code": "QR-PARIS", "student_id": "s2", "latitude": LONDON[0], "longitude": LONDON[1]},
+    {"qr_code": "QR-PARIS", "student_id": "s3"},
+    {"qr_code": "QR-OPTIONAL", "student_id": "s3"},
+    {"qr_code": "QR-PARIS", "student_id": "s4", "latitude": 48.8566},
+    {"qr_code": "QR-PARIS", "student_id": "s5", "latitude": 95.0, "longitude": 2.35},
+    {"qr_code": "QR-PARIS", "student_id": "s6", "latitude": "48.85", "longitude": 2.35},
+    {"qr_code": "QR-PARIS", "latitude": 48.8566, "longitude": 2.3522},
+    {"qr_code": "QR-PARIS", "student_id": "s1", "latitude": 48.8566, "longitude": 2.3522},
+    {"qr_code": "QR-UNKNOWN", "student_id": "s7", "latitude": LONDON[0], "longitude": LONDON[1]},
+]
+
+EXPECTED = {
+    1: OUT_OF_RANGE,
+    2: LOCATION_REQUIRED,
+    4: INVALID_COORDINATES,
+    5: INVALID_COORDINATES,
+    6: INVALID_COORDINATES,
+    7: MISSING_FIELD,
+    8: DUPLICATE,
+}
+
+
+class TestGeofence(unittest.TestCase):
+    def test_haversine(self):
+        """Test the distance matches the great-circle distance Paris-London"""
+        self.assertAlmostEqual(haversine(*PARIS, *LONDON), 343_500, delta=1000)
+        self.assertEqual(haversine(*PARIS, *PARIS), 0)
+
+    def test_rejections(self):
+        """Test every scan the API would refuse is reported with its reason"""
+        precheck = validate_scans(SCANS, GEOFENCES)
+
+        self.assertEqual({r.index: r.reason for r in precheck.rejections}, EXPECTED)
+        self.assertEqual(precheck.indices, [0, 3, 9])
+        self.assertEqual(precheck.scans, [SCANS[0], SCANS[3], SCANS[9]])
+        self.assertFalse(precheck.ok)
+
+    def test_out_of_range_reports_distance(self):
+        """Test an out-of-range rejection carries the distance to the geofence"""
+        rejection = validate_scans(SCANS, GEOFENCES).rejections[0]
+
+        self.assertAlmostEqual(rejection.distance, 343_500, delta=1000)
+        self.assertIn("343", rejection.message)
+
+    def test_rejected_scan_does_not_shadow_later_duplicate(self):
+        """Test a pair is kept at its first valid scan, not its first scan"""
+        scans = [
+            {"qr_code": "QR-PARIS", "student_id": "s1"},
+            {"qr_code": "QR-PARIS", "student_id": "s1", "latitude": PARIS[0], "longitude": PARIS[1]},
+        ]
+
+        precheck = validate_scans(scans, GEOFENCES)
+
+        self.assertEqual(precheck.indices, [1])
+        self.assertEqual([r.reason for r in precheck.rejections], [LOCATION_REQUIRED])
+
+    def test_without_numpy(self):
+        """Test the row-by-row fallback gives the same report"""
+        with patch.dict(sys.modules, {"numpy": None}):
+            precheck = validate_scans(SCANS, GEOFENCES)
+
+        self.assertEqual({r.index: r.reason for r in precheck.rejections}, EXPECTED)
+        self.assertEqual(precheck.indices, [0, 3, 9])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_vectorised_matches_fallback(self):
+        """Test both implementations agree on a large random batch"""
+        rng = numpy.random.default_rng(7)
+        geofences = {f"QR-{i}": Geofence(45 + i * 0.01, 2.0, radius_meters=200) for i in range(20)}
+        scans = [
+            {
+                "qr_code": f"QR-{rng.integers(22)}",
+                "student_id": f"s{rng.integers(500)}",
+                "latitude": 45 + float(rng.uniform(0, 0.2)),
+                "longitude": 2.0 + float(rng.uniform(-0.003, 0.003)),
+            }
+            for _ in range(2000)
+        ]
+
+        vectorised = validate_scans(scans, geofences)
+        with patch.dict(sys.modules, {"numpy": None}):
+            fallback = validate_scans(scans, geofences)
+
+        self.assertEqual(vectorised.indices, fallback.indices)
+        self.assertEqual(
+            [(r.index, r.reason) for r in vectorised.rejections], [(r.index, r.reason) for r in fallback.rejections]
+        )
+        self.assertTrue(vectorised.indices)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Tests unitaires pour le temps d'import du paquet
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+
+import eduzen
+
+# Cumulative import time allowed for ``import eduzen``, in milliseconds. The
+# lazy package imports in about 2 ms; loading requests and aiohttp eagerly
+# takes hundreds.
+IMPORT_BUDGET_MS = float(os.environ.get("EDUZEN_IMPORT_BUDGET_MS", "50"))
+
+HEAVY_MODULES = ("requests", "aiohttp", "asyncio", "orjson", "ujson", "eduzen.client", "eduzen.async_client")
+
+SDK_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code, *options):
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        cwd=SDK_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+class TestImportTime(unittest.TestCase):
+    def test_import_within_budget(self):
+        """Test import eduzen stays within the -X importtime budget"""
+        # Best of three runs, so a busy machine does not fail the test
+        timings = []
+        for _ in range(3):
+            stderr = _run("import eduzen", "-X", "importtime").stderr
+            for line in stderr.splitlines():
+                fields = line.split("|")
+                if len(fields) == 3 and fields[2].strip() == "eduzen":
+                    timings.append(int(fields[1]) / 1000)
+        self.assertEqual(len(timings), 3)
+        self.assertLess(min(timings), IMPORT_BUDGET_MS)
+
+    def test_import_does_not_load_http_stack(self):
+        """Test import eduzen loads neither the HTTP libraries nor the clients"""
+        code = f"import eduzen, sys; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        self.assertEqual(_run(code).stdout.strip(), "")
+
+    def test_sync_client_does_not_load_optional_subsystems(self):
+        """Test a constructed EDUZENClient has loaded neither asyncio nor the cache and document stores"""
+        modules = ("asyncio", "sqlite3", "mmap", "eduzen.cache", "eduzen.artifacts", "eduzen.models")
+        code = textwrap.dedent(
+            f"""
+            import sys
+            from eduzen import EDUZENClient
+            EDUZENClient(api_key="key")
+            print(",".join(m for m in {modules!r} if m in sys.modules))
+            """
+        )
+        self.assertEqual(_run(code).stdout.strip(), "")
+
+    def test_cli_help_does_not_load_http_stack(self):
+        """Test python -m eduzen --help does not import the client"""
+        code = textwrap.dedent(
+            """
+            import runpy, sys
+            sys.argv = ["eduzen", "--help"]
+            try:
+                runpy.run_module("eduzen", run_name="__main__")
+            except SystemExit:
+                pass
+            print("requests" in sys.modules)
+            """
+        )
+        self.assertEqual(_run(code).stdout.strip().splitlines()[-1], "False")
+
+
+class TestLazyExports(unittest.TestCase):
+    def test_public_names_resolve(self):
+        """Test every name in __all__ resolves to the object of its submodule"""
+        from eduzen.async_client import AsyncEDUZENClient
+        from eduzen.bulk import BulkResult
+        from eduzen.client import EDUZENClient
+        from eduzen.exceptions import EDUZENAPIError, EDUZENError, EDUZENNetworkError, EDUZENTimeoutError
+
+        expected = {
+            "EDUZENClient": EDUZENClient,
+            "AsyncEDUZENClient": AsyncEDUZENClient,
+            "BulkResult": BulkResult,
+            "EDUZENError": EDUZENError,
+            "EDUZENAPIError": EDUZENAPIError,
+            "EDUZENNetworkError": EDUZENNetworkError,
+            "EDUZENTimeoutError": EDUZENTimeoutError,
+        }
+        self.assertEqual(sorted(eduzen.__all__), sorted(expected))
+        for name, value in expected.items():
+            self.assertIs(getattr(eduzen, name), value)
+
+    def test_star_import_and_dir(self):
+        """Test from eduzen import * and dir() list the public names"""
+        namespace = {}
+        exec("from eduzen import *", namespace)
+
+        for name in eduzen.__all__:
+            self.assertIn(name, namespace)
+            self.assertIn(name, dir(eduzen))
+
+    def test_unknown_attribute(self):
+        """Test an unknown attribute still raises AttributeError"""
+        with self.assertRaises(AttributeError):
+            eduzen.NotAClient
+
+
+if __name__ == "__main__":
+    unittest.main()
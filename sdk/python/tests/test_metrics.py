@@ -0,0 +1,152 @@
+"""
+Tests unitaires pour l'instrumentation des requêtes
+"""
+
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from eduzen import EDUZENClient, EDUZENAPIError
+from eduzen.exceptions import EDUZENTimeoutError
+from eduzen.metrics import LatencyHistogram, MetricsCollector, RequestEvent
+from eduzen.retry import RetryPolicy
+
+
+def make_response(status_code, payload, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = json.dumps(payload).encode()
+    response.json.return_value = payload
+    response.raise_for_status = Mock()
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+    return response
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_percentiles_within_precision(self):
+        """Test percentiles stay within the bucket precision"""
+        histogram = LatencyHistogram(precision=0.05)
+        for millis in range(1, 1001):
+            histogram.record(millis / 1000.0)
+
+        self.assertAlmostEqual(histogram.percentile(0.50), 0.500, delta=0.500 * 0.05)
+        self.assertAlmostEqual(histogram.percentile(0.99), 0.990, delta=0.990 * 0.05)
+        self.assertEqual(histogram.percentile(1.0), 1.0)
+
+    def test_empty_histogram(self):
+        """Test an empty histogram has no percentile"""
+        self.assertIsNone(LatencyHistogram().percentile(0.5))
+
+
+class TestRequestHooks(unittest.TestCase):
+    def setUp(self):
+        self.client = EDUZENClient(
+            api_key="test-api-key",
+            retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0),
+        )
+        self.events = []
+
+    @patch("requests.Session.request")
+    def test_hooks_receive_event(self, mock_request):
+        """Test before_request and after_response see the same completed event"""
+        mock_request.return_value = make_response(
+            200, {"qrCode": "abc"}, {"X-Request-Id": "req-1", "X-RateLimit-Remaining": "99"}
+        )
+        self.client.add_hook("before_request", lambda e: self.events.append(("before", e.status_code)))
+        self.client.add_hook("after_response", lambda e: self.events.append(("after", e)))
+
+        self.client.get_active_qr_code("session-1")
+
+        self.assertEqual(self.events[0], ("before", None))
+        event = self.events[1][1]
+        self.assertEqual(event.method, "GET")
+        self.assertEqual(event.endpoint, "/qr-attendance/active/{session_id}")
+        self.assertEqual(event.path, "/qr-attendance/active/session-1")
+        self.assertEqual(event.status_code, 200)
+        self.assertEqual(event.request_id, "req-1")
+        self.assertEqual(event.rate_limit_remaining, "99")
+        self.assertEqual(event.response_bytes, len(b'{"qrCode": "abc"}'))
+        self.assertGreaterEqual(event.timings["total"], event.timings["decode"])
+
+    @patch("requests.Session.request")
+    def test_retries_counted(self, mock_request):
+        """Test the event counts retries of the call"""
+        mock_request.side_effect = [
+            make_response(503, {"message": "Unavailable"}),
+            make_response(200, {"sessions": []}),
+        ]
+        self.client.add_hook("after_response", self.events.append)
+
+        self.client.get_active_sessions()
+
+        self.assertEqual(self.events[0].retries, 1)
+        self.assertEqual(self.events[0].attempts, 2)
+
+    @patch("requests.Session.request")
+    def test_on_error_and_exception_context(self, mock_request):
+        """Test errors reach on_error and carry the request id and elapsed time"""
+        mock_request.return_value = make_response(
+            400, {"message": "Invalid", "code": "INVALID"}, {"X-Request-Id": "req-2"}
+        )
+        self.client.add_hook("on_error", self.events.append)
+
+        with self.assertRaises(EDUZENAPIError) as ctx:
+            self.client.revoke_session("session-1")
+
+        self.assertIs(self.events[0].error, ctx.exception)
+        self.assertEqual(ctx.exception.request_id, "req-2")
+        self.assertIsNotNone(ctx.exception.elapsed)
+        self.assertGreater(self.events[0].request_bytes, 0)
+
+    @patch("requests.Session.request")
+    def test_deadline_before_first_attempt_is_not_coalesced(self, mock_request):
+        """Test a call that fails on its deadline without sending is not reported as coalesced"""
+        self.client.add_hook("on_error", self.events.append)
+
+        with self.assertRaises(EDUZENTimeoutError):
+            self.client.request("GET", "/sessions/active", deadline=0)
+
+        mock_request.assert_not_called()
+        self.assertEqual(self.events[0].attempts, 0)
+        self.assertFalse(self.events[0].coalesced)
+
+    def test_unknown_hook_rejected(self):
+        """Test registering an unknown hook type fails"""
+        with self.assertRaises(ValueError):
+            self.client.add_hook("on_success", print)
+
+
+class TestMetricsCollector(unittest.TestCase):
+    @patch("requests.Session.request")
+    def test_dump_per_endpoint(self, mock_request):
+        """Test the collector aggregates calls per method and endpoint template"""
+        mock_request.return_value = make_response(200, {"ok": True})
+        client = EDUZENClient(api_key="test-api-key", coalesce_requests=False)
+        metrics = MetricsCollector().attach(client)
+
+        client.get_active_qr_code("s1")
+        client.get_active_qr_code("s2")
+        client.get_active_sessions()
+
+        report = metrics.dump()
+        self.assertEqual(report["GET /qr-attendance/active/{session_id}"]["count"], 2)
+        self.assertEqual(report["GET /sessions/active"]["count"], 1)
+        self.assertIsNotNone(metrics.percentile("GET", "/sessions/active", 0.95))
+
+    def test_event_as_dict(self):
+        """Test events serialise to plain dicts"""
+        event = RequestEvent("GET", "/sessions/active", "/sessions/active")
+        event.finish()
+
+        data = event.as_dict()
+        self.assertEqual(data["endpoint"], "/sessions/active")
+        self.assertIsNone(data["error"])
+        json.dumps(data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+"""
+Tests unitaires pour le miroir local des étudiants
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from eduzen import EDUZENClient
+from eduzen.mirror import StudentMirror
+from eduzen.models import Student
+
+
+def make_student(index, **overrides):
+    student = {
+        "id": f"student-{index}",
+        "first_name": f"Prénom{index}",
+        "last_name": f"Dupont{index}" if index % 2 else f"Martin{index}",
+        "email": f"student{index}@example.com",
+        "student_number": f"STU-{index:05d}",
+        "updated_at": "2026-01-01T00:00:00Z",
+    }
+    student.update(overrides)
+    return student
+
+
+class FakeStudentsAPI:
+    """Serves self.students through get_students pagination, calling after_call once served"""
+
+    def __init__(self, students):
+        self.students = students
+        self.calls = 0
+        self.after_call = None
+
+    def __call__(self, organization_id, page=1, limit=50, search=None):
+        self.calls += 1
+        start = (page - 1) * limit
+        response = {
+            "data": self.students[start : start + limit],
+            "meta": {"page": page, "limit": limit, "total": len(self.students)},
+        }
+        if self.after_call is not None:
+            self.after_call, after_call = None, self.after_call
+            after_call()
+        return response
+
+
+class TestStudentMirror(unittest.TestCase):
+    def setUp(self):
+        self.client = EDUZENClient(api_key="test-api-key")
+        self.api = FakeStudentsAPI([make_student(i) for i in range(25)])
+        patcher = patch.object(self.client, "get_students", side_effect=self.api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mirror = StudentMirror(self.client, "org-123", page_size=10)
+        self.addCleanup(self.mirror.close)
+
+    def test_initial_sync(self):
+        """Test the first sync copies every page"""
+        stats = self.mirror.sync()
+
+        self.assertEqual((stats.pages, stats.inserted, stats.unchanged_pages), (3, 25, 0))
+        self.assertEqual(len(self.mirror), 25)
+        self.assertIsNotNone(self.mirror.synced_at)
+
+    def test_unchanged_pages_skipped(self):
+        """Test a second sync only rewrites the pages that changed"""
+        self.mirror.sync()
+        self.api.students[12] = make_student(12, email="new@example.com", updated_at="2026-02-01T00:00:00Z")
+
+        stats = self.mirror.sync()
+
+        self.assertEqual((stats.unchanged_pages, stats.updated, stats.inserted), (2, 1, 0))
+        self.assertEqual(self.mirror.get_by_email("NEW@example.com")["id"], "student-12")
+
+    def test_same_timestamp_not_rewritten(self):
+        """Test records whose updated_at did not move are not rewritten"""
+        self.mirror.sync()
+        self.api.students[3] = make_student(3, first_name="Ignored")
+        self.api.students[4] = make_student(4, first_name="Renamed", updated_at="2026-03-01T00:00:00Z")
+
+        stats = self.mirror.sync()
+
+        self.assertEqual(stats.updated, 1)
+        self.assertEqual(self.mirror.get("student-4")["first_name"], "Renamed")
+
+    def test_removed_students_deleted(self):
+        """Test students no longer listed are removed from the mirror"""
+        self.mirror.sync()
+        del self.api.students[0]
+
+        stats = self.mirror.sync()
+
+        self.assertEqual(stats.deleted, 1)
+        self.assertIsNone(self.mirror.get("student-0"))
+        self.assertEqual(len(self.mirror), 24)
+
+    def test_student_moved_between_pages_not_deleted(self):
+        """Test a student skipped by reordering during a pass is kept and a confirming pass runs"""
+        self.mirror.sync()
+        calls = self.api.calls
+        students = self.api.students
+
+        def reorder():
+            # Rows tied on last_name swap places: student-12 moves onto the page already read
+            students[5], students[12] = students[12], students[5]
+
+        self.api.after_call = reorder
+        stats = self.mirror.sync()
+
+        self.assertEqual(stats.deleted, 0)
+        self.assertEqual(self.api.calls - calls, 6)
+        self.assertEqual(len(self.mirror), 25)
+
+    def test_failed_sync_keeps_data(self):
+        """Test an interrupted sync deletes nothing"""
+        self.mirror.sync()
+        self.client.get_students.side_effect = [self.api(None, page=1, limit=10), RuntimeError("boom")]
+
+        with self.assertRaises(RuntimeError):
+            self.mirror.sync()
+
+        self.assertEqual(len(self.mirror), 25)
+
+    def test_search(self):
+        """Test substring and short prefix searches across name, email and number"""
+        self.mirror.sync()
+
+        self.assertEqual({s["id"] for s in self.mirror.search("dupont1", limit=50)}, {
+            "student-1", "student-11", "student-13", "student-15", "student-17", "student-19",
+        })
+        self.assertEqual([s["id"] for s in self.mirror.search("00007")], ["student-7"])
+        self.assertEqual([s["id"] for s in self.mirror.search("student21@")], ["student-21"])
+        self.assertEqual(len(self.mirror.search("ma", limit=50)), 13)
+        self.assertEqual(self.mirror.search("  "), [])
+
+    def test_lookups_are_local(self):
+        """Test lookups never reach the API and are sub-millisecond"""
+        self.mirror.sync()
+        calls = self.api.calls
+
+        started = time.perf_counter()
+        for _ in range(1000):
+            self.mirror.get("student-7")
+        elapsed = (time.perf_counter() - started) / 1000
+
+        self.assertEqual(self.api.calls, calls)
+        self.assertLess(elapsed, 0.001)
+
+    def test_models(self):
+        """Test lookups return Student models when the client uses models"""
+        self.client.models = True
+        self.mirror.sync()
+
+        self.assertIsInstance(self.mirror.get("student-1"), Student)
+
+    def test_file_bound_to_organization(self):
+        """Test a mirror file cannot be reused for another organization"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "students.sqlite")
+            StudentMirror(self.client, "org-123", path).close()
+
+            with self.assertRaises(ValueError):
+                StudentMirror(self.client, "org-456", path)
+
+            with StudentMirror(self.client, "org-123", path, page_size=10) as mirror:
+                mirror.sync()
+            with StudentMirror(self.client, "org-123", path, page_size=10) as mirror:
+                self.assertEqual(len(mirror), 25)
+                self.assertEqual(mirror.sync().unchanged_pages, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Tests unitaires pour les modèles de réponse
+"""
+
+import json
+import sys
+import unittest
+from unittest.mock import Mock, patch
+
+from eduzen import EDUZENClient
+from eduzen.models import PaymentIntent, Student, StudentClass, wrap
+
+
+def make_student(index):
+    return {
+        "id": f"student-{index}",
+        "organization_id": "org-123",
+        "first_name": f"Prénom{index}",
+        "last_name": f"Nom{index}",
+        "email": None,
+        "status": "active",
+        "classes": {"id": "class-1", "name": "Terminale", "level": "12"},
+        "custom_field": {"nested": True},
+    }
+
+
+def make_response(payload):
+    response = Mock()
+    response.status_code = 200
+    response.headers = {}
+    response.content = json.dumps(payload).encode()
+    response.raise_for_status = Mock()
+    return response
+
+
+class TestModels(unittest.TestCase):
+    def test_attribute_and_mapping_access(self):
+        """Test fields are readable as attributes and as dict keys"""
+        student = Student.from_dict(make_student(1))
+
+        self.assertEqual(student.first_name, "Prénom1")
+        self.assertEqual(student["first_name"], "Prénom1")
+        self.assertIsNone(student.email)
+        self.assertIn("email", student)
+        self.assertEqual(student.get("missing", "default"), "default")
+
+    def test_absent_fields(self):
+        """Test fields missing from the payload read as None but are not keys"""
+        student = Student.from_dict(make_student(1))
+
+        self.assertIsNone(student.phone)
+        self.assertNotIn("phone", student)
+        with self.assertRaises(KeyError):
+            student["phone"]
+        with self.assertRaises(AttributeError):
+            student.not_a_field
+
+    def test_unknown_fields_preserved(self):
+        """Test fields the model does not declare survive round trips"""
+        data = make_student(1)
+        student = Student.from_dict(data)
+
+        self.assertEqual(student.custom_field, {"nested": True})
+        self.assertEqual(student.to_dict(), data)
+        self.assertEqual(student, data)
+
+    def test_nested_model_decoded_lazily(self):
+        """Test nested objects become models on first access only"""
+        student = Student.from_dict(make_student(1))
+
+        self.assertIsInstance(object.__getattribute__(student, "_classes"), dict)
+        self.assertIsInstance(student.classes, StudentClass)
+        self.assertEqual(student["classes"]["name"], "Terminale")
+        self.assertIs(student.classes, student.classes)
+
+    def test_no_instance_dict(self):
+        """Test models carry no per-instance __dict__"""
+        student = Student.from_dict(make_student(1))
+
+        self.assertFalse(hasattr(student, "__dict__"))
+        self.assertLess(sys.getsizeof(student), sys.getsizeof(make_student(1)))
+
+    def test_low_cardinality_strings_interned(self):
+        """Test repeated values such as statuses share one string object"""
+        first = Student.from_dict(json.loads(json.dumps(make_student(1))))
+        second = Student.from_dict(json.loads(json.dumps(make_student(2))))
+
+        self.assertIs(first.status, second.status)
+        self.assertIs(first.organization_id, second.organization_id)
+
+    def test_wrap(self):
+        """Test wrap converts lists, single records and whole responses"""
+        page = wrap({"data": [make_student(1), make_student(2)], "meta": {"total": 2}}, Student, "data")
+        intent = wrap({"paymentIntentId": "pi_1", "status": "requires_payment_method"}, PaymentIntent)
+
+        self.assertTrue(all(isinstance(s, Student) for s in page["data"]))
+        self.assertEqual(page["meta"], {"total": 2})
+        self.assertEqual(intent.paymentIntentId, "pi_1")
+
+
+class TestClientModels(unittest.TestCase):
+    @patch("requests.Session.request")
+    def test_models_opt_in(self, mock_request):
+        """Test clients return models only when created with models=True"""
+        mock_request.side_effect = lambda *a, **kw: make_response({"data": [make_student(1)], "meta": {}})
+
+        plain = EDUZENClient(api_key="test-api-key").get_students("org-123")
+        typed = EDUZENClient(api_key="test-api-key", models=True).get_students("org-123")
+
+        self.assertIsInstance(plain["data"][0], dict)
+        self.assertIsInstance(typed["data"][0], Student)
+        self.assertEqual(typed["data"][0], plain["data"][0])
+
+    @patch("requests.Session.request")
+    def test_iter_students_yields_models(self, mock_request):
+        """Test iter_students streams Student models"""
+        mock_request.return_value = make_response({"data": [make_student(1)], "meta": {}})
+        client = EDUZENClient(api_key="test-api-key", models=True)
+
+        students = list(client.iter_students("org-123", page_size=50))
+
+        self.assertEqual([s.id for s in students], ["student-1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
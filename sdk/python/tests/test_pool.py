@@ -0,0 +1,205 @@
+"""
+Tests unitaires pour ClientPool
+"""
+
+import json
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from eduzen import EDUZENClient
+from eduzen.pool import ClientPool
+
+
+def _record(order, lock, delay=0.0):
+    def func(client, item):
+        if delay:
+            time.sleep(delay)
+        with lock:
+            order.append((client.api_key, item))
+        return item
+
+    return func
+
+
+class TestClientPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = ClientPool(base_url="https://app.eduzen.com/api", concurrency=1)
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+        self.pool.close()
+
+    @patch("requests.Session.request")
+    def test_tenants_share_session_with_own_credentials(self, mock_request):
+        """Test each tenant sends its own API key over the shared session"""
+        mock_response = Mock()
+        mock_response.content = json.dumps({"data": []}).encode()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_request.return_value = mock_response
+        first = self.pool.add_tenant("org-1", api_key="key-1")
+        second = self.pool.add_tenant("org-2", api_key="key-2")
+
+        self.pool.submit("org-1", EDUZENClient.get_students, organization_id="org-1").result()
+        self.pool.submit("org-2", lambda client: client.get_students(organization_id="org-2")).result()
+
+        self.assertIs(first.session, second.session)
+        keys = [call[1]["headers"]["X-API-Key"] for call in mock_request.call_args_list]
+        self.assertEqual(keys, ["key-1", "key-2"])
+
+    def test_large_tenant_does_not_starve_small_ones(self):
+        """Test tenants with pending work are served round-robin"""
+        for name in ("big", "small-1", "small-2"):
+            self.pool.add_tenant(name, api_key=name)
+        order = []
+
+        results = list(
+            self.pool.run(
+                _record(order, self.lock),
+                {"big": range(60), "small-1": range(6), "small-2": range(6)},
+            )
+        )
+
+        self.assertEqual(len(results), 72)
+        last_small = max(i for i, (key, _) in enumerate(order) if key != "big")
+        self.assertLess(last_small, 20)
+
+    def test_weights(self):
+        """Test a tenant with weight 3 gets three times the share of a weight-1 tenant"""
+        self.pool.add_tenant("heavy", api_key="heavy", weight=3)
+        self.pool.add_tenant("light", api_key="light")
+        order = []
+
+        list(self.pool.run(_record(order, self.lock), {"heavy": range(40), "light": range(40)}))
+
+        heavy = sum(1 for key, _ in order[:20] if key == "heavy")
+        self.assertIn(heavy, (14, 15, 16))
+
+    def test_throttled_key_is_skipped_not_waited_for(self):
+        """Test workers serve other keys while one key waits for Retry-After"""
+        throttled = self.pool.add_tenant("throttled", api_key="throttled")
+        self.pool.add_tenant("free", api_key="free")
+        throttled.rate_limiter.update(429, {"Retry-After": "0.3"})
+        order = []
+
+        started = time.monotonic()
+        list(self.pool.run(_record(order, self.lock), {"throttled": range(3), "free": range(10)}))
+
+        keys = [key for key, _ in order]
+        self.assertEqual(keys[:10], ["free"] * 10)
+        self.assertEqual(keys[10:], ["throttled"] * 3)
+        self.assertGreaterEqual(time.monotonic() - started, 0.25)
+
+    def test_tenant_concurrency_cap(self):
+        """Test max_concurrency bounds a tenant's calls in flight"""
+        pool = ClientPool(concurrency=4)
+        pool.add_tenant("org-1", api_key="key-1", max_concurrency=1)
+        in_flight = []
+        peak = []
+
+        def func(client, item):
+            with self.lock:
+                in_flight.append(item)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with self.lock:
+                in_flight.remove(item)
+
+        list(pool.run(func, {"org-1": range(8)}))
+        pool.close()
+
+        self.assertEqual(max(peak), 1)
+
+    def test_errors_are_reported_per_item(self):
+        """Test a failing item is reported and does not abort the run"""
+        self.pool.add_tenant("org-1", api_key="key-1")
+
+        def func(client, item):
+            if item == 2:
+                raise ValueError("bad item")
+            return item * 10
+
+        results = sorted(self.pool.run(func, {"org-1": range(4)}), key=lambda r: r.index)
+
+        self.assertEqual([r.result for r in results if r.ok], [0, 10, 30])
+        self.assertIsInstance(results[2].error, ValueError)
+        stats = self.pool.stats()["org-1"]
+        self.assertEqual((stats.completed, stats.errors, stats.queued), (3, 1, 0))
+
+    def test_failing_input_is_reported(self):
+        """Test an input that raises is reported once and does not hang the run or the workers"""
+        self.pool.add_tenant("org-1", api_key="key-1")
+        self.pool.add_tenant("org-2", api_key="key-2")
+
+        def items():
+            yield 0
+            yield 1
+            raise OSError("source lost")
+
+        results = list(self.pool.run(lambda client, item: item, {"org-1": items(), "org-2": range(3)}))
+
+        failed = [r for r in results if not r.ok]
+        self.assertEqual(len(failed), 1)
+        self.assertEqual((failed[0].tenant, failed[0].index), ("org-1", -1))
+        self.assertIsInstance(failed[0].error, OSError)
+        self.assertEqual(
+            sorted((r.tenant, r.result) for r in results if r.ok),
+            [("org-1", 0), ("org-1", 1), ("org-2", 0), ("org-2", 1), ("org-2", 2)],
+        )
+        # The worker survived: later work still runs
+        self.assertEqual(self.pool.submit("org-1", lambda client: "alive").result(timeout=5), "alive")
+
+    def test_slow_input_does_not_block_the_pool(self):
+        """Test other tenants are served while a worker waits on a slow input"""
+        pool = ClientPool(concurrency=2)
+        self.addCleanup(pool.close)
+        pool.add_tenant("slow", api_key="slow")
+        pool.add_tenant("fast", api_key="fast")
+        reading = threading.Event()
+        release = threading.Event()
+
+        def items():
+            reading.set()
+            release.wait(5)
+            yield 1
+
+        results = []
+        consumer = threading.Thread(
+            target=lambda: results.extend(pool.run(lambda client, item: item, {"slow": items()}))
+        )
+        consumer.start()
+        reading.wait(5)
+
+        started = time.monotonic()
+        self.assertEqual(pool.submit("fast", lambda client: "served").result(timeout=1), "served")
+        self.assertLess(time.monotonic() - started, 1)
+        release.set()
+        consumer.join(5)
+        self.assertEqual([r.result for r in results], [1])
+
+    def test_inputs_are_read_lazily(self):
+        """Test stopping the iteration stops reading the inputs"""
+        self.pool.add_tenant("org-1", api_key="key-1")
+        consumed = []
+
+        def items():
+            for i in range(1000):
+                consumed.append(i)
+                yield i
+
+        for result in self.pool.run(lambda client, item: item, {"org-1": items()}):
+            if result.index == 2:
+                break
+
+        self.assertLess(len(consumed), 10)
+
+    def test_unknown_tenant(self):
+        """Test work for an unregistered tenant is refused"""
+        with self.assertRaises(KeyError):
+            self.pool.submit("missing", lambda client: None)
+
+
+if __name__ == "__main__":
+    unittest.main()
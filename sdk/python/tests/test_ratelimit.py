@@ -0,0 +1,140 @@
+"""
+Tests unitaires pour le rate limiting côté client
+"""
+
+import json
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import requests
+
+from eduzen import EDUZENClient, EDUZENAPIError
+from eduzen.ratelimit import RateLimiter
+
+
+def iso_in(seconds):
+    reset = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+    return reset.strftime("%Y-%m-%dT%H:%M:%S.") + f"{reset.microsecond // 1000:03d}Z"
+
+
+def make_response(status_code, payload, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = json.dumps(payload).encode()
+    response.json.return_value = payload
+    response.raise_for_status = Mock()
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+    return response
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_budget_from_headers(self):
+        """Test X-RateLimit-* headers feed the budget"""
+        limiter = RateLimiter()
+        limiter.update(200, {"X-RateLimit-Remaining": "42", "X-RateLimit-Reset": iso_in(60)})
+
+        budget = limiter.budget
+        self.assertEqual(budget.remaining, 42)
+        self.assertGreater(budget.reset_at, datetime.now(timezone.utc))
+        self.assertEqual(budget.retry_after, 0)
+
+    def test_no_pacing_above_reserve(self):
+        """Test requests are not delayed while the budget is comfortable"""
+        limiter = RateLimiter(reserve=10)
+        limiter.update(200, {"X-RateLimit-Remaining": "500", "X-RateLimit-Reset": iso_in(60)})
+
+        self.assertEqual([limiter.acquire() for _ in range(5)], [0, 0, 0, 0, 0])
+        self.assertEqual(limiter.budget.remaining, 495)
+
+    def test_paces_toward_reset(self):
+        """Test the last requests of the window are spread until the reset"""
+        limiter = RateLimiter(reserve=10)
+        limiter.update(200, {"X-RateLimit-Remaining": "4", "X-RateLimit-Reset": iso_in(8)})
+
+        delays = [limiter.acquire() for _ in range(4)]
+
+        self.assertAlmostEqual(delays[0], 0, delta=0.05)
+        self.assertAlmostEqual(delays[1], 2, delta=0.1)
+        self.assertAlmostEqual(delays[2], 4, delta=0.1)
+        self.assertAlmostEqual(delays[3], 6, delta=0.1)
+
+    def test_retry_after_blocks_callers(self):
+        """Test a 429 blocks every caller until Retry-After"""
+        limiter = RateLimiter()
+        limiter.update(429, {"X-RateLimit-Remaining": "0", "Retry-After": "5"})
+
+        self.assertGreater(limiter.acquire(), 4.5)
+        self.assertGreater(limiter.budget.retry_after, 4.5)
+
+    def test_delay_does_not_reserve(self):
+        """Test delay() reports the pending wait without consuming budget"""
+        limiter = RateLimiter()
+        self.assertEqual(limiter.delay(), 0)
+
+        limiter.update(429, {"X-RateLimit-Remaining": "0", "Retry-After": "5"})
+
+        self.assertGreater(limiter.delay(), 4.5)
+        self.assertGreater(limiter.delay(), 4.5)
+        self.assertEqual(limiter.budget.remaining, 0)
+
+    def test_malformed_headers_are_ignored(self):
+        """Test unparsable headers leave the budget untouched"""
+        limiter = RateLimiter()
+        limiter.update(200, {"X-RateLimit-Remaining": "n/a", "X-RateLimit-Reset": "soon"})
+
+        self.assertIsNone(limiter.budget.remaining)
+
+    def test_thread_safe_reservations(self):
+        """Test concurrent threads each consume exactly one unit of budget"""
+        limiter = RateLimiter(reserve=0)
+        limiter.update(200, {"X-RateLimit-Remaining": "1000", "X-RateLimit-Reset": iso_in(60)})
+
+        threads = [threading.Thread(target=lambda: [limiter.acquire() for _ in range(50)]) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(limiter.budget.remaining, 600)
+
+
+class TestClientRateLimit(unittest.TestCase):
+    def setUp(self):
+        self.client = EDUZENClient(api_key="test-api-key")
+
+    @patch("requests.Session.request")
+    def test_retries_after_429(self, mock_request):
+        """Test a 429 is retried once Retry-After has elapsed"""
+        mock_request.side_effect = [
+            make_response(429, {"error": "Rate limit exceeded"}, {"Retry-After": "0.05"}),
+            make_response(200, {"sessions": []}, {"X-RateLimit-Remaining": "999", "X-RateLimit-Reset": iso_in(60)}),
+        ]
+
+        started = time.monotonic()
+        result = self.client.get_active_sessions()
+
+        self.assertEqual(result, {"sessions": []})
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+        self.assertEqual(self.client.rate_limit.remaining, 999)
+
+    @patch("requests.Session.request")
+    def test_raises_when_retries_exhausted(self, mock_request):
+        """Test a persistent 429 still raises HTTP_429"""
+        mock_request.return_value = make_response(429, {"message": "Rate limit exceeded"}, {"Retry-After": "0"})
+        client = EDUZENClient(api_key="test-api-key", rate_limit_retries=1)
+
+        with self.assertRaises(EDUZENAPIError) as context:
+            client.get_active_sessions()
+
+        self.assertEqual(context.exception.code, "HTTP_429")
+        self.assertEqual(mock_request.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Tests unitaires pour la politique de retry
+"""
+
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from eduzen import EDUZENClient, EDUZENAPIError, EDUZENNetworkError
+from eduzen.retry import RetryPolicy
+
+
+def make_response(status_code, payload):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = {}
+    response.content = json.dumps(payload).encode()
+    response.json.return_value = payload
+    response.raise_for_status = Mock()
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+    return response
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_backoff_is_exponential_and_bounded(self):
+        """Test backoff doubles per attempt and never exceeds max_backoff"""
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+        self.assertEqual([policy.backoff(n) for n in range(1, 6)], [1, 2, 4, 5, 5])
+
+    def test_jitter_stays_below_backoff(self):
+        """Test full jitter draws delays between 0 and the backoff"""
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+
+        for _ in range(100):
+            self.assertLessEqual(policy.backoff(3), 4)
+
+    def test_deadline_stops_retries(self):
+        """Test no retry is scheduled past the deadline"""
+        policy = RetryPolicy(max_attempts=10, backoff_factor=1, jitter=False, deadline=1.5)
+        deadline = policy.start()
+
+        self.assertEqual(policy.next_delay(1, deadline), 1)
+        self.assertIsNone(policy.next_delay(2, deadline))
+
+    def test_budget_caps_retries(self):
+        """Test the retry budget bounds retries across calls"""
+        policy = RetryPolicy(max_attempts=10, backoff_factor=0, budget_ratio=0, budget_min=3)
+        deadline = policy.start()
+
+        delays = [policy.next_delay(1, deadline) for _ in range(5)]
+
+        self.assertEqual(delays, [0, 0, 0, None, None])
+
+
+class TestClientRetry(unittest.TestCase):
+    def setUp(self):
+        self.client = EDUZENClient(
+            api_key="test-api-key",
+            retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0),
+        )
+
+    @patch("requests.Session.request")
+    def test_get_retried_on_503(self, mock_request):
+        """Test transient statuses are retried for GET"""
+        mock_request.side_effect = [
+            make_response(503, {"message": "Unavailable"}),
+            make_response(200, {"sessions": []}),
+        ]
+
+        self.assertEqual(self.client.get_active_sessions(), {"sessions": []})
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch("requests.Session.request")
+    def test_connection_error_retried_then_raised(self, mock_request):
+        """Test connection errors are retried up to max_attempts"""
+        mock_request.side_effect = requests.exceptions.ConnectionError("Connection reset")
+
+        with self.assertRaises(EDUZENNetworkError):
+            self.client.get_active_sessions()
+
+        self.assertEqual(mock_request.call_count, 3)
+
+    @patch("requests.Session.request")
+    def test_post_without_idempotency_key_not_retried(self, mock_request):
+        """Test plain POST calls are never replayed"""
+        mock_request.return_value = make_response(503, {"message": "Unavailable"})
+
+        with self.assertRaises(EDUZENAPIError):
+            self.client.create_user(email="a@example.com", full_name="A", organization_id="org-123")
+
+        self.assertEqual(mock_request.call_count, 1)
+
+    @patch("requests.Session.request")
+    def test_payment_retried_with_same_idempotency_key(self, mock_request):
+        """Test payment calls reuse one Idempotency-Key across retries"""
+        mock_request.side_effect = [
+            requests.exceptions.ConnectionError("Connection reset"),
+            make_response(502, {"message": "Bad gateway"}),
+            make_response(200, {"paymentIntentId": "pi_123"}),
+        ]
+
+        result = self.client.create_stripe_intent(amount=10000, customer_email="parent@example.com")
+
+        self.assertEqual(result["paymentIntentId"], "pi_123")
+        keys = {c.kwargs["headers"]["Idempotency-Key"] for c in mock_request.call_args_list}
+        self.assertEqual(len(keys), 1)
+        self.assertTrue(keys.pop())
+
+    @patch("requests.Session.request")
+    def test_explicit_idempotency_key(self, mock_request):
+        """Test a caller-provided Idempotency-Key is sent as is"""
+        mock_request.return_value = make_response(200, {"id": "dd_123"})
+
+        self.client.create_sepa_direct_debit(
+            amount=150.0,
+            debtor_iban="FR7630006000011234567890189",
+            mandate_id="MANDATE-1",
+            creditor_id="FR12ZZZ123456",
+            idempotency_key="invoice-42",
+        )
+
+        self.assertEqual(mock_request.call_args.kwargs["headers"]["Idempotency-Key"], "invoice-42")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+"""
+Tests unitaires pour les campagnes de prélèvements SEPA
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from eduzen import EDUZENClient
+from eduzen.codec import get_codec
+from eduzen.sepa import (
+    DUPLICATE,
+    FAILED,
+    INVALID_AMOUNT,
+    INVALID_BIC,
+    INVALID_DUE_DATE,
+    INVALID_IBAN,
+    INVALID_MANDATE,
+    REJECTED,
+    SKIPPED,
+    SUBMITTED,
+    CollectionRun,
+    validate_bic,
+    validate_creditor_id,
+    validate_iban,
+)
+from eduzen.retry import RetryPolicy
+
+TODAY = date(2026, 10, 1)
+CREDITOR = "FR72ZZZ123456"
+
+
+def _debit(mandate_id, due_date="2026-10-05", **overrides):
+    debit = {
+        "amount": 120.5,
+        "debtor_iban": "FR14 2004 1010 0505 0001 3M02 606",
+        "debtor_bic": "bnpafrpp",
+        "mandate_id": mandate_id,
+        "creditor_id": CREDITOR,
+        "due_date": due_date,
+        "reference": f"TUITION-{mandate_id}",
+    }
+    debit.update(overrides)
+    return debit
+
+
+def _response(status_code, payload):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = {}
+    response.content = json.dumps(payload).encode()
+    response.json.return_value = payload
+    response.raise_for_status = Mock()
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+    return response
+
+
+class TestSEPAValidation(unittest.TestCase):
+    def test_iban(self):
+        """Test IBAN format, SEPA country length and mod-97 checksum"""
+        self.assertTrue(validate_iban("FR1420041010050500013M02606"))
+        self.assertTrue(validate_iban("de89 3704 0044 0532 0130 00"))
+        self.assertFalse(validate_iban("FR1420041010050500013M02607"))
+        self.assertFalse(validate_iban("FR142004101005050001"))
+        self.assertFalse(validate_iban("US64SVBKUS6S3300958879"))
+
+    def test_bic_and_creditor_id(self):
+        """Test BIC format and creditor identifier check digits"""
+        self.assertTrue(validate_bic("BNPAFRPP"))
+        self.assertTrue(validate_bic("BNPAFRPPXXX"))
+        self.assertFalse(validate_bic("BNPA1RPP"))
+        self.assertTrue(validate_creditor_id("DE98ZZZ09999999999"))
+        self.assertTrue(validate_creditor_id(CREDITOR))
+        self.assertFalse(validate_creditor_id("FR47ZZZ123456"))
+
+    def test_validate_reports_every_problem(self):
+        """Test a debit is checked on every field at once"""
+        run = CollectionRun(Mock(), run_id="run-1", today=TODAY)
+
+        self.assertEqual(run.validate(_debit("MANDATE-1")), ())
+        self.assertEqual(
+            run.validate(_debit("", amount=-3, debtor_bic="BNP", due_date="2026-10-01")),
+            (INVALID_AMOUNT, INVALID_BIC, INVALID_MANDATE, INVALID_DUE_DATE),
+        )
+        self.assertEqual(run.validate(_debit("MANDATE-1", amount="10.001")), (INVALID_AMOUNT,))
+        self.assertEqual(run.validate(_debit("MANDATE-1", due_date="2026-02-30")), (INVALID_DUE_DATE,))
+
+
+class TestCollectionRun(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.ledger = os.path.join(self.directory, "ledger.jsonl")
+        self.client = EDUZENClient(api_key="test-api-key", retry_policy=RetryPolicy(max_attempts=1))
+
+    def tearDown(self):
+        self.client.close()
+        shutil.rmtree(self.directory)
+
+    def _run(self):
+        return CollectionRun(self.client, run_id="tuition-2026-10", concurrency=1, ledger=self.ledger, today=TODAY)
+
+    @patch("requests.Session.request")
+    def test_only_valid_debits_are_sent(self, mock_request):
+        """Test invalid and duplicate debits are rejected locally and the rest sent by due date"""
+        mock_request.return_value = _response(200, {"paymentId": "pay-1", "status": "pending"})
+        debits = [
+            _debit("MANDATE-1", due_date="2026-10-20"),
+            _debit("MANDATE-2", debtor_iban="FR1420041010050500013M02607"),
+            _debit("MANDATE-3", due_date="2026-10-05"),
+            _debit("MANDATE-1", due_date="2026-10-20"),
+            _debit("MANDATE-4", due_date="2026-10-10"),
+        ]
+
+        run = self._run()
+        entries = sorted(run.run(debits), key=lambda e: e.index)
+
+        self.assertEqual([e.status for e in entries], [SUBMITTED, REJECTED, SUBMITTED, REJECTED, SUBMITTED])
+        self.assertEqual(entries[1].errors, (INVALID_IBAN,))
+        self.assertEqual(entries[3].errors, (DUPLICATE,))
+        self.assertEqual(entries[0].payment_id, "pay-1")
+        self.assertEqual(run.stats[SUBMITTED], 3)
+
+        sent = [json.loads(call[1]["data"]) for call in mock_request.call_args_list]
+        self.assertEqual([body["due_date"] for body in sent], ["2026-10-05", "2026-10-10", "2026-10-20"])
+        self.assertEqual(sent[0]["debtor_iban"], "FR1420041010050500013M02606")
+        self.assertEqual(sent[0]["debtor_bic"], "BNPAFRPP")
+        with open(self.ledger, encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 5)
+
+    @patch("requests.Session.request")
+    def test_resume_sends_only_unfinished_debits(self, mock_request):
+        """Test a second run with the same ledger retries failures with the same Idempotency-Key"""
+        mock_request.side_effect = [
+            _response(200, {"paymentId": "pay-1"}),
+            _response(400, {"message": "Mandat révoqué", "code": "MANDATE_REVOKED"}),
+        ]
+        debits = [_debit("MANDATE-1"), _debit("MANDATE-2", due_date="2026-10-06")]
+
+        first = {e.index: e for e in self._run().run(debits)}
+        self.assertEqual(first[1].status, FAILED)
+        self.assertIn("MANDATE_REVOKED", first[1].errors[0])
+
+        mock_request.side_effect = [_response(200, {"paymentId": "pay-2"})]
+        second = {e.index: e for e in self._run().run(debits)}
+
+        self.assertEqual((second[0].status, second[1].status), (SKIPPED, SUBMITTED))
+        keys = [call[1]["headers"]["Idempotency-Key"] for call in mock_request.call_args_list]
+        self.assertEqual(len(keys), 3)
+        self.assertEqual(keys[1], keys[2])
+        self.assertEqual(second[1].idempotency_key, keys[2])
+
+    @patch("requests.Session.request")
+    def test_decimal_amount_is_sent_as_number(self, mock_request):
+        """Test a Decimal amount is sent as a JSON number with every codec"""
+        mock_request.return_value = _response(200, {"paymentId": "pay-1"})
+        codecs = ["json"] + (["orjson"] if orjson is not None else [])
+
+        for name in codecs:
+            with self.subTest(codec=name):
+                mock_request.reset_mock()
+                self.client.codec = get_codec(name)
+                run = CollectionRun(self.client, run_id=f"decimal-{name}", concurrency=1, today=TODAY)
+
+                entries = list(run.run([_debit("MANDATE-1", amount=Decimal("120.50"))]))
+
+                self.assertEqual([e.status for e in entries], [SUBMITTED], entries[0].errors)
+                self.assertEqual(json.loads(mock_request.call_args[1]["data"])["amount"], 120.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+"""
+Tests unitaires pour la déduplication des requêtes en vol
+"""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from eduzen import EDUZENClient, EDUZENNetworkError, EDUZENTimeoutError
+from eduzen.retry import RetryPolicy
+from eduzen.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def slow_response(*args, **kwargs):
+    time.sleep(0.05)
+    response = Mock()
+    response.status_code = 200
+    response.headers = {}
+    response.content = json.dumps({"qr_code": "QR-1", "path": args[1]}).encode()
+    response.raise_for_status = Mock()
+    return response
+
+
+def run_threads(count, target):
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(i):
+        barrier.wait()
+        try:
+            results[i] = target()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_exception_is_shared(self):
+        """Test waiters receive the leader's exception"""
+        flight = SingleFlight()
+
+        def fail():
+            time.sleep(0.05)
+            raise EDUZENNetworkError("Connection reset")
+
+        results = run_threads(5, lambda: flight.do("key", fail))
+
+        self.assertTrue(all(isinstance(r, EDUZENNetworkError) for r in results))
+        self.assertEqual(flight.coalesced, 4)
+        # Each waiter owns its exception; the leader's is the cause of every copy
+        self.assertEqual(len({id(r) for r in results}), 5)
+        leader = next(r for r in results if r.__cause__ is None)
+        self.assertTrue(all(r.__cause__ is leader for r in results if r is not leader))
+        self.assertTrue(all(str(r) == "Connection reset" for r in results))
+
+    def test_waiter_gives_up_at_its_deadline(self):
+        """Test a waiter stops at its own deadline while the shared call completes"""
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def slow():
+            started.set()
+            time.sleep(0.2)
+            return "done"
+
+        leader = threading.Thread(target=lambda: flight.do("key", slow))
+        leader.start()
+        started.wait()
+
+        begun = time.monotonic()
+        with self.assertRaises(EDUZENTimeoutError):
+            flight.do("key", slow, deadline=time.monotonic() + 0.05)
+        self.assertLess(time.monotonic() - begun, 0.15)
+        leader.join()
+
+    def test_async_waiters_own_their_exception_and_deadline(self):
+        """Test AsyncSingleFlight copies the shared exception and bounds waits by the deadline"""
+
+        async def scenario():
+            flight = AsyncSingleFlight()
+
+            async def fail():
+                await asyncio.sleep(0.05)
+                raise EDUZENNetworkError("Connection reset")
+
+            async def slow():
+                await asyncio.sleep(0.2)
+                return "done"
+
+            errors = await asyncio.gather(*(flight.do("fail", fail) for _ in range(3)), return_exceptions=True)
+            shared = asyncio.ensure_future(flight.do("slow", slow))
+            await asyncio.sleep(0)
+            with self.assertRaises(EDUZENTimeoutError):
+                await flight.do("slow", slow, deadline=time.monotonic() + 0.05)
+            return errors, await shared
+
+        errors, result = asyncio.run(scenario())
+
+        self.assertEqual(len({id(e) for e in errors}), 3)
+        self.assertTrue(all(isinstance(e, EDUZENNetworkError) for e in errors))
+        self.assertEqual(result, "done")
+
+
+class TestClientCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.client = EDUZENClient(api_key="test-api-key", pool_maxsize=50)
+
+    @patch("requests.Session.request", side_effect=slow_response)
+    def test_identical_gets_are_coalesced(self, mock_request):
+        """Test concurrent identical GETs share a single request"""
+        results = run_threads(20, lambda: self.client.get_active_qr_code("session-1"))
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(self.client.coalesced_requests, 19)
+
+    @patch("requests.Session.request", side_effect=slow_response)
+    def test_followers_events_are_marked_coalesced(self, mock_request):
+        """Test only the calls that shared another call's request report coalesced"""
+        events = []
+        self.client.add_hook("after_response", events.append)
+
+        run_threads(10, lambda: self.client.get_active_qr_code("session-1"))
+
+        self.assertEqual(sorted(e.coalesced for e in events), [False] + [True] * 9)
+
+    @patch("requests.Session.request", side_effect=slow_response)
+    def test_different_keys_are_not_coalesced(self, mock_request):
+        """Test GETs for different sessions are sent separately"""
+        run_threads(2, lambda: self.client.get_active_qr_code(threading.current_thread().name))
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(self.client.coalesced_requests, 0)
+
+    @patch("requests.Session.request")
+    def test_followers_keep_their_own_request_id(self, mock_request):
+        """Test a follower's error does not overwrite the request id on the leader's error"""
+
+        def failing(*args, **kwargs):
+            time.sleep(0.05)
+            response = slow_response(*args, **kwargs)
+            response.status_code = 500
+            response.headers = {"X-Request-Id": "req-leader"}
+            response.content = json.dumps({"message": "Boom", "code": "INTERNAL"}).encode()
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+            return response
+
+        mock_request.side_effect = failing
+        client = EDUZENClient(api_key="test-api-key", retry_policy=RetryPolicy(max_attempts=1), pool_maxsize=10)
+
+        errors = run_threads(5, lambda: client.get_active_qr_code("session-1"))
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(sorted(str(e.request_id) for e in errors), ["None"] * 4 + ["req-leader"])
+
+    @patch("requests.Session.request", side_effect=slow_response)
+    def test_mutations_are_never_coalesced(self, mock_request):
+        """Test POST calls always reach the API"""
+        run_threads(3, lambda: self.client.deactivate_qr_code("qr-1"))
+
+        self.assertEqual(mock_request.call_count, 3)
+
+    @patch("requests.Session.request", side_effect=slow_response)
+    def test_coalescing_can_be_disabled(self, mock_request):
+        """Test coalesce_requests=False sends every GET"""
+        client = EDUZENClient(api_key="test-api-key", coalesce_requests=False)
+
+        run_threads(3, lambda: client.get_active_qr_code("session-1"))
+
+        self.assertEqual(mock_request.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+"""
+Tests unitaires pour la file locale des scans QR
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from eduzen import EDUZENClient, EDUZENAPIError, EDUZENNetworkError
+from eduzen.spool import ScanSpool
+
+
+class FakeScanAPI:
+    """Records scans; raises the next queued error first if any"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.received = []
+        self.errors = []
+        self.offline = False
+
+    def __call__(self, qr_code, student_id, latitude=None, longitude=None):
+        with self.lock:
+            if self.offline:
+                raise EDUZENNetworkError(message="Connection refused")
+            if self.errors:
+                raise self.errors.pop(0)
+            self.received.append((qr_code, student_id))
+        return {"success": True}
+
+
+class TestScanSpool(unittest.TestCase):
+    def setUp(self):
+        self.client = EDUZENClient(api_key="test-api-key")
+        self.api = FakeScanAPI()
+        patcher = patch.object(self.client, "scan_qr_code", side_effect=self.api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "scans.sqlite")
+
+    def make_spool(self, **kwargs):
+        kwargs.setdefault("flush_interval", 0.01)
+        kwargs.setdefault("backoff_factor", 0)
+        return ScanSpool(self.client, self.path, **kwargs)
+
+    def test_scans_delivered_and_deduplicated(self):
+        """Test spooled scans are delivered once per (qr_code, student_id)"""
+        spool = self.make_spool()
+
+        self.assertTrue(spool.record("QR-1", "student-1"))
+        self.assertFalse(spool.record("QR-1", "student-1"))
+        self.assertTrue(spool.record("QR-1", "student-2", latitude=48.85, longitude=2.35))
+        self.assertEqual(spool.stats.duplicates, 1)
+
+        self.assertTrue(spool.close(timeout=5))
+        self.assertEqual(sorted(self.api.received), [("QR-1", "student-1"), ("QR-1", "student-2")])
+
+    def test_record_does_not_wait_for_network(self):
+        """Test record() returns while the API is unreachable"""
+        self.api.offline = True
+        spool = self.make_spool()
+
+        started = time.perf_counter()
+        for i in range(200):
+            spool.record("QR-1", f"student-{i}")
+        elapsed = (time.perf_counter() - started) / 200
+
+        self.assertLess(elapsed, 0.005)
+        self.assertEqual(spool.stats.pending, 200)
+        self.assertFalse(spool.close(timeout=0.05))
+
+    def test_pending_scans_survive_restart(self):
+        """Test scans spooled while offline are sent by the next spool"""
+        self.api.offline = True
+        spool = self.make_spool()
+        spool.record("QR-1", "student-1")
+        spool.close(timeout=0.05)
+
+        self.api.offline = False
+        spool = self.make_spool()
+        self.assertTrue(spool.flush(timeout=5))
+        spool.close()
+
+        self.assertEqual(self.api.received, [("QR-1", "student-1")])
+
+    def test_transient_errors_retried(self):
+        """Test network errors and 5xx are retried"""
+        self.api.errors = [
+            EDUZENNetworkError(message="reset"),
+            EDUZENAPIError(message="Unavailable", code="HTTP_503", status_code=503),
+        ]
+        spool = self.make_spool()
+        spool.record("QR-1", "student-1")
+
+        self.assertTrue(spool.flush(timeout=5))
+        self.assertEqual(spool.stats.retries, 2)
+        self.assertEqual(spool.stats.delivered, 1)
+        spool.close()
+
+    def test_client_errors_rejected(self):
+        """Test 4xx responses are parked as rejected, 409 counts as delivered"""
+        self.api.errors = [
+            EDUZENAPIError(message="QR code expired", code="EXPIRED", status_code=400),
+            EDUZENAPIError(message="Already scanned", code="DUPLICATE", status_code=409),
+        ]
+        spool = self.make_spool(concurrency=1)
+        spool.record("QR-1", "student-1")
+        spool.record("QR-1", "student-2")
+
+        self.assertTrue(spool.flush(timeout=5))
+        stats = spool.stats
+        self.assertEqual((stats.pending, stats.rejected, stats.delivered), (0, 1, 1))
+        self.assertEqual(spool.rejected()[0]["student_id"], "student-1")
+        self.assertIn("QR code expired", spool.rejected()[0]["error"])
+        spool.close()
+
+    def test_flush_skips_backoff_on_every_round(self):
+        """Test a flush retries at once after repeated failures instead of waiting for the backoff"""
+        for start in (True, False):
+            with self.subTest(start=start):
+                self.api.errors = [EDUZENNetworkError(message="reset"), EDUZENNetworkError(message="reset")]
+                spool = self.make_spool(backoff_factor=30, start=start)
+                spool.record("QR-1", f"student-{start}")
+
+                self.assertTrue(spool.flush(timeout=5))
+                self.assertEqual(spool.stats.delivered, 1)
+                spool.close()
+
+    def test_purge_rejected(self):
+        """Test purged rejected scans are returned once and may be spooled again"""
+        self.api.errors = [EDUZENAPIError(message="QR code expired", code="EXPIRED", status_code=400)]
+        spool = self.make_spool()
+        spool.record("QR-1", "student-1")
+        self.assertTrue(spool.flush(timeout=5))
+
+        purged = spool.purge_rejected()
+
+        self.assertEqual([(r["qr_code"], r["student_id"]) for r in purged], [("QR-1", "student-1")])
+        self.assertEqual((spool.rejected(), spool.stats.rejected), ([], 0))
+        self.assertTrue(spool.record("QR-1", "student-1"))
+        self.assertTrue(spool.close(timeout=5))
+        self.assertEqual(self.api.received, [("QR-1", "student-1")])
+
+    def test_max_attempts(self):
+        """Test scans are rejected after max_attempts transient failures"""
+        self.api.offline = True
+        spool = self.make_spool(max_attempts=2)
+        spool.record("QR-1", "student-1")
+
+        self.assertTrue(spool.flush(timeout=5))
+        self.assertEqual(spool.rejected()[0]["attempts"], 2)
+        spool.close()
+
+    def test_stats(self):
+        """Test queue depth and oldest pending age"""
+        self.api.offline = True
+        spool = self.make_spool(start=False)
+        spool.record("QR-1", "student-1")
+        spool.record("QR-1", "student-1")
+
+        stats = spool.stats
+        self.assertEqual((stats.pending, stats.recorded, stats.duplicates), (1, 1, 1))
+        self.assertGreaterEqual(stats.oldest_pending_age, 0)
+        spool.close(timeout=0)
+
+    def test_closed_spool_refuses_scans(self):
+        """Test record() fails after close()"""
+        spool = self.make_spool()
+        spool.close()
+
+        with self.assertRaises(RuntimeError):
+            spool.record("QR-1", "student-1")
+
+
+if __name__ == "__main__":
+    unittest.main()